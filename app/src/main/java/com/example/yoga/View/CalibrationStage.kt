@@ -105,13 +105,21 @@ class CalibrationStage : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerLi
 
         // get yogaMat python module
         yogaMat = python.getModule("heatmap")
+        // 用接下來幾秒的空墊子壓力圖建立每一格的 baseline (墊子上有人的壓力圖會略過)
+        yogaMat.callAttr("start_calibration")
 
         // using yogaMat nextPage
         yogaMatThread = Thread {
             try {
                 Thread.sleep(1000)
-                while (!yogaMat.callAttr("checkReturn").toBoolean() and threadFlag) {
-                    Thread.sleep(100)
+                // 踩下返回角落 (flag 變成 true) 時才醒來，不再每 100 ms 呼叫 checkReturn
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
+                var pressed = false
+                while (!pressed and threadFlag) {
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    pressed = event[1].toString() == "return" && event[2].toBoolean()
                 }
                 if(threadFlag){
                     runOnUiThread {
@@ -223,28 +223,33 @@ class ChooseMenu : AppCompatActivity(), HandLandmarkerHelper.LandmarkerListener
         yogaMatFunctionThread = Thread {
             try {
                 Thread.sleep(1000)
+                // flag / function 改變時才醒來，不再定時呼叫 checkReturn / checkFunction
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
                 while (threadFlag) {
-                    functionNumber = yogaMat.callAttr("checkFunction").toInt()
-                    runOnUiThread {
-                        if (functionNumber == 1) {
-                            right()
-                        } else if (functionNumber == 2) {
-                            //because no up
-                            return@runOnUiThread
-                        } else if (functionNumber == 3) {
-                            left()
-                        } else if (functionNumber == 4) {
-                            //because no down
-                            return@runOnUiThread
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    if (event[1].toString() == "function") {
+                        functionNumber = event[2].toInt()
+                        runOnUiThread {
+                            if (functionNumber == 1) {
+                                right()
+                            } else if (functionNumber == 2) {
+                                //because no up
+                                return@runOnUiThread
+                            } else if (functionNumber == 3) {
+                                left()
+                            } else if (functionNumber == 4) {
+                                //because no down
+                                return@runOnUiThread
+                            }
                         }
-                    }
-                    if (yogaMat.callAttr("checkReturn").toBoolean()) {
+                    } else if (event[1].toString() == "return" && event[2].toBoolean()) {
                         runOnUiThread{
                             nextpage()
                         }
                         break
                     }
-                    Thread.sleep(750)
                 }
             } catch (e: InterruptedException) {
                 e.printStackTrace()
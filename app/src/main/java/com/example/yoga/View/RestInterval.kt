@@ -56,6 +56,7 @@ class RestInterval : AppCompatActivity(), KSecCountdownTimer.TimerCallback {
     }
 
     override fun onTimerFinished() {
+        threadFlag = false // to stop thread
         Log.d("Rest menuTitle", "$menuTitle")
         Log.d("Rest 目前 index", "$currentIndex")
         Log.d("Rest 目前總時間", "$totalTime")
@@ -126,12 +127,19 @@ class RestInterval : AppCompatActivity(), KSecCountdownTimer.TimerCallback {
         yogaMatFunctionThread = Thread {
             try {
                 Thread.sleep(1000)
-                if (yogaMat.callAttr("checkReturn").toBoolean()) {
-                    runOnUiThread {
-                        onTimerFinished()
+                // 踩下返回角落時才醒來，不再呼叫 checkReturn
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
+                while (threadFlag) {
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    if (event[1].toString() == "return" && event[2].toBoolean()) {
+                        runOnUiThread {
+                            onTimerFinished()
+                        }
+                        break
                     }
                 }
-                Thread.sleep(750)
             } catch (e: InterruptedException) {
                 e.printStackTrace()
             }
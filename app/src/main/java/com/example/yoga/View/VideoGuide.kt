@@ -114,6 +114,10 @@ class VideoGuide : AppCompatActivity() {
         }
         python = Python.getInstance()
 
+        // 播放教學影片時，在背景先準備這個動作(及下一個動作)的 YogaSession
+        val upcomingPoses = if (mode == "TrainingProcess") poseList.drop(currentIndex).take(2) else listOf(poseName)
+        python.getModule("SessionPreloader").callAttr("preload_sessions", upcomingPoses.toTypedArray())
+
         // get yogaMat python module
         yogaMat = python.getModule("heatmap")
 
@@ -121,8 +125,14 @@ class VideoGuide : AppCompatActivity() {
         yogaMatThread = Thread {
             try {
                 Thread.sleep(1000)
-                while (!yogaMat.callAttr("checkReturn").toBoolean() and threadFlag) {
-                    Thread.sleep(100)
+                // 踩下返回角落 (flag 變成 true) 時才醒來，不再每 100 ms 呼叫 checkReturn
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
+                var pressed = false
+                while (!pressed and threadFlag) {
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    pressed = event[1].toString() == "return" && event[2].toBoolean()
                 }
                 if(threadFlag){
                     runOnUiThread {
@@ -73,11 +73,8 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
     private var camera: Camera? = null
     //python 物件
     private lateinit var python : Python
-    private lateinit var pose     : PyObject
-    private lateinit var heatmappy : PyObject
-    private lateinit var yogamatProcessor : PyObject
+    private lateinit var yogaSession : PyObject
     private lateinit var feetData : PyObject
-    private lateinit var scoreCalculator : PyObject
 
     //判別文字是否更動用
     private var lastText="提示文字在這"
@@ -264,12 +261,12 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
         //開始計算完成時間
         timerCurrent.handlerStart()
 
-        //啟動yogapose
-        pose = python.getModule("yogaPoseDetect" ).callAttr("YogaPose",poseName)
-
-        heatmappy = python.getModule("heatmap")
-
-        yogamatProcessor = python.getModule("YogaMatProcessor").callAttr("YogaMatProcessor")
+        //啟動yogapose、瑜珈墊座標轉換及分數計算器 (VideoGuide 已在背景建立好)
+        val sessionPreloader = python.getModule("SessionPreloader")
+        yogaSession = sessionPreloader.callAttr("take_session", poseName)
+        if (mode == "TrainingProcess" && currentIndex < poseList.size - 1) {
+            sessionPreloader.callAttr("preload_sessions", arrayOf(poseList[currentIndex + 1]))
+        }
 
         yogamainBinding.title.text = poseName
 
@@ -278,9 +275,6 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
             lastpage()
         }
 
-        // 啟動分數計算器
-        scoreCalculator = python.getModule("ScoreCalculator" ).callAttr("ScoreCalculator",poseName)
-
         //guide_picture init
         val picturePath = findViewById<ImageView>(R.id.guide_picture)
         var am: AssetManager? = null
@@ -319,8 +313,14 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
         yogaMatThread = Thread {
             try {
                 Thread.sleep(3000)
-                while (!yogaMat.callAttr("checkReturn").toBoolean() and threadFlag) {
-                    Thread.sleep(100)
+                // 踩下返回角落 (flag 變成 true) 時才醒來，不再每 100 ms 呼叫 checkReturn
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
+                var pressed = false
+                while (!pressed and threadFlag) {
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    pressed = event[1].toString() == "return" && event[2].toBoolean()
                 }
                 if(threadFlag){
                     runOnUiThread {
@@ -452,32 +452,33 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
                 /*調換順序,先進行pose detect 得到各角度再丟到視圖上*/
                 // pass result to Yogapose
                 if (resultBundle.results.first().worldLandmarks().isNotEmpty()) {
-                    val floatListList: List<MutableList<Any>> =
+                    // 關節點攤平成 FloatArray [x, y, z, visibility] * 33，python 端直接整塊讀取
+                    val landmarkArray: FloatArray =
                         resultBundle.results.first().landmarks().flatMap { landmarks ->
-                            landmarks.map { landmark ->
-                                mutableListOf(landmark.x(), landmark.y(), landmark.z(), landmark.visibility().orElse((-1.0).toFloat()).toFloat())
+                            landmarks.flatMap { landmark ->
+                                listOf(landmark.x(), landmark.y(), landmark.z(), landmark.visibility().orElse((-1.0).toFloat()).toFloat())
                             }
-                        }
+                        }.toFloatArray()
 
-                    val point2d: List<MutableList<Float>> =
-                        resultBundle.results.first().landmarks().flatMap { nlandmarks ->
-                            nlandmarks.map { landmark ->
-                                mutableListOf(landmark.x(), landmark.y())
+                    val worldLandmarkArray: FloatArray =
+                        resultBundle.results.first().worldLandmarks().flatMap { landmarks ->
+                            landmarks.flatMap { landmark ->
+                                listOf(landmark.x(), landmark.y(), landmark.z(), landmark.visibility().orElse((-1.0).toFloat()).toFloat())
                             }
-                        }
+                        }.toFloatArray()
 
-                    var center = heatmappy.callAttr("get_center")
-                    // 取得腳在瑜珈墊上面的座標
-                    var feet_data_str = yogamatProcessor.callAttr("generate_feet_data", point2d, floatListList)
+                    // 腳的座標、分數及提示一次取得: [tips, imagePath, pointsOut, score, [left_x, left_y, right_x, right_y]]
+                    val detectlist = yogaSession.callAttr("process_frame", landmarkArray, worldLandmarkArray).asList()
 
                     // 如果沒有該腳的資料，會回傳 -999999
-                    var left_x = yogamatProcessor.callAttr("get_left_foot_x").toFloat()
-                    var left_y = yogamatProcessor.callAttr("get_left_foot_y").toFloat()
-                    var right_x = yogamatProcessor.callAttr("get_right_foot_x").toFloat()
-                    var right_y = yogamatProcessor.callAttr("get_right_foot_y").toFloat()
+                    val feet = detectlist[4].asList().map{it.toFloat()}
+                    var left_x = feet[0]
+                    var left_y = feet[1]
+                    var right_x = feet[2]
+                    var right_y = feet[3]
 
                     // 分數計算器
-                     var currentScore = scoreCalculator.callAttr("calculate_score", floatListList, true)
+                     var currentScore = detectlist[3].toInt()
                      println("score ${currentScore}")
                      yogamainBinding.score.text = "分數 ${currentScore}"
 //                    yogamainBinding.score.text = ""
@@ -485,16 +486,7 @@ class YogaMain : AppCompatActivity() , PoseLandmarkerHelper.LandmarkerListener,K
                     yogamainBinding.yogaMat.setLeftFeetPosition(left_x, left_y);
                     yogamainBinding.yogaMat.setRightFeetPosition(right_x,right_y);
 
-                    val floatListList3D: List<MutableList<Any>> =
-                        resultBundle.results.first().worldLandmarks().flatMap { landmarks ->
-                            landmarks.map { landmark ->
-                                mutableListOf(landmark.x(), landmark.y(), landmark.z(), landmark.visibility().orElse((-1.0).toFloat()).toFloat())
-                            }
-                        }
-
                     // Change pose tips
-                    val detectlist = pose.callAttr("detect", floatListList , floatListList3D , heatmappy.callAttr("get_rects") , center, feet_data_str).asList()
-
                     ArrowList = detectlist[2].asList().map{it.toFloat()}
                     println("ArrowList: $ArrowList")
 
@@ -62,8 +62,14 @@ class YogaResult : AppCompatActivity() {
         // using yogaMat nextPage
         yogaMatThread = Thread {
             try {
-                while (!yogaMat.callAttr("checkReturn").toBoolean() and threadFlag) {
-                    Thread.sleep(100)
+                // 踩下返回角落 (flag 變成 true) 時才醒來，不再每 100 ms 呼叫 checkReturn
+                var eventId = yogaMat.callAttr("get_event_id").toInt()
+                var pressed = false
+                while (!pressed and threadFlag) {
+                    // 每 0.5 秒醒來檢查畫面是否已關閉
+                    val event = yogaMat.callAttr("wait_event", eventId, 0.5)?.asList() ?: continue
+                    eventId = event[0].toInt()
+                    pressed = event[1].toString() == "return" && event[2].toBoolean()
                 }
                 if(threadFlag){
                     runOnUiThread {
@@ -3,17 +3,34 @@ package com.example.yoga.bluetooth;
 import android.bluetooth.BluetoothAdapter;
 import android.bluetooth.BluetoothDevice;
 import android.bluetooth.BluetoothSocket;
+import android.graphics.Bitmap;
+import android.graphics.BitmapFactory;
 
 import com.chaquo.python.PyObject;
 import com.chaquo.python.Python;
 
+import java.io.BufferedInputStream;
+import java.io.DataInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
 import java.io.PrintWriter;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.IntBuffer;
+import java.util.Arrays;
+import java.util.List;
 import java.util.UUID;
 public class BluetoothClient {
     final String UUIDString = "00001101-0000-1000-8000-00805F9B34FB";
+    // 二進位壓力圖的格式 (與 python/HeatmapFrame.py 相同): 24 bytes header + payload
+    static final byte[] FRAME_MAGIC = {'Y', 'M', 'A', 'T'};
+    static final int FRAME_HEADER_SIZE = 24;
+    static final int FRAME_ROWS_OFFSET = 6;
+    static final int FRAME_COLS_OFFSET = 7;
+    static final int FRAME_LENGTH_OFFSET = 20;
+    // payload 最大的格式是 float32 (4 bytes)
+    static final int FRAME_MAX_ITEM_SIZE = 4;
     private BluetoothAdapter mBluetoothAdapter;
     private BluetoothSocket mSocket;
     private InputStream in;
@@ -34,10 +51,10 @@ public class BluetoothClient {
     }
 
     public void StringToArray(String str) {
-        // 調用 python function "get_heatmap"
+        // 調用 python function "update_heatmap"，只做分析，影像在 getImage 時才畫
         Python python = Python.getInstance();
         PyObject pyObject = python.getModule("heatmap");
-        bytes = pyObject.callAttr("get_heatmap", str).toJava(byte[].class);
+        pyObject.callAttr("update_heatmap", str);
 
         // 取得 yogamat 的data
         //int[][] test = pyObject.callAttr("get_rects").toJava(int[][].class);
@@ -49,11 +66,75 @@ public class BluetoothClient {
         send_msg("done");
     }
 
-    // 儲存 heatmap PNG 供Kotlin使用
+    // 二進位格式: 整個 frame (header + payload) 直接交給 python，不需轉成字串
+    public void FrameToArray(byte[] frame) {
+        Python python = Python.getInstance();
+        PyObject pyObject = python.getModule("heatmap");
+        pyObject.callAttr("update_heatmap", frame);
+
+        send_msg("done");
+    }
+
+    // 最新一張壓力圖的影像，同一張只會畫一次
+    public byte[] getImage() {
+        Python python = Python.getInstance();
+        bytes = python.getModule("heatmap").callAttr("get_image").toJava(byte[].class);
+        return bytes;
+    }
+
+    // 依 heatmap.set_output 的格式轉成 Bitmap: "rgba" 直接複製像素，不需要 PNG 解碼
+    // "none" 或影像大小與 get_output_size 不符 (剛切換格式) 時回傳 null
+    public Bitmap toBitmap() {
+        PyObject heatmap = Python.getInstance().getModule("heatmap");
+        String mode = heatmap.callAttr("get_output_mode").toString();
+        getImage();
+        if (bytes == null || bytes.length == 0) {
+            return null;
+        }
+        if (mode.equals("png")) {
+            return BitmapFactory.decodeByteArray(bytes, 0, bytes.length);
+        }
+        List<PyObject> size = heatmap.callAttr("get_output_size").asList();
+        int width = size.get(0).toInt();
+        int height = size.get(1).toInt();
+        if (bytes.length != width * height * 4) {
+            return null;
+        }
+        Bitmap bmp = Bitmap.createBitmap(width, height, Bitmap.Config.ARGB_8888);
+        if (mode.equals("rgba")) {
+            bmp.copyPixelsFromBuffer(ByteBuffer.wrap(bytes));
+        } else if (mode.equals("argb")) {
+            // A, R, G, B bytes 以 big endian 讀成 int 就是 setPixels 的 0xAARRGGBB
+            int[] pixels = new int[width * height];
+            IntBuffer buffer = ByteBuffer.wrap(bytes).order(ByteOrder.BIG_ENDIAN).asIntBuffer();
+            buffer.get(pixels);
+            bmp.setPixels(pixels, 0, width, 0, 0, width, height);
+        } else {
+            return null;
+        }
+        return bmp;
+    }
+
+    // 儲存 heatmap PNG 供Kotlin使用，原始像素的格式先轉成 Bitmap 再壓縮成 PNG
     public void savePNG() {
+        PyObject heatmap = Python.getInstance().getModule("heatmap");
+        String mode = heatmap.callAttr("get_output_mode").toString();
+        Bitmap bmp = null;
+        if (mode.equals("png")) {
+            getImage();
+        } else {
+            bmp = toBitmap();
+            if (bmp == null) {
+                return;
+            }
+        }
         try {
             FileOutputStream fos = new FileOutputStream(filePath);
-            fos.write(bytes);
+            if (bmp != null) {
+                bmp.compress(Bitmap.CompressFormat.PNG, 100, fos);
+            } else {
+                fos.write(bytes);
+            }
             fos.close();
             //System.out.println("save file done!" + filePath); //20240221
         } catch (NullPointerException e) {
@@ -101,13 +182,55 @@ public class BluetoothClient {
                 }
 
                 try {
+                    DataInputStream input = new DataInputStream(new BufferedInputStream(in));
+                    byte[] magic = new byte[FRAME_MAGIC.length];
+                    // 收到過二進位 frame 後，開頭不是 FRAME_MAGIC 代表資料錯位，不再當成 json
+                    boolean binary = false;
                     while (mSocket.isConnected()) {
+                        // 開頭是 FRAME_MAGIC 時依 header 的長度讀取完整的二進位 frame
+                        input.mark(FRAME_HEADER_SIZE);
+                        input.readFully(magic);
+                        if (Arrays.equals(magic, FRAME_MAGIC)) {
+                            byte[] header = Arrays.copyOf(magic, FRAME_HEADER_SIZE);
+                            input.readFully(header, magic.length, FRAME_HEADER_SIZE - magic.length);
+                            ByteBuffer buffer = ByteBuffer.wrap(header).order(ByteOrder.LITTLE_ENDIAN);
+                            int cells = (header[FRAME_ROWS_OFFSET] & 0xFF) * (header[FRAME_COLS_OFFSET] & 0xFF);
+                            int length = buffer.getInt(FRAME_LENGTH_OFFSET);
+                            if (length <= 0 || length > cells * FRAME_MAX_ITEM_SIZE) {
+                                // header 損壞，往後移一個 byte 重新尋找 FRAME_MAGIC
+                                System.out.println("bluetooth frame length " + length + " is invalid, resync");
+                                input.reset();
+                                input.skipBytes(1);
+                                continue;
+                            }
+                            byte[] frame = Arrays.copyOf(header, FRAME_HEADER_SIZE + length);
+                            input.readFully(frame, FRAME_HEADER_SIZE, length);
+                            binary = true;
+                            try {
+                                FrameToArray(frame);
+                            } catch (RuntimeException e) {
+                                // python 的例外 (PyException) 只丟掉這一張，繼續接收下一張
+                                e.printStackTrace();
+                            }
+                            continue;
+                        }
+                        if (binary) {
+                            input.reset();
+                            input.skipBytes(1);
+                            continue;
+                        }
+                        // 舊的 json 字串格式，以 "!" 結尾
+                        input.reset();
                         byte[] bt = new byte[1024];
-                        in.read(bt);
+                        input.read(bt);
                         String content = new String (bt, "UTF-8" );
                         if (content!=null && !content.equals("")) {
                             String[] x = content.split("!");
-                            StringToArray(x[0]);
+                            try {
+                                StringToArray(x[0]);
+                            } catch (RuntimeException e) {
+                                e.printStackTrace();
+                            }
                         }
                     }
                 } catch (IOException e) {
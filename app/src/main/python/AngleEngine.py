@@ -0,0 +1,72 @@
+import numpy as np
+
+import toolkit
+import yogaFileGetter
+
+# 與 toolkit.computeAngle 相同：輸入為 [x, y, z, visibility] 四維座標時只用 x, y 計算角度
+ANGLE_DIMS = 2
+# 向量長度小於此值視為無法計算角度
+ZERO_LENGTH_EPS = 1e-9
+
+
+# 一次計算某個動作所有關節角度
+class AngleEngine:
+    def __init__(self, angle_def, dims=ANGLE_DIMS):
+        # 關節名稱，順序與 angle_def 相同
+        self.keys = list(angle_def.keys())
+        # (n, 3) 的關節點索引: [端點1, 中心點, 端點2]
+        self.index = np.array([angle_def[key] for key in self.keys], dtype=np.intp).reshape(-1, 3)
+        self.dims = dims
+
+    def compute(self, landmarks, dims=None, min_visibility=toolkit.MIN_DETECT_VISIBILITY):
+        """compute all joint angles of the pose in one batch
+
+        Args:
+            landmarks (numpy array): (33, 3) or (33, 4) landmarks, the 4th column is visibility
+            dims (int): number of coordinates used to compute angles (default self.dims)
+            min_visibility (float): joints whose three points are all below it become -1
+
+        Returns:
+            angles (numpy array): (n,) degrees, -1 for invisible or zero-length joints
+        """
+        dims = self.dims if dims is None else dims
+        landmarks = np.asarray(landmarks, dtype=np.float64)
+        points = landmarks[self.index]
+
+        coords = points[:, :, :dims]
+        vector1 = coords[:, 0] - coords[:, 1]
+        vector2 = coords[:, 2] - coords[:, 1]
+
+        dot = np.einsum('ij,ij->i', vector1, vector2)
+        norm = np.sqrt(np.einsum('ij,ij->i', vector1, vector1) * np.einsum('ij,ij->i', vector2, vector2))
+
+        # 長度為 0 的向量不做除法，cos 超出 [-1, 1] 的誤差直接截斷
+        valid = norm > ZERO_LENGTH_EPS
+        cos_b = np.clip(dot / np.where(valid, norm, 1.0), -1.0, 1.0)
+        angles = np.degrees(np.arccos(cos_b))
+
+        if landmarks.shape[1] > 3:
+            valid &= ~np.all(points[:, :, 3] < min_visibility, axis=1)
+
+        return np.where(valid, angles, -1.0)
+
+    def to_dict(self, angles):
+        return dict(zip(self.keys, angles.tolist()))
+
+    def compute_dict(self, landmarks, dims=None):
+        return self.to_dict(self.compute(landmarks, dims))
+
+
+# 每個動作的 AngleEngine 只建立一次
+_engines = {}
+
+
+def get_angle_engine(pose):
+    engine = _engines.get(pose)
+    if engine is None:
+        angle_def = yogaFileGetter.get_angle_def(pose)
+        if angle_def is None:
+            return None
+        engine = AngleEngine(angle_def)
+        _engines[pose] = engine
+    return engine
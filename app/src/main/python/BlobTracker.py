@@ -0,0 +1,131 @@
+from collections import namedtuple
+
+import numpy as np
+
+LEFT = "LEFT"
+RIGHT = "RIGHT"
+# 12x18 格子中行 (column) 較小的一側是使用者的左腳
+LEFT_LOW_COLUMN = True
+# 前後兩張的重心相距超過幾格就不算同一塊
+MAX_DISTANCE = 3.0
+# 連續幾張沒有對應的區塊才刪除 (抬腳或雜訊)
+MAX_MISSES = 3
+# 重心的指數平均係數，1 表示直接使用這一張的重心
+SMOOTHING = 0.6
+# 小於幾格的區塊不當作腳
+MIN_AREA = 2
+
+# 對外提供的追蹤結果，建立後不再修改
+#   id: 追蹤編號, side: LEFT / RIGHT, center: [列, 行], rect: [x, y, w, h], area: 格子數, age: 追蹤了幾張
+FootTrack = namedtuple("FootTrack", ["id", "side", "center", "rect", "area", "age"])
+
+
+class Track:
+    def __init__(self, track_id, center, rect, area):
+        self.id = track_id
+        self.side = None
+        self.center = np.array(center, dtype=np.float64)
+        self.rect = rect
+        self.area = area
+        self.age = 1
+        self.misses = 0
+
+    def to_foot(self):
+        return FootTrack(self.id, self.side, tuple(self.center.tolist()), tuple(self.rect), int(self.area), self.age)
+
+
+# 壓力圖的區塊在前後兩張之間對應 (重心最近者優先)，兩隻腳的左右一旦決定就跟著追蹤編號走
+class BlobTracker:
+    def __init__(self, cell_size=1.0, grid_shape=(12, 18), max_distance=MAX_DISTANCE, max_misses=MAX_MISSES,
+                 smoothing=SMOOTHING, min_area=MIN_AREA):
+        """
+        Args:
+            cell_size (float): size of a grid cell in the coordinates of centers / rects (heatmap.enlarge)
+            grid_shape (tuple): (rows, cols) of the pressure grid
+        """
+        self.cell_size = cell_size
+        self.columns = grid_shape[1]
+        self.max_distance = max_distance * cell_size
+        self.max_misses = max_misses
+        self.smoothing = smoothing
+        self.min_area = min_area
+        self.tracks = []
+        self.next_id = 1
+
+    def update(self, centers, rects, areas):
+        """associate the blobs of a new frame with the tracks
+
+        Args:
+            centers (numpy array): (n, 2) [row, column] pressure centroid of every blob
+            rects (numpy array): (n, 4) [x, y, w, h] of every blob
+            areas (numpy array): (n,) cells of every blob
+
+        Returns:
+            feet (tuple): (left, right) FootTrack, None for a foot not on the mat
+        """
+        keep = np.flatnonzero(np.asarray(areas) >= self.min_area)
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)[keep]
+        matched = np.zeros(len(keep), dtype=bool)
+        used = np.zeros(len(self.tracks), dtype=bool)
+
+        if self.tracks and len(keep):
+            previous = np.array([track.center for track in self.tracks])
+            distance = np.linalg.norm(previous[:, None, :] - centers[None, :, :], axis=2)
+            # 全部配對依距離排序，由近到遠貪婪配對
+            for flat in np.argsort(distance, axis=None, kind="stable"):
+                t, b = divmod(int(flat), len(keep))
+                if distance[t, b] > self.max_distance:
+                    break
+                if used[t] or matched[b]:
+                    continue
+                used[t] = matched[b] = True
+                track = self.tracks[t]
+                track.center += self.smoothing * (centers[b] - track.center)
+                track.rect = [int(value) for value in rects[keep[b]]]
+                track.area = areas[keep[b]]
+                track.age += 1
+                track.misses = 0
+        for t in np.flatnonzero(~used):
+            self.tracks[t].misses += 1
+        self.tracks = [track for track in self.tracks if track.misses <= self.max_misses]
+
+        for b in np.flatnonzero(~matched):
+            self.tracks.append(Track(self.next_id, centers[b], [int(value) for value in rects[keep[b]]],
+                                     areas[keep[b]]))
+            self.next_id += 1
+
+        self.assign_sides()
+        return self.get_feet()
+
+    def assign_sides(self):
+        """the two biggest tracks are the feet, a foot keeps its side once assigned"""
+        # 已經是腳的追蹤優先 (抬腳的幾張也是)，較大的手或膝蓋區塊出現時不會搶走左右
+        feet = sorted(self.tracks, key=lambda track: (track.side is None, track.misses, -track.area))[:2]
+        for track in self.tracks:
+            if track not in feet:
+                track.side = None
+        sides = [track.side for track in feet]
+        if len(feet) == 2 and sides[0] == sides[1] and sides[0] is not None:
+            feet[0].side = feet[1].side = None
+            sides = [None, None]
+        if all(side is not None for side in sides):
+            return
+
+        known = [track for track in feet if track.side is not None]
+        unknown = [track for track in feet if track.side is None]
+        if known:
+            unknown[0].side = RIGHT if known[0].side == LEFT else LEFT
+        elif len(unknown) == 2:
+            low, high = sorted(unknown, key=lambda track: track.center[1])
+            low.side, high.side = (LEFT, RIGHT) if LEFT_LOW_COLUMN else (RIGHT, LEFT)
+        else:
+            low_half = unknown[0].center[1] < self.columns * self.cell_size / 2
+            unknown[0].side = LEFT if low_half == LEFT_LOW_COLUMN else RIGHT
+
+    def get_feet(self):
+        left = next((track.to_foot() for track in self.tracks if track.side == LEFT), None)
+        right = next((track.to_foot() for track in self.tracks if track.side == RIGHT), None)
+        return left, right
+
+    def reset(self):
+        self.tracks = []
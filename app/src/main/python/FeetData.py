@@ -1,11 +1,38 @@
 import numpy as np
 
+import AngleNodeDef
+
+# contacts 陣列的欄位: 瑜珈墊座標 x, y、是否在瑜珈墊上 (1 / 0)、visibility
+CONTACT_X = 0
+CONTACT_Y = 1
+CONTACT_ON_MAT = 2
+CONTACT_VISIBILITY = 3
+CONTACT_COLUMNS = 4
+
+
+def is_on_mat(points):
+    """(n, 2) mat coordinates -> (n,) bool, the mat is [0, 1] x [0, 1]"""
+    points = np.asarray(points)
+    return np.all((points >= 0) & (points <= 1), axis=-1)
+
 
 # !!!!!!! 請注意以下的 TODO
 class FeetData:
-    def __init__(self, left_foot=None, right_foot=None):
+    def __init__(self, left_foot=None, right_foot=None, contacts=None, contact_landmarks=(), pressure_feet=None):
+        """
+        Args:
+            left_foot, right_foot: mat coordinates of the heels (swapped, see set_point)
+            contacts (numpy array): (n, 4) [x, y, on_mat, visibility] of contact_landmarks on the mat
+            contact_landmarks (tuple): mediapipe landmark indices of the contacts (not swapped)
+            pressure_feet (dict): {"LEFT": foot, "RIGHT": foot} tracked on the pressure mat, see heatmap.get_feet
+        """
         self.left_foot = left_foot
         self.right_foot = right_foot
+        # 壓力墊追蹤到的左右腳，左右由追蹤編號決定，不受 MediaPipe 左右相反影響
+        self.pressure_feet = pressure_feet or {"LEFT": None, "RIGHT": None}
+        self.contact_landmarks = tuple(contact_landmarks)
+        self.contacts = np.zeros((0, CONTACT_COLUMNS), dtype=np.float32) if contacts is None else \
+            np.asarray(contacts, dtype=np.float32).reshape(-1, CONTACT_COLUMNS)
 
     # 設定資料
     def set_point(self, left_foot, right_foot):
@@ -13,6 +40,44 @@ class FeetData:
         self.left_foot = right_foot
         self.right_foot = left_foot
 
+    # 設定所有接觸點 (手、膝蓋、腳) 的資料
+    def set_contacts(self, contacts, contact_landmarks):
+        self.contacts = contacts
+        self.contact_landmarks = tuple(contact_landmarks)
+
+    # 設定壓力墊追蹤到的左右腳
+    def set_pressure_feet(self, pressure_feet):
+        self.pressure_feet = pressure_feet
+
+    def get_pressure_foot(self, side):
+        """
+        Args:
+            side (str): "LEFT" or "RIGHT"
+
+        Returns:
+            foot (dict): {"id", "center", "rect", "area", "age"}, None when the foot is not on the mat
+        """
+        return self.pressure_feet.get(side)
+
+    def get_contact(self, landmark):
+        """
+        Args:
+            landmark (int or str): landmark index or name in AngleNodeDef, e.g. "LEFT_WRIST"
+
+        Returns:
+            contact (numpy array): [x, y, on_mat, visibility], None when it is not a contact landmark
+        """
+        if isinstance(landmark, str):
+            landmark = getattr(AngleNodeDef, landmark)
+        if landmark not in self.contact_landmarks:
+            return None
+        return self.contacts[self.contact_landmarks.index(landmark)]
+
+    def get_contacts_on_mat(self, min_visibility=0.0):
+        """landmark indices of the visible contacts on the mat"""
+        on_mat = (self.contacts[:, CONTACT_ON_MAT] > 0) & (self.contacts[:, CONTACT_VISIBILITY] >= min_visibility)
+        return [landmark for landmark, flag in zip(self.contact_landmarks, on_mat) if flag]
+
     # 取得在瑜珈墊腳的個數
     def get_feet_count_on_mat(self):
         count = sum(1 for foot in [self.left_foot, self.right_foot] if all(0 <= value <= 1 for value in foot))
@@ -37,14 +102,17 @@ class FeetData:
 
     def to_dict(self):
         # 將 FeetData 物件轉換為字典
-        dict = {"left_foot": self.left_foot, "right_foot": self.right_foot}
+        dict = {"left_foot": self.left_foot, "right_foot": self.right_foot,
+                "contacts": self.contacts, "contact_landmarks": self.contact_landmarks,
+                "pressure_feet": self.pressure_feet}
         return dict
 
     @classmethod
     def from_dict(cls, data_dict):
         left_foot = data_dict.get("left_foot", None)
         right_foot = data_dict.get("right_foot", None)
-        return cls(left_foot, right_foot)
+        return cls(left_foot, right_foot, data_dict.get("contacts", None), data_dict.get("contact_landmarks", ()),
+                   data_dict.get("pressure_feet", None))
 
     def __str__(self):
         return f"left_foot = {self.left_foot}, right_foot = {self.right_foot}"
@@ -0,0 +1,87 @@
+"""Binary wire format of the yoga mat pressure frame
+
+Header (little endian, 24 bytes), followed by rows * cols values of dtype:
+    magic      4s   b"YMAT"
+    version    B    FRAME_VERSION
+    dtype      B    1: uint8, 2: uint16, 3: float32
+    rows       B    12
+    cols       B    18
+    sequence   I    frame counter of the Raspberry Pi
+    timestamp  Q    microseconds since epoch
+    length     I    payload bytes
+"""
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"YMAT"
+FRAME_VERSION = 1
+HEADER = struct.Struct("<4sBBBBIQI")
+HEADER_SIZE = HEADER.size
+
+DTYPES = {
+    1: np.dtype("u1"),
+    2: np.dtype("<u2"),
+    3: np.dtype("<f4"),
+}
+DTYPE_CODES = {dtype: code for code, dtype in DTYPES.items()}
+
+
+def decode_frame(data):
+    """decode a pressure frame, binary or the old json string
+
+    Args:
+        data: binary frame (bytes, bytearray, memoryview or a Java byte[] from Chaquopy),
+            or json text of a 2d list
+
+    Returns:
+        grid (numpy array): (rows, cols) pressure values, a read-only view of data for binary frames
+        header (dict): {"version", "rows", "cols", "dtype", "sequence", "timestamp"}, None for json
+
+    Raises:
+        ValueError: the binary frame is truncated or uses an unknown version / dtype
+    """
+    if isinstance(data, str):
+        return np.array(json.loads(data)), None
+    buffer = memoryview(data).cast("B")
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        # 沒有 header 的舊格式 (json 文字的 bytes)
+        return np.array(json.loads(bytes(buffer).decode("utf-8"))), None
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError(f"heatmap frame header is truncated ({len(buffer)} bytes)")
+
+    _, version, dtype_code, rows, cols, sequence, timestamp, length = HEADER.unpack_from(buffer)
+    if version != FRAME_VERSION:
+        raise ValueError(f"heatmap frame version {version} is not supported")
+    dtype = DTYPES.get(dtype_code)
+    if dtype is None:
+        raise ValueError(f"heatmap frame dtype {dtype_code} is not supported")
+    if length != rows * cols * dtype.itemsize or len(buffer) < HEADER_SIZE + length:
+        raise ValueError(f"heatmap frame payload is truncated ({len(buffer) - HEADER_SIZE} / {length} bytes)")
+
+    grid = np.frombuffer(buffer, dtype=dtype, count=rows * cols, offset=HEADER_SIZE).reshape(rows, cols)
+    header = {"version": version, "rows": rows, "cols": cols, "dtype": dtype.name,
+              "sequence": sequence, "timestamp": timestamp}
+    return grid, header
+
+
+def encode_frame(grid, sequence=0, timestamp=0):
+    """encode a pressure grid, used by the Raspberry Pi sender and for replaying recordings
+
+    Args:
+        grid (numpy array): (rows, cols) uint8, uint16 or float32 values
+        sequence (int): frame counter
+        timestamp (int): microseconds since epoch
+
+    Returns:
+        frame (bytes): header and payload
+    """
+    grid = np.asarray(grid)
+    dtype = grid.dtype.newbyteorder("<") if grid.dtype.itemsize > 1 else grid.dtype
+    code = DTYPE_CODES.get(np.dtype(dtype))
+    if code is None:
+        raise ValueError(f"dtype {grid.dtype} is not supported, use uint8, uint16 or float32")
+    payload = np.ascontiguousarray(grid, dtype=DTYPES[code]).tobytes()
+    rows, cols = grid.shape
+    return HEADER.pack(MAGIC, FRAME_VERSION, code, rows, cols, sequence, timestamp, len(payload)) + payload
@@ -0,0 +1,56 @@
+import numpy as np
+
+# MediaPipe Pose 的關節點數量
+LANDMARK_COUNT = 33
+# 每個關節點的欄位: x, y, z, visibility
+LANDMARK_COLUMNS = 4
+
+
+def to_landmark_array(data, columns=LANDMARK_COLUMNS):
+    """convert skeleton data from any supported source to a (n, columns) float32 array
+
+    Supported sources:
+        - flat float buffer: Java float[], bytes, bytearray, memoryview
+        - numpy array, flat or (n, k)
+        - MediaPipe landmark objects (.x, .y, .z, .visibility) or a landmark list (.landmark)
+        - nested list, including Java List<List<Float>> (slow path, one JNI call per value)
+
+    Args:
+        data: skeleton data
+        columns (int): number of columns of a flat buffer
+
+    Returns:
+        landmarks (numpy array): (n, columns) float32 array, no copy when data is already float32
+    """
+    if isinstance(data, np.ndarray):
+        array = data.astype(np.float32, copy=False)
+        return array.reshape(-1, columns) if array.ndim == 1 else array
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.float32).reshape(-1, columns)
+
+    # MediaPipe python 的 NormalizedLandmarkList
+    if hasattr(data, 'landmark'):
+        data = data.landmark
+
+    # Java float[] 支援 buffer protocol，整塊複製，不需要逐一呼叫 JNI
+    try:
+        return np.asarray(memoryview(data), dtype=np.float32).reshape(-1, columns)
+    except (TypeError, ValueError):
+        pass
+
+    rows = list(data)
+    if len(rows) == 0:
+        return np.zeros((0, columns), dtype=np.float32)
+
+    # MediaPipe 的 landmark 物件
+    if hasattr(rows[0], 'x'):
+        return np.array([[row.x, row.y, row.z, getattr(row, 'visibility', 1.0)] for row in rows],
+                        dtype=np.float32)
+
+    # 舊的 List<MutableList<Any>> 格式
+    if hasattr(rows[0], 'size'):
+        return np.array([[row.get(j) for j in range(row.size())] for row in rows], dtype=np.float32)
+
+    array = np.array(rows, dtype=np.float32)
+    return array.reshape(-1, columns) if array.ndim == 1 else array
@@ -0,0 +1,71 @@
+import importlib
+import sys
+import time
+
+# 開啟畫面時會載入的模組，用在 startup_report
+STARTUP_MODULES = ("heatmap", "YogaSession")
+
+# 延遲載入的模組實際載入時花費的時間 (ms)
+_deferred_times = {}
+
+
+# 第一次使用屬性時才 import 真正的模組，例如 cv2 = lazy_import("cv2")
+class LazyModule:
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+
+    def __getattr__(self, attr):
+        module = load(self._name)
+        # 之後直接從 __dict__ 取得屬性，不會再經過 __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        loaded = "loaded" if self._name in sys.modules else "not loaded"
+        return f"<lazy module '{self._name}' ({loaded})>"
+
+
+def lazy_import(name):
+    """module proxy importing the module at the first attribute access"""
+    return LazyModule(name)
+
+
+def load(name):
+    """import a module and record the time spent if it was not loaded yet"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    _deferred_times[name] = (time.perf_counter() - start) * 1000.0
+    return module
+
+
+def measure_imports(names):
+    """import modules one by one and measure the time of each
+
+    Modules already imported report 0 since they cost nothing now.
+
+    Returns:
+        costs (dict): {module name: ms}
+    """
+    costs = {}
+    for name in names:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        costs[name] = (time.perf_counter() - start) * 1000.0
+    return costs
+
+
+def startup_report(names=STARTUP_MODULES):
+    """import cost of the screen modules, and which heavy modules were loaded
+
+    Returns:
+        report (dict): {"imports": {module: ms}, "deferred": {module: ms},
+            "loaded": {"cv2": bool, "com.chaquo.python": bool}}
+    """
+    return {
+        "imports": measure_imports(names),
+        "deferred": dict(_deferred_times),
+        "loaded": {name: name in sys.modules for name in ("cv2", "com.chaquo.python")},
+    }
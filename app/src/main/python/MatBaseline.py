@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+
+import YogaLogger as log
+
+TAG = "MatBaseline"
+
+# 校正需要的空墊子張數 (約數秒)
+CALIBRATION_FRAMES = 30
+# 與已收集的空墊子中位數相差超過 NOISE_SIGMA 倍雜訊再加上此值的壓力圖代表墊子上有東西，不用來校正
+EMPTY_DEVIATION = 8
+# 超過此秒數仍收集不到足夠的空墊子，用已收集的張數結束校正
+CALIBRATION_TIMEOUT = 15.0
+# 雜訊 (標準差) 的指數平均係數，及扣掉幾倍的標準差當作雜訊底線
+NOISE_ALPHA = 0.05
+NOISE_SIGMA = 4.0
+# 高於 baseline 此值的格子視為踩下，不更新雜訊底線與 baseline
+LOAD_THRESHOLD = 30
+FULL_SCALE = 255.0
+
+
+# 空墊子的 baseline 校正: 每一格的偏移量 (baseline)、放大倍率 (gain) 及雜訊的變異數 (variance)
+class MatBaseline:
+    def __init__(self, calibration_frames=CALIBRATION_FRAMES, noise_alpha=NOISE_ALPHA, noise_sigma=NOISE_SIGMA,
+                 load_threshold=LOAD_THRESHOLD, empty_deviation=EMPTY_DEVIATION, timeout=CALIBRATION_TIMEOUT):
+        self.calibration_frames = calibration_frames
+        self.empty_deviation = empty_deviation
+        self.timeout = timeout
+        self.noise_alpha = noise_alpha
+        self.noise_sigma = noise_sigma
+        self.load_threshold = load_threshold
+        self.baseline = None
+        self.gain = None
+        self.variance = None
+        # 校正中收集的空墊子壓力圖，None 表示沒有在校正
+        self.samples = None
+        self.skipped = 0
+        self.deadline = None
+
+    def start_calibration(self):
+        """collect the next empty-mat frames to build the baseline, frames with someone on the mat are skipped"""
+        self.samples = []
+        self.skipped = 0
+        self.deadline = time.monotonic() + self.timeout
+
+    def is_calibrating(self):
+        """still collecting, a calibration past its timeout is finished here with the frames collected so far"""
+        if self.samples is not None and time.monotonic() > self.deadline:
+            log.warning(TAG, "calibration timed out with %d / %d frames", len(self.samples), self.calibration_frames)
+            self.finish_calibration()
+        return self.samples is not None
+
+    def is_calibrated(self):
+        return self.baseline is not None
+
+    def clear(self):
+        self.baseline = self.gain = self.variance = self.samples = None
+
+    def finish_calibration(self):
+        """build baseline, gain and variance tables from the collected frames
+
+        gain stretches the range left above the baseline back to 0 ~ FULL_SCALE.
+        """
+        samples = np.array(self.samples, dtype=np.float32)
+        self.samples = None
+        if len(samples) == 0:
+            log.warning(TAG, "no empty-mat frame was collected, calibration is skipped")
+            return
+        self.baseline = samples.mean(axis=0)
+        self.variance = samples.var(axis=0)
+        self.gain = FULL_SCALE / np.maximum(FULL_SCALE - self.baseline, 1.0)
+        log.info(TAG, "calibrated with %d frames (%d skipped), baseline max %.1f, noise max %.1f",
+                 len(samples), self.skipped, self.baseline.max(), np.sqrt(self.variance.max()))
+
+    def collect(self, grid):
+        """keep a calibration frame if it agrees with the median of the frames collected so far
+
+        The allowed deviation is empty_deviation counts over noise_sigma times the noise of the frame
+        (median absolute deviation of all cells). Pressure only adds to an empty mat: a frame above
+        the median is skipped, a frame below it means the collected ones had something on the mat,
+        so collecting starts over from it.
+        """
+        if self.samples:
+            deviation = grid - np.median(self.samples, axis=0)
+            noise = 1.4826 * np.median(np.abs(deviation))
+            limit = self.empty_deviation + self.noise_sigma * noise
+            if deviation.max() > limit:
+                self.skipped += 1
+                return
+            if deviation.min() < -limit:
+                self.skipped += len(self.samples)
+                self.samples = []
+        self.samples.append(np.array(grid, dtype=np.float32))
+
+    def process(self, grid):
+        """feed a raw pressure frame, collecting it while calibrating
+
+        Args:
+            grid (numpy array): (12, 18) raw pressure values
+
+        Returns:
+            grid (numpy array): (12, 18) float32 pressure above the noise floor, the input when not calibrated
+        """
+        if self.is_calibrating():
+            self.collect(grid)
+            if len(self.samples) >= self.calibration_frames:
+                self.finish_calibration()
+        if self.baseline is None:
+            return grid
+
+        residual = grid - self.baseline
+        # 沒有被踩的格子: 雜訊底線與 baseline 跟著感測器漂移慢慢更新
+        idle = residual < self.load_threshold
+        alpha = np.where(idle, self.noise_alpha, 0.0).astype(np.float32)
+        self.variance += alpha * (residual * residual - self.variance)
+        self.baseline += alpha * residual
+        corrected = (residual - self.noise_sigma * np.sqrt(self.variance)) * self.gain
+        return np.clip(corrected, 0.0, FULL_SCALE, out=corrected)
+
+    def get_calibration(self):
+        """
+        Returns:
+            calibration (dict): {"calibrating", "collected", "skipped", "baseline", "gain", "noise"},
+                tables as lists, noise is the standard deviation of every cell
+        """
+        tables = {name: (None if table is None else table.tolist())
+                  for name, table in (("baseline", self.baseline), ("gain", self.gain),
+                                     ("noise", None if self.variance is None else np.sqrt(self.variance)))}
+        return dict(calibrating=self.is_calibrating(), collected=len(self.samples or ()), skipped=self.skipped,
+                    **tables)
@@ -0,0 +1,126 @@
+import time
+
+import numpy as np
+
+# 返回角落，其他功能區的名稱是 heatmap.checkFunction 的 1 ~ 4
+ZONE_RETURN = "return"
+# (名稱, (開始列, 結束列), (開始行, 結束行))，12x18 格子座標，不含結束值
+# 區塊左上角的格子在範圍內才算踩到，與原本用 900x600 畫面座標判斷區塊左上角的結果相同
+MAT_ZONES = (
+    (ZONE_RETURN, (10, 12), (16, 18)),
+    (1, (0, 3), (4, 8)),
+    (2, (0, 3), (8, 12)),
+    (3, (0, 3), (12, 16)),
+    (4, (10, 12), (8, 12)),
+)
+GRID_SHAPE = (12, 18)
+# 連續踩住多久才發出 press，放開多久才發出 release (秒)，單一張雜訊不會觸發
+PRESS_TIME = 0.3
+RELEASE_TIME = 0.2
+# 踩住多久發出 hold (秒)
+HOLD_TIME = 1.0
+
+GESTURE_PRESS = "press"
+GESTURE_HOLD = "hold"
+GESTURE_RELEASE = "release"
+
+# 每個區域的狀態
+IDLE = 0
+PENDING = 1
+PRESSED = 2
+HELD = 3
+RELEASING = 4
+
+
+def zone_masks(zones=MAT_ZONES, shape=GRID_SHAPE):
+    """cell masks of the zones, one row per zone
+
+    Returns:
+        masks (numpy array): (zones, rows * cols) float64, 1 for the cells inside the zone
+    """
+    masks = np.zeros((len(zones),) + tuple(shape))
+    for i, (_, (top, bottom), (left, right)) in enumerate(zones):
+        masks[i, top:bottom, left:right] = 1.0
+    return masks.reshape(len(zones), -1)
+
+
+# 瑜珈墊功能區的手勢: 每一張壓力圖的區塊更新一次，踩住超過 press_time 才算 press，
+# 放開超過 release_time 才算 release
+class GestureRecognizer:
+    def __init__(self, zones=MAT_ZONES, press_time=PRESS_TIME, hold_time=HOLD_TIME, release_time=RELEASE_TIME,
+                 grid_shape=GRID_SHAPE):
+        self.zones = [zone[0] for zone in zones]
+        self.masks = zone_masks(zones, grid_shape).astype(bool)
+        self.columns = grid_shape[1]
+        self.press_time = press_time
+        self.hold_time = hold_time
+        self.release_time = release_time
+        self.state = np.full(len(zones), IDLE)
+        # 開始踩住 / 開始放開的時間
+        self.active_since = np.zeros(len(zones))
+        self.inactive_since = np.zeros(len(zones))
+        # RELEASING 前是否已經 hold
+        self.held = np.zeros(len(zones), dtype=bool)
+
+    def zone_hits(self, corners):
+        """which zones contain the top-left cell of a blob, one mask lookup for all blobs and zones
+
+        Args:
+            corners (numpy array): (n, 2) [row, column] top-left cell of every blob
+
+        Returns:
+            active (numpy array): (zones,) bool
+        """
+        corners = np.asarray(corners, dtype=np.intp).reshape(-1, 2)
+        return self.masks[:, corners[:, 0] * self.columns + corners[:, 1]].any(axis=1)
+
+    def update(self, corners, now=None):
+        """feed the blobs of one pressure frame
+
+        Args:
+            corners (numpy array): (n, 2) [row, column] top-left cell of every blob (heatmap.find_blobs)
+            now (float): frame time in seconds, default time.monotonic()
+
+        Returns:
+            gestures (list): [(zone, GESTURE_PRESS / GESTURE_HOLD / GESTURE_RELEASE)] happened in this frame
+        """
+        now = time.monotonic() if now is None else now
+        active = self.zone_hits(corners)
+        gestures = []
+        for i, zone in enumerate(self.zones):
+            state = self.state[i]
+            if active[i]:
+                if state == IDLE:
+                    state = PENDING
+                    self.active_since[i] = now
+                elif state == RELEASING:
+                    state = HELD if self.held[i] else PRESSED
+                if state == PENDING and now - self.active_since[i] >= self.press_time:
+                    state = PRESSED
+                    gestures.append((zone, GESTURE_PRESS))
+                if state == PRESSED and now - self.active_since[i] >= self.hold_time:
+                    state = HELD
+                    gestures.append((zone, GESTURE_HOLD))
+            else:
+                if state == PENDING:
+                    state = IDLE
+                elif state in (PRESSED, HELD):
+                    self.held[i] = state == HELD
+                    state = RELEASING
+                    self.inactive_since[i] = now
+                if state == RELEASING and now - self.inactive_since[i] >= self.release_time:
+                    state = IDLE
+                    gestures.append((zone, GESTURE_RELEASE))
+            self.state[i] = state
+        return gestures
+
+    def is_pressed(self, zone):
+        """the zone was pressed and not released yet"""
+        return bool(self.state[self.zones.index(zone)] >= PRESSED)
+
+    def pressed_zones(self):
+        return [zone for zone, state in zip(self.zones, self.state) if state >= PRESSED]
+
+    def reset(self):
+        self.state[:] = IDLE
+        self.held[:] = False
@@ -0,0 +1,68 @@
+import numpy as np
+
+# 關節點位移小於此值視為靜止 (normalized / world landmarks 都使用同一個值)
+MOTION_EPSILON = 0.005
+# visibility 變化小於此值視為沒有改變
+VISIBILITY_EPSILON = 0.05
+
+
+# 維持動作時相鄰兩幀只差一點抖動，變化夠小就沿用上一次計算的結果
+class MotionGate:
+    def __init__(self, epsilon=MOTION_EPSILON, visibility_epsilon=VISIBILITY_EPSILON):
+        """
+        Args:
+            epsilon (float): max per-joint displacement (x, y, z) treated as static
+            visibility_epsilon (float): max per-joint visibility change treated as static
+        """
+        self.epsilon = epsilon
+        self.visibility_epsilon = visibility_epsilon
+        self.last_arrays = None
+        self.last_result = None
+        self.hits = 0
+        self.misses = 0
+
+    def is_static(self, arrays):
+        if self.last_arrays is None or len(arrays) != len(self.last_arrays):
+            return False
+        for array, last in zip(arrays, self.last_arrays):
+            if array.shape != last.shape:
+                return False
+            delta = array - last
+            # 每個關節的位移距離
+            if np.max(np.einsum('ij,ij->i', delta[:, :3], delta[:, :3])) > self.epsilon * self.epsilon:
+                return False
+            if array.shape[1] > 3 and np.max(np.abs(delta[:, 3])) > self.visibility_epsilon:
+                return False
+        return True
+
+    def check(self, *arrays):
+        """compare with the last evaluated landmarks
+
+        Args:
+            arrays (numpy array): (n, 3) or (n, 4) landmarks, e.g. landmarks and world landmarks
+
+        Returns:
+            result: cached result when the landmarks are static, otherwise None
+        """
+        if self.last_result is not None and self.is_static(arrays):
+            self.hits += 1
+            return self.last_result
+        self.misses += 1
+        return None
+
+    def update(self, arrays, result):
+        """store the evaluated landmarks and result, the next frames are compared with them"""
+        self.last_arrays = [np.array(array, dtype=np.float32) for array in arrays]
+        self.last_result = result
+
+    def reset(self):
+        self.last_arrays = None
+        self.last_result = None
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
@@ -0,0 +1,259 @@
+"""Compiled metadata of all yoga poses
+
+Build (run again after editing PoseFileDef.yogaFileDict or JsonFile/<pose>/*.json):
+    python PoseCatalog.py
+
+Check that the built files match the sources (run by the gradle preBuild, exits with 1 when stale):
+    python PoseCatalog.py --check
+
+The catalog is two files:
+    JsonFile/pose_catalog.json: index, angle triplets, roi keys, image path and row range of every pose
+    JsonFile/pose_catalog.npy: (joints, 4) float64 table [sample, sample_score, std_angle, weight], NaN when missing
+
+The index keeps a hash of the sources for the check. On the device the catalog and its sources
+ship in the same APK, so load_catalog trusts the index and does not read the sources.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from os.path import dirname, isdir, isfile, join
+
+import numpy as np
+
+import YogaLogger as log
+from PoseFileDef import yogaFileDict
+
+TAG = "PoseCatalog"
+
+CATALOG_VERSION = 1
+JSON_DIR = "JsonFile"
+CATALOG_INDEX = join(JSON_DIR, "pose_catalog.json")
+CATALOG_TABLE = join(JSON_DIR, "pose_catalog.npy")
+# table 的欄位，也是 JsonFile/<pose>/ 底下的檔名
+COLUMNS = ("sample", "sample_score", "std_angle", "weight")
+LANDMARK_COUNT = 33
+
+_catalog = None
+
+
+# 一個動作的資料，table 是整個 catalog 陣列的 view
+class PoseEntry:
+    def __init__(self, name, info, table):
+        self.name = name
+        self.folder = info["folder"]
+        self.image_path = info["image"]
+        self.angle_keys = info["angle_keys"]
+        # (n, 3) 關節點索引，順序與 angle_keys 相同
+        self.triplets = np.array(info["triplets"], dtype=np.intp).reshape(-1, 3)
+        self.roi_keys = info["roi"]
+        # table 每一列的關節名稱: angle_keys 之後接 json 檔案中多出來的關節
+        self.joint_keys = info["joints"]
+        start = info["row"]
+        self.table = table[start:start + len(self.joint_keys)]
+        self.angle_def = {key: triplet.tolist() for key, triplet in zip(self.angle_keys, self.triplets)}
+        self.column_dicts = {}
+
+    def column(self, name):
+        """(joints,) values of a column aligned with joint_keys, NaN when missing"""
+        return self.table[:, COLUMNS.index(name)]
+
+    def column_dict(self, name):
+        """{joint: value} of a column, the same content as JsonFile/<pose>/<name>.json"""
+        values = self.column_dicts.get(name)
+        if values is None:
+            values = {key: value for key, value in zip(self.joint_keys, self.column(name).tolist())
+                      if not math.isnan(value)}
+            self.column_dicts[name] = values
+        return dict(values)
+
+    def roi(self):
+        """new roi status dict, all joints are not correct yet"""
+        return {key: False for key in self.roi_keys}
+
+
+class PoseCatalog:
+    def __init__(self, index, table):
+        if index.get("version") != CATALOG_VERSION:
+            raise ValueError(f"pose catalog version {index.get('version')} is not {CATALOG_VERSION}")
+        self.table = table
+        self.poses = {name: PoseEntry(name, info, table) for name, info in index["poses"].items()}
+
+    def get(self, pose):
+        return self.poses.get(pose)
+
+    def names(self):
+        return list(self.poses.keys())
+
+
+def _find_folder(root, pose):
+    """JsonFile folder of the pose, the folder name may differ in case (Locust pose / Locust Pose)"""
+    if isdir(join(root, JSON_DIR, pose)):
+        return pose
+    for folder in os.listdir(join(root, JSON_DIR)):
+        if folder.lower() == pose.lower() and isdir(join(root, JSON_DIR, folder)):
+            return folder
+    raise ValueError(f"{pose}: folder is not found in {JSON_DIR}")
+
+
+def _read_column(root, pose, folder, name):
+    path = join(root, JSON_DIR, folder, name + ".json")
+    if not isfile(path):
+        raise ValueError(f"{pose}: {path} is not found")
+    with open(path, "r") as file:
+        values = json.load(file)
+    if not isinstance(values, dict):
+        raise ValueError(f"{pose}: {name}.json is not a dict")
+    for key, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"{pose}: {name}.json {key} is not a number ({value})")
+        if name in ("std_angle", "weight") and value < 0:
+            raise ValueError(f"{pose}: {name}.json {key} is negative ({value})")
+    return values
+
+
+def source_hash(root=None):
+    """sha1 of the catalog sources: the yogaFileDict fields used and the raw bytes of JsonFile/<pose>/*.json
+
+    Files are hashed without parsing them, it is much cheaper than compile_catalog.
+    """
+    root = root or dirname(__file__)
+    digest = hashlib.sha1()
+    for pose, info in yogaFileDict.items():
+        fields = {"angle_def": {key: list(value) for key, value in info["angle_def"].items()},
+                  "image": info["default_image_path"], "roi": list(info["roi"].keys())}
+        digest.update(json.dumps([pose, fields], ensure_ascii=False).encode("utf-8"))
+        folder = _find_folder(root, pose)
+        for name in COLUMNS:
+            path = join(root, JSON_DIR, folder, name + ".json")
+            if isfile(path):
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+def compile_catalog(root=None):
+    """read yogaFileDict and JsonFile/<pose>/*.json, validate them and build the catalog
+
+    Args:
+        root (str): folder containing JsonFile (default the folder of this file)
+
+    Returns:
+        index (dict): json index of the catalog
+        table (numpy array): (joints, 4) float64 table
+
+    Raises:
+        ValueError: a file is missing or contains invalid values
+    """
+    root = root or dirname(__file__)
+    poses = {}
+    rows = []
+    for pose, info in yogaFileDict.items():
+        folder = _find_folder(root, pose)
+        angle_keys = list(info["angle_def"].keys())
+        triplets = [list(info["angle_def"][key]) for key in angle_keys]
+        for key, triplet in zip(angle_keys, triplets):
+            if len(triplet) != 3 or not all(0 <= index < LANDMARK_COUNT for index in triplet):
+                raise ValueError(f"{pose}: angle {key} has invalid landmarks {triplet}")
+
+        columns = [_read_column(root, pose, folder, name) for name in COLUMNS]
+        joints = list(angle_keys)
+        for values in columns:
+            joints += [key for key in values if key not in joints]
+        for name, values in zip(COLUMNS[1:], columns[1:]):
+            missing = [key for key in angle_keys if key not in values]
+            if missing:
+                log.warning(TAG, "%s: %s.json has no %s, the joints are not scored", pose, name, missing)
+
+        poses[pose] = {
+            "folder": folder,
+            "image": info["default_image_path"],
+            "angle_keys": angle_keys,
+            "triplets": triplets,
+            "roi": list(info["roi"].keys()),
+            "joints": joints,
+            "row": len(rows),
+        }
+        for key in joints:
+            rows.append([float(values.get(key, math.nan)) for values in columns])
+
+    index = {"version": CATALOG_VERSION, "columns": list(COLUMNS), "source_hash": source_hash(root), "poses": poses}
+    return index, np.array(rows, dtype=np.float64).reshape(-1, len(COLUMNS))
+
+
+def build_catalog(root=None):
+    """compile the catalog and write pose_catalog.json / pose_catalog.npy under root"""
+    root = root or dirname(__file__)
+    index, table = compile_catalog(root)
+    with open(join(root, CATALOG_INDEX), "w") as file:
+        json.dump(index, file, ensure_ascii=False, indent=1)
+    np.save(join(root, CATALOG_TABLE), table)
+    return index, table
+
+
+def load_catalog(root=None):
+    """read the compiled catalog, memory-mapping the table when possible
+
+    Falls back to compiling JsonFile in memory when the catalog files are missing.
+    The sources are not compared here, check_catalog runs at build time.
+    """
+    root = root or dirname(__file__)
+    index_path, table_path = join(root, CATALOG_INDEX), join(root, CATALOG_TABLE)
+    if not (isfile(index_path) and isfile(table_path)):
+        log.warning(TAG, "%s is not built, compiling %s", CATALOG_INDEX, JSON_DIR)
+        return PoseCatalog(*compile_catalog(root))
+
+    with open(index_path, "r") as file:
+        index = json.load(file)
+    try:
+        table = np.load(table_path, mmap_mode="r")
+    except (OSError, ValueError):
+        table = np.load(table_path)
+    return PoseCatalog(index, table)
+
+
+def check_catalog(root=None):
+    """
+    Returns:
+        fresh (bool): the built catalog exists and was built from the current sources
+    """
+    root = root or dirname(__file__)
+    index_path = join(root, CATALOG_INDEX)
+    if not (isfile(index_path) and isfile(join(root, CATALOG_TABLE))):
+        return False
+    with open(index_path, "r") as file:
+        index = json.load(file)
+    return index.get("source_hash") == source_hash(root)
+
+
+def get_catalog():
+    """the catalog shared by every pose object, loaded once per process"""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog()
+    return _catalog
+
+
+def get_pose(pose):
+    """
+    Returns:
+        entry (PoseEntry): None when the pose is not in the catalog
+    """
+    return get_catalog().get(pose)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="build the pose catalog from PoseFileDef.py and JsonFile")
+    parser.add_argument("root", nargs="?", help="folder containing JsonFile, default the folder of this file")
+    parser.add_argument("--check", action="store_true", help="only check that the built catalog is up to date")
+    args = parser.parse_args()
+    if args.check:
+        if not check_catalog(args.root):
+            print(f"{CATALOG_INDEX} is older than {JSON_DIR} / PoseFileDef.py, run: python PoseCatalog.py")
+            sys.exit(1)
+        print(f"{CATALOG_INDEX} is up to date")
+    else:
+        index, table = build_catalog(args.root)
+        print(f"{len(index['poses'])} poses, {len(table)} joints -> {CATALOG_INDEX}, {CATALOG_TABLE}")
@@ -0,0 +1,823 @@
+from RuleDef import *
+
+#  tips, images and arrows rule of yoga pose
+#  每個 rules(side) 回傳 {roi key: Rule}，依照 roi 的順序檢查，第一個錯誤的提示會被顯示
+
+OTHER_SIDE = {'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+
+
+def between(expr, min_value, max_value):
+    return (expr >= min_value) & (expr <= max_value)
+
+
+def both(name):
+    return ('LEFT_' + name, 'RIGHT_' + name)
+
+
+def _tree(_):
+    knee, hip = point('LEFT_KNEE'), point('LEFT_HIP')
+    r_knee = point('RIGHT_KNEE')
+    foot = point('LEFT_FOOT_INDEX')
+    l_shoulder, r_shoulder = point('LEFT_SHOULDER'), point('RIGHT_SHOULDER')
+    knee_forward = (hip.z - knee.z) * 100
+    rules = {
+        'LEFT_KNEE': Rule([
+            ok((angle('LEFT_KNEE') <= 65) & (knee_forward <= 17)),
+            fail("請將右腳再抬高一些，不可壓到左腳膝蓋", "1.jpg", move(knee, 0, -1),
+                 when=angle('LEFT_KNEE') > 65),
+            fail("將臂部往前推，打開左右骨盆，右腳膝蓋不可向前傾", "3.jpg", toward(hip, 1, -1),
+                 when=knee_forward > 17),
+            fail("右腳膝蓋不可向前傾，須與髖關節保持同一平面", "3.jpg", toward(knee, 1, -1)),
+        ], skip=missing('LEFT_KNEE')),
+        'LEFT_HIP': Rule([
+            ok(angle('LEFT_HIP') >= 100),
+            fail("請確認右腳膝蓋是否已經抬至左腳膝蓋以上", "2.jpg", toward(knee, 1, -1)),
+        ], skip=missing('LEFT_HIP')),
+        'LEFT_FOOT_INDEX': Rule([
+            ok(foot.y <= r_knee.y),
+            fail("請將右腳抬至高於左腳膝蓋的位置，勿將右腳放在左腳膝蓋上，避免造成膝蓋負擔", "2.jpg", toward(foot, 1, 0)),
+        ], skip=invisible('LEFT_FOOT_INDEX', 'RIGHT_KNEE')),
+        'RIGHT_KNEE': Rule([
+            ok(between(angle('RIGHT_KNEE'), 170, 180)),
+            fail("將左腳打直平均分配雙腳重量，勿將右腳重量全放在左腳大腿", "1.jpg", move(r_knee, 0, 1),
+                 when=angle('RIGHT_KNEE') < 170),
+            fail("請勿將右腳重量全放在左腳大腿，避免傾斜造成左腳負擔", "1.jpg", toward(r_knee, -1, 0)),
+        ], skip=missing('RIGHT_KNEE')),
+    }
+    for name in both('SHOULDER'):
+        rules[name] = Rule([
+            ok(angle(name) >= 120),
+            fail("請將雙手合掌並互相施力，往上伸展至頭頂正上方", "4.jpg", move(point(name), 0, -1)),
+        ], skip=missing(name))
+    for name, dx in (('LEFT_ELBOW', 1), ('RIGHT_ELBOW', -1)):
+        rules[name] = Rule([
+            ok(angle(name) >= sample(name) - 10),
+            fail("請將雙手再往上伸展，使手軸貼近耳朵", "5.jpg", toward(point(name), dx, 0)),
+        ], skip=missing(name))
+    for name in both('INDEX'):
+        index = point(name)
+        rules[name] = Rule([
+            ok((index.x >= r_shoulder.x) & (index.x <= l_shoulder.x)),
+            fail("請將雙手往右移動，保持在頭頂正上方", "6.jpg", move(index, 1, 0), when=index.x < r_shoulder.x),
+            fail("請將雙手往左移動，保持在頭頂正上方", "7.jpg", move(index, -1, 0), when=index.x > l_shoulder.x),
+        ])
+    return rules
+
+
+def _warrior2(_):
+    l_knee, r_knee = point('LEFT_KNEE'), point('RIGHT_KNEE')
+    l_hip, r_hip = point('LEFT_HIP'), point('RIGHT_HIP')
+    ankle = point('LEFT_ANKLE')
+    nose = point('NOSE')
+    shift = abs(ankle.x - l_knee.x) > 0.08
+    rules = {
+        'LEFT_ANKLE': Rule([
+            ok(l_hip.x <= l_knee.x),
+            fail("請將右腳腳尖朝向右手邊", "1.jpg", move(point('LEFT_FOOT_INDEX'), 1, 0)),
+        ], skip=invisible('LEFT_KNEE', 'LEFT_HIP')),
+        'RIGHT_KNEE': Rule([
+            ok(angle('RIGHT_KNEE') >= 165),
+            fail("請將左腳膝蓋打直，並將左腳腳尖朝向前方", "3.jpg", line(r_knee, point('RIGHT_ANKLE'))),
+        ], skip=missing('RIGHT_KNEE')),
+        'LEFT_KNEE': Rule([
+            ok(between(angle('LEFT_KNEE'), 90, 150) & (abs(ankle.x - l_knee.x) <= 0.08)),
+            fail(BluetoothTip("請將身體下壓，右腳再彎曲一些", "請將重心往右移動移動，並且小腿與地面保持垂直", "發生錯誤"),
+                 "2.jpg", move(l_knee, 1, 0), when=shift),
+            fail("臀部不可低於右腳膝蓋，請將左腳往內收回使臀部高於右腳膝蓋", "2.jpg", move(r_knee, 1, 0),
+                 when=angle('LEFT_KNEE') < 90),
+            fail(BluetoothTip("請將左腳再往後一些，並將臀部向下壓", "請將重心往右移動移動，並且小腿與地面保持垂直", "發生錯誤"),
+                 "2.jpg", move(r_knee, -1, 0), when=angle('LEFT_KNEE') > 150),
+        ], skip=missing('LEFT_KNEE') | invisible('LEFT_ANKLE', 'LEFT_KNEE')),
+        'LEFT_HIP': Rule([
+            ok(angle('LEFT_HIP') >= 100),
+            fail("請將雙腳再拉開一些距離，臀部向前推並挺胸", "4.jpg", move(l_knee, 1, 0)),
+        ], skip=missing('LEFT_HIP')),
+        'RIGHT_HIP': Rule([
+            ok(angle('RIGHT_HIP') >= 100),
+            fail("請將雙腳再拉開一些距離，臀部向前推並挺胸", "4.jpg", move(r_knee, -1, 0)),
+        ], skip=missing('RIGHT_HIP')),
+        'NOSE': Rule([
+            ok(abs(nose.x - l_hip.x) < abs(nose.x - r_hip.x)),
+            fail("請將頭轉向彎曲腳的方向並直視前方", "5.jpg", move(nose, 1, 0)),
+        ], skip=invisible('LEFT_HIP', 'RIGHT_HIP', 'NOSE')),
+    }
+    for side, up, down in (('LEFT', "請將右手抬高，與肩膀呈水平，並將身體挺直朝向前方", "請將右手放低 ，與肩膀呈水平，並將身體挺直朝向前方"),
+                           ('RIGHT', "請將左手抬高，與肩膀呈水平，並將身體挺直朝向前方", "請將左手放低，與肩膀呈水平，並將身體挺直朝向前方")):
+        name = side + '_SHOULDER'
+        elbow = point(side + '_ELBOW')
+        rules[name] = Rule([
+            ok(angle(name) >= 150),
+            fail(up, "6.jpg", move(elbow, 0, -1), when=elbow.y - point(name).y > 0.05),
+            fail(down, "6.jpg", move(elbow, 0, 1)),
+        ], skip=missing(name))
+    for side, direction in (('LEFT', "右"), ('RIGHT', "左")):
+        name = side + '_ELBOW'
+        rules[name] = Rule([
+            ok(angle(name) >= 160),
+            fail(f"請將{direction}手手心朝下平放並打直{direction}手", "7.jpg",
+                 line(point(name), point(side + '_WRIST'))),
+        ], skip=missing(name))
+    return rules
+
+
+PLANK_SELECT = ('NOSE', Rule([
+    side('RIGHT', (point('NOSE').x > point('LEFT_HIP').x) & (point('NOSE').x > point('RIGHT_HIP').x)),
+    side('LEFT', (point('NOSE').x < point('LEFT_HIP').x) & (point('NOSE').x < point('RIGHT_HIP').x)),
+    fail("請將身體朝左方或右方趴下，並將雙手撐在肩膀下方，將身體撐起，使身體呈現一斜線", "10.jpg"),
+]))
+
+
+def _plank(side):
+    other = OTHER_SIDE[side]
+    p = lambda name: point(f'{side}_{name}')
+    o = lambda name: point(f'{other}_{name}')
+    other_hip_up = o('HIP').y - point('NOSE').y > 0.2
+    if side == 'RIGHT':
+        elbow_fail = [
+            fail("請將手臂打直，並將手肘向後縮並確認手肘位置在肩關節下方", "2.jpg", move(p('ELBOW'), -1, 0),
+                 when=p('ELBOW').x > p('SHOULDER').x),
+            fail("請將手臂打直，手肘向前移並確認手肘位置在肩關節下方", "3.jpg", move(p('ELBOW'), 1, 0)),
+        ]
+    else:
+        elbow_fail = [
+            fail("請將手臂打直，手肘向後縮並確認手肘位置在肩關節下方", "2.jpg", move(p('ELBOW'), 1, 0),
+                 when=p('ELBOW').x < p('SHOULDER').x),
+            fail("請將手臂打直，手肘向前移並確認手肘位置在肩關節下方", "3.jpg", move(p('ELBOW'), -1, 0),
+                 when=p('ELBOW').x > p('SHOULDER').x),
+            fail("請將手臂打直，手肘向前移並確認手肘位置在肩關節下方", "3.jpg", move(point('RIGHT_ELBOW'), 1, 0)),
+        ]
+    return {
+        f'{side}_ANKLE': Rule([
+            ok(p('ANKLE').y < p('FOOT_INDEX').y),
+            fail("請用前腳掌將身體撐起", "9.jpg", move(p('FOOT_INDEX'), 0, -1)),
+        ], skip=invisible(f'{side}_ANKLE', f'{side}_FOOT_INDEX')),
+        f'{side}_KNEE': Rule([
+            ok(angle(f'{side}_KNEE') >= 160),
+            fail("請將雙腿伸直並讓大腿到腳踝成一直線", "8.jpg", move(p('KNEE'), 0, 1)),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_EYE': Rule([
+            ok(abs(o('SHOULDER').y - o('EYE').y) >= abs(o('SHOULDER').y - o('ELBOW').y) * 0.05),
+            fail("請將頭抬起，保持頸椎平行於地面", "1.jpg", move(p('EYE'), 0, -1)),
+        ], skip=invisible(f'{other}_SHOULDER', f'{other}_EYE'), roi=both('EYE')),
+        f'{side}_ELBOW': Rule([
+            ok((abs(p('ELBOW').x - p('SHOULDER').x) < 0.15) & (angle(f'{side}_ELBOW') > 150)),
+        ] + elbow_fail, roi=both('ELBOW')),
+        f'{side}_SHOULDER': Rule([
+            ok(between(angle(f'{side}_SHOULDER'), 60, 85)),
+            fail("請將肩膀向後移並確認手軸於肩膀下方，維持頸椎、胸椎、腰椎維持一直線平行於地面", "4.jpg",
+                 move(p('ELBOW'), -1, 0), when=angle(f'{side}_SHOULDER') < 60),
+            fail("請將身體向前移並確認手軸於肩膀下方，維持頸椎、胸椎、腰椎維持一直線平行於地面", "5.jpg",
+                 move(p('ELBOW'), 1, 0)),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_HIP': Rule([
+            ok((angle(f'{side}_HIP') >= 165) & (o('HIP').y - point('NOSE').y <= 0.2)),
+            fail("請將屁股稍微放下", "6.jpg", move(p('HIP'), 0, 1), when=angle(f'{side}_HIP') < 165),
+            fail("請將屁股稍微抬起", "7.jpg", move(p('HIP'), 0, -1), when=other_hip_up),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+    }
+
+
+REVERSE_PLANK_SELECT = ('NOSE', Rule([
+    fail("請將身體面向右方或左方坐下，並將雙手撐在肩膀下方，使上半身呈現斜線", "6.jpg", when=invisible('NOSE')),
+    side('LEFT', (point('NOSE').x > point('LEFT_HIP').x) & (point('NOSE').x > point('RIGHT_HIP').x)),
+    side('RIGHT', (point('NOSE').x < point('LEFT_HIP').x) & (point('NOSE').x < point('RIGHT_HIP').x)),
+    fail("請將身體面向右方或左方坐下，並將雙手撐在肩膀下方，使上半身呈現斜線", "6.jpg"),
+]))
+
+
+def _reverse_plank(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    if side == 'LEFT':
+        index_ok = p('INDEX').x < p('SHOULDER').x + 2
+        index_arrow = move(p('WRIST'), -1, 0)
+    else:
+        index_ok = p('INDEX').x + 2 > p('SHOULDER').x
+        index_arrow = move(p('WRIST'), 1, 0)
+    return {
+        f'{side}_ELBOW': Rule([
+            ok(a('ELBOW') >= sample(f'{side}_ELBOW') - 10),
+            fail("請將雙手向後伸，指尖朝前，將手軸打直", "1.jpg", move(p('ELBOW'), 0, 1)),
+        ], skip=missing(f'{side}_ELBOW'), roi=both('ELBOW')),
+        f'{side}_INDEX': Rule([
+            ok(index_ok),
+            fail("請將雙手手指朝向臀部，並將手臂打直，垂直於地面", "2.jpg", index_arrow),
+        ], roi=both('INDEX')),
+        f'{side}_WRIST': Rule([
+            ok(abs(p('ELBOW').x - p('WRIST').x) < 0.15),
+            fail("請將手掌平貼於地面，讓肩膀、手軸、手腕成一直線垂直於地面", "2.jpg", move(p('ELBOW'), 0, 1)),
+        ], skip=any_invisible(f'{side}_WRIST', f'{side}_ELBOW'), roi=both('WRIST')),
+        f'{side}_SHOULDER': Rule([
+            ok(between(a('SHOULDER'), 55, 85)),
+            fail("胸往前挺並保持臀部抬起", "3.jpg", move(p('HIP'), 0, -1)),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_HIP': Rule([
+            ok(a('HIP') >= sample(f'{side}_HIP') - 7),
+            fail("請將臀部抬高一些，使身體保持一直線", "4.jpg", move(p('HIP'), 0, -1)),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') >= sample(f'{side}_KNEE') - 10),
+            fail("請將雙腳膝蓋打直，使身體保持一直線", "5.jpg", line(p('KNEE'), p('ANKLE'))),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+    }
+
+
+CHILDS_SELECT = ('NOSE', Rule([
+    side('RIGHT', ((point('NOSE').x < point('RIGHT_HIP').x) & (point('NOSE').x < point('LEFT_HIP').x))
+         | ((point('RIGHT_KNEE').x < point('RIGHT_HIP').x) & (abs(point('RIGHT_KNEE').x - point('RIGHT_HIP').x) > 0.2))),
+    side('LEFT', ((point('LEFT_HIP').x < point('NOSE').x) & (point('RIGHT_HIP').x < point('NOSE').x))
+         | ((point('LEFT_KNEE').x > point('LEFT_HIP').x) & (abs(point('LEFT_HIP').x - point('LEFT_KNEE').x) > 0.2))),
+    fail("請將身體面向右方或左方以跪姿坐下", "5.jpg"),
+]))
+
+
+def _childs(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    shoulder_arrow = move(p('ELBOW'), -1, 0) if side == 'LEFT' else move(p('ELBOW'), 1, 0)
+    return {
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') <= 45),
+            fail("請確認雙腿是否已經屈膝", "1.jpg", toward(p('KNEE'), 0, 1)),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_HIP': Rule([
+            ok(a('HIP') <= sample(f'{side}_HIP') + 10),
+            fail("請確認是否已經將身體向前趴下", "2.jpg", toward(point('LEFT_HIP'), 0, -1)),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+        f'{side}_SHOULDER': Rule([
+            ok(a('SHOULDER') >= 120),
+            fail("請確認是否已經將手臂向上舉直", "3.jpg", shoulder_arrow),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_ELBOW': Rule([
+            ok((a('ELBOW') >= 130) & (abs(p('KNEE').y - p('ELBOW').y) < 0.1)),
+            fail("請確認是否已經將手臂向前伸直", "4.jpg", toward(p('ELBOW'), 0, -1)),
+        ], skip=missing(f'{side}_ELBOW') | any_invisible(f'{side}_KNEE', f'{side}_ELBOW'), roi=both('ELBOW')),
+    }
+
+
+DOWNWARD_DOG_SELECT = ('NOSE', Rule([
+    fail("請將身體面向右方或左方雙膝跪地，再用雙手撐地將臀部向上撐起成倒V字型", "6.jpg", when=invisible('NOSE')),
+    side('RIGHT', (point('NOSE').x > point('LEFT_HIP').x) & (point('NOSE').x > point('RIGHT_HIP').x)),
+    side('LEFT', (point('NOSE').x < point('LEFT_HIP').x) & (point('NOSE').x < point('RIGHT_HIP').x)),
+    fail("請將身體面向右方或左方雙膝跪地，再用雙手撐地將臀部向上撐起成倒V字型", "6.jpg"),
+]))
+
+
+def _downward_dog(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    shoulder_arrow = move(p('SHOULDER'), -1, 1) if side == 'LEFT' else move(p('SHOULDER'), 1, 1)
+    return {
+        f'{side}_SHOULDER': Rule([
+            ok(a('SHOULDER') >= 120),
+            fail("請確認是否已經將手臂打直，並將臀部向上撐起", "7.jpg", shoulder_arrow),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_ELBOW': Rule([
+            ok(a('ELBOW') >= 100),
+            fail("請確認手掌是否已經貼至地面", "3.jpg", toward(p('WRIST'), 0, -1)),
+        ], skip=missing(f'{side}_ELBOW'), roi=both('ELBOW')),
+        f'{side}_HIP': Rule([
+            ok(between(a('HIP'), sample(f'{side}_HIP') - 15, sample(f'{side}_HIP') + 15)),
+            fail("請確認是否已經將身體向下伸展且把背打直, 呈現倒v字型", "2.jpg", move(p('SHOULDER'), 0, 1)),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') >= 150),
+            fail("請確認雙腿是否已經打直", "4.jpg", line(p('HIP'), p('ANKLE'))),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_ANKLE': Rule([
+            ok(abs(p('FOOT_INDEX').y - p('HEEL').y) < 0.1),
+            fail("請確認腳跟是否已經貼地", "5.jpg", toward(p('ANKLE'), 0, -1)),
+        ], skip=any_invisible(f'{side}_HEEL', f'{side}_FOOT_INDEX'), roi=both('ANKLE')),
+    }
+
+
+LOW_LUNGE_SELECT = ('NOSE', Rule([
+    fail("請將身體面向右方或左方成低弓箭步姿，並將雙手向上舉起", "5.jpg",
+         when=any_invisible('LEFT_SHOULDER', 'RIGHT_SHOULDER')),
+    side('RIGHT', (point('RIGHT_SHOULDER').x > point('NOSE').x) & (point('LEFT_SHOULDER').x > point('NOSE').x)),
+    side('LEFT', (point('RIGHT_SHOULDER').x < point('NOSE').x) & (point('LEFT_SHOULDER').x < point('NOSE').x)),
+    fail("請將身體面向右方或左方成低弓箭步姿，並將雙手向上舉起", "5.jpg"),
+]))
+
+
+def _low_lunge(side):
+    back = OTHER_SIDE[side]
+    direction, direction_back = ("左", "右") if side == 'RIGHT' else ("右", "左")
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    nose = point('NOSE')
+    return {
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') >= 100),
+            fail(f"請確認是否將{direction}腳向後伸", "1.jpg", toward(p('KNEE'), 0, -1)),
+        ], skip=missing(f'{side}_KNEE')),
+        f'{back}_KNEE': Rule([
+            ok(angle(f'{back}_KNEE') <= 90),
+            fail(f"請確認是否已經將{direction_back}腳屈膝", "2.jpg", toward(point(f'{back}_KNEE'), 0, -1)),
+        ], skip=missing(f'{back}_KNEE')),
+        f'{side}_HIP': Rule([
+            ok(p('HIP').y > point(f'{back}_KNEE').y),
+            fail(f"請確認是否已經將{direction}腳向後伸，並將上半身向下壓低", "3.jpg", toward(p('HIP'), 0, -1)),
+        ], skip=any_invisible(f'{side}_HIP', f'{back}_KNEE'), roi=both('HIP')),
+        f'{side}_SHOULDER': Rule([
+            ok(a('SHOULDER') >= 150),
+            fail("請確認是否已經將手臂打直，並向上舉", "4.jpg", move(p('SHOULDER'), 0, -1)),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_ELBOW': Rule([
+            ok(((point('RIGHT_ELBOW').y <= nose.y) | (point('LEFT_ELBOW').y <= nose.y)) & (a('ELBOW') >= 150)),
+            fail("請確認手掌是否已經將手臂打直且舉高過頭", "4.jpg", move(p('ELBOW'), 0, -1)),
+        ], skip=invisible('NOSE'), roi=both('ELBOW')),
+    }
+
+
+SEATED_FORWARD_BEND_SELECT = ('NOSE', Rule([
+    fail("請將身體面向右方或左方坐下，並將腳伸直", "5.jpg", when=invisible('NOSE')),
+    side('RIGHT', (point('NOSE').x > point('LEFT_SHOULDER').x) & (point('NOSE').x > point('RIGHT_SHOULDER').x)),
+    side('LEFT', (point('NOSE').x < point('LEFT_SHOULDER').x) & (point('NOSE').x < point('RIGHT_SHOULDER').x)),
+    fail("請將身體面向右方或左方坐下，並將腳伸直", "5.jpg"),
+]))
+
+
+def _seated_forward_bend(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    dx = -1 if side == 'LEFT' else 1
+    center = midpoint(p('HIP'), p('SHOULDER'))
+    return {
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') >= 150),
+            fail("請確認是否已經將雙腳向前伸直", "3.jpg", move(p('KNEE'), dx, 0)),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_SHOULDER': Rule([
+            ok((a('SHOULDER') >= 80) & (a('SHOULDER') < 120)),
+            fail("請確認是否已經將身體向前彎曲，並將手臂向前伸", "1.jpg", move(p('ELBOW'), dx, 0)),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_ELBOW': Rule([
+            ok(a('ELBOW') >= 150),
+            fail("請確認是否已經將手臂打直", "1.jpg", move(p('ELBOW'), dx, 0)),
+        ], skip=missing(f'{side}_ELBOW'), roi=both('ELBOW')),
+        f'{side}_HIP': Rule([
+            ok(a('HIP') <= 75),
+            fail("請確認是否已經將身體向前彎，盡量碰觸到腳板", "2.jpg", toward(center, -dx, -dx)),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+        f'{side}_ANKLE': Rule([
+            ok(a('ANKLE') <= 130),
+            fail("請確認是否將腳踝輕微勾回", "4.jpg", move(p('FOOT_INDEX'), -dx, 0)),
+        ], skip=missing(f'{side}_ANKLE'), roi=both('ANKLE')),
+    }
+
+
+BRIDGE_SELECT = ('NOSE', Rule([
+    side('LEFT', point('LEFT_HIP').x > point('LEFT_KNEE').x),
+    side('RIGHT', point('RIGHT_HIP').x < point('RIGHT_KNEE').x),
+    fail("請將身體平躺下，並將雙手放置於身體兩側", "5.jpg"),
+]))
+
+
+def _bridge(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    return {
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') <= 80),
+            fail("請確認是否已經將雙腳屈膝", "1.jpg", toward(p('KNEE'), 0, -1)),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_ELBOW': Rule([
+            ok(a('ELBOW') >= sample(f'{side}_ELBOW') - 25),
+            fail("請確認手掌是否已經貼至地面", "2.jpg", toward(p('WRIST'), 0, -1)),
+        ], skip=missing(f'{side}_ELBOW'), roi=both('ELBOW')),
+        f'{side}_SHOULDER': Rule([
+            ok(a('SHOULDER') <= 45),
+            fail("請利用核心力量將臀部撐起", "3.jpg", move(p('HIP'), 0, -1)),
+        ], skip=missing(f'{side}_SHOULDER'), roi=both('SHOULDER')),
+        f'{side}_HIP': Rule([
+            ok(a('HIP') >= 150),
+            fail("請確認是否已經將身體挺直，並與大腿形成一條直線", "4.jpg", line(p('SHOULDER'), p('KNEE'))),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+    }
+
+
+PYRAMID_SELECT = ('NOSE', Rule([
+    fail("請將身體面向左方或右方，將其中一隻腳向前跨，並將雙腿打直", "6.jpg", when=invisible('NOSE')),
+    side('RIGHT', (point('NOSE').x > point('LEFT_SHOULDER').x) & (point('NOSE').x > point('RIGHT_SHOULDER').x)),
+    side('LEFT', (point('NOSE').x < point('LEFT_SHOULDER').x) & (point('NOSE').x < point('RIGHT_SHOULDER').x)),
+    fail("請將身體面向左方或右方，將其中一隻腳向前跨，並將雙腿打直", "6.jpg"),
+]))
+
+
+def _pyramid(side):
+    p = lambda name: point(f'{side}_{name}')
+    a = lambda name: angle(f'{side}_{name}')
+    center = midpoint(p('HIP'), p('SHOULDER'))
+    if side == 'LEFT':
+        hip_arrow = toward(center, 1, -1)
+    else:
+        # 原本的箭頭只有起點
+        hip_arrow = [center.x - D, center.y - D]
+    return {
+        f'{side}_HIP': Rule([
+            ok(a('HIP') <= 110),
+            fail("請確認是否已經將身體向前腳彎曲", "3.jpg", hip_arrow),
+        ], skip=missing(f'{side}_HIP'), roi=both('HIP')),
+        f'{side}_KNEE': Rule([
+            ok(a('KNEE') >= sample(f'{side}_KNEE') - 20),
+            fail("請確認是否已經將雙腳打直", "2.jpg", line(p('HIP'), p('ANKLE'))),
+        ], skip=missing(f'{side}_KNEE'), roi=both('KNEE')),
+        f'{side}_SHOULDER': Rule([
+            ok(p('ANKLE').y <= p('INDEX').y + 0.2),
+            fail("請確認是否已經將手臂放置於前腳兩側，小心不要遮擋到腳踝視線", "5.jpg", line(p('SHOULDER'), p('WRIST'))),
+        ], skip=any_invisible(f'{side}_INDEX', f'{side}_ANKLE'), roi=both('SHOULDER')),
+        f'{side}_ELBOW': Rule([
+            ok(a('ELBOW') >= 90),
+            fail("請確認手臂是否已經向下伸直", "4.jpg", line(point('RIGHT_SHOULDER'), point('RIGHT_WRIST'))),
+        ], skip=missing(f'{side}_ELBOW'), roi=both('ELBOW')),
+    }
+
+
+def _mountain(_):
+    nose = point('NOSE')
+    l_hip, r_hip = point('LEFT_HIP'), point('RIGHT_HIP')
+    l_ankle, r_ankle = point('LEFT_ANKLE'), point('RIGHT_ANKLE')
+    rules = {
+        'NOSE': Rule([
+            fail("請將頭部正面向前方", when=invisible('NOSE')),
+            ok(abs(nose.x - (l_hip.x + r_hip.x) / 2) <= 0.1),
+            fail("請將頭面向正前方", "2.jpg", toward(point('RIGHT_EYE'), -1, 0),
+                 when=abs(nose.x - l_hip.x) > abs(nose.x - r_hip.x)),
+            fail("請將頭面向正前方", "2.jpg", toward(point('LEFT_EYE'), 1, 0)),
+        ]),
+    }
+    for side, dx in (('LEFT', 1), ('RIGHT', -1)):
+        p = lambda name: point(f'{side}_{name}')
+        rules[f'{side}_SHOULDER'] = Rule([
+            ok(between(angle(f'{side}_SHOULDER'), 80, 100)),
+            fail("請保持雙肩平行", "3.jpg", toward(p('SHOULDER'), dx, 0)),
+        ], skip=missing(f'{side}_SHOULDER'))
+        rules[f'{side}_ELBOW'] = Rule([
+            ok(angle(f'{side}_ELBOW') >= 160),
+            fail("請將雙臂伸直，放置身體兩側，並將手掌朝向前方", "4.jpg", move(p('ELBOW'), 0, 1)),
+        ], skip=missing(f'{side}_ELBOW'))
+        rules[f'{side}_HIP'] = Rule([
+            ok(angle(f'{side}_HIP') >= 120),
+            fail("請將雙腳直立於地面", "5.jpg", move(p('HIP'), 0, 1)),
+        ], skip=missing(f'{side}_HIP'))
+        rules[f'{side}_KNEE'] = Rule([
+            ok(angle(f'{side}_KNEE') >= 160),
+            fail("請將雙腿伸直併攏", "5.jpg", move(p('KNEE'), 0, 1)),
+        ], skip=missing(f'{side}_KNEE'))
+        rules[f'{side}_ANKLE'] = Rule([
+            fail("請確保腳踝能被檢測到", "6.jpg", when=any_invisible('LEFT_ANKLE', 'RIGHT_ANKLE')),
+            ok(abs(l_ankle.x - r_ankle.x) <= 0.05),
+            fail("請將雙腳平行站立於地面", "6.jpg", move(p('KNEE'), 0, 1)),
+        ])
+    return rules
+
+
+def _triangle(_):
+    l_wrist, r_wrist = point('LEFT_WRIST'), point('RIGHT_WRIST')
+    l_elbow, r_elbow = point('LEFT_ELBOW'), point('RIGHT_ELBOW')
+    foot, heel = point('RIGHT_FOOT_INDEX'), point('RIGHT_HEEL')
+    nose, eye = point('NOSE'), point('RIGHT_EYE')
+    return {
+        'LEFT_HIP': Rule([
+            ok(between(angle('LEFT_HIP'), 50, 100)),
+            fail("請確認是否已經將右腳向右跨，使雙腳呈現大字型", "3.jpg", move(point('LEFT_KNEE'), 1, 0)),
+        ], skip=missing('LEFT_HIP')),
+        'LEFT_SHOULDER': Rule([
+            ok(angle('LEFT_SHOULDER') >= 150),
+            fail("請將雙手手臂平舉打直", "4.jpg", move(l_elbow, 1, 0)),
+        ], skip=missing('LEFT_SHOULDER')),
+        'RIGHT_SHOULDER': Rule([
+            ok(angle('RIGHT_SHOULDER') >= 145),
+            fail("請將雙手手臂平舉打直", "4.jpg", move(r_elbow, -1, 0)),
+        ], skip=missing('RIGHT_SHOULDER')),
+        'RIGHT_FOOT_INDEX': Rule([
+            fail("請確認腳踝是否位於鏡頭範圍之內", when=any_invisible('RIGHT_FOOT_INDEX', 'RIGHT_HEEL')),
+            ok(foot.x < heel.x),
+            fail("請確認是否已經將左腳向左轉", "5.jpg", move(foot, -1, 0)),
+        ]),
+        'RIGHT_HIP': Rule([
+            ok(angle('RIGHT_HIP') <= 100),
+            fail("請確認是否已經將身體向左腳下彎", "6.jpg",
+                 move(midpoint(point('RIGHT_HIP'), point('RIGHT_SHOULDER')), 0, 1)),
+        ], skip=missing('RIGHT_HIP')),
+        'LEFT_ELBOW': Rule([
+            fail("請確認右手腕是否位於鏡頭範圍內", when=invisible('LEFT_WRIST')),
+            ok((l_wrist.y < l_elbow.y) & (angle('LEFT_ELBOW') >= 150)),
+            fail("請確認是否已經將右手舉直並向上拉高", "7.jpg", move(l_elbow, 0, -1)),
+        ]),
+        'RIGHT_ELBOW': Rule([
+            fail("請確認左手腕是否位於鏡頭範圍內", when=invisible('RIGHT_WRIST')),
+            ok((r_elbow.y < r_wrist.y) & (angle('RIGHT_ELBOW') >= 150)),
+            fail("請確認是否已經將左手向下舉直", "8.jpg", move(r_elbow, 0, 1)),
+        ]),
+        'RIGHT_EYE': Rule([
+            ok(nose.y < eye.y),
+            fail("請確認是否已經將眼睛向上看", "9.jpg", move(eye, 0, -1)),
+        ], skip=nose.y < MIN),
+        'RIGHT_KNEE': Rule([
+            ok(angle('RIGHT_KNEE') >= 150),
+            fail("請勿將重心過度偏左，將左腳打直", "10.jpg", toward(point('RIGHT_KNEE'), -1, -1)),
+        ], skip=missing('RIGHT_KNEE')),
+        'LEFT_KNEE': Rule([
+            ok(angle('LEFT_KNEE') >= 150),
+            fail("請勿將重心過度偏右，將右腳打直", "10.jpg", toward(point('LEFT_KNEE'), 1, -1)),
+        ], skip=missing('LEFT_KNEE')),
+    }
+
+
+def _locust(_):
+    nose = point('NOSE')
+    ear = point('LEFT_EAR')
+    return {
+        'LEFT_KNEE': Rule([
+            ok(between(angle('LEFT_KNEE'), 140, 180)),
+            fail("將右小腿放低", "2.jpg", move(point('LEFT_ANKLE'), 0, 1), when=angle('LEFT_KNEE') < 140),
+            fail("將右小腿抬高", "3.jpg", move(point('LEFT_ANKLE'), 0, -1)),
+        ], skip=missing('LEFT_KNEE')),
+        'LEFT_EAR': Rule([
+            ok(abs(ear.y - nose.y) <= 0.05),
+            fail("請勿過度抬頭，目視前方", "4.jpg", move(nose, 0, 1), when=ear.y < nose.y),
+            fail("請抬頭並目視前方", "4.jpg", move(nose, 0, -1)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+        'LEFT_ELBOW': Rule([
+            ok(between(angle('LEFT_ELBOW'), 150, 180)),
+            fail("將右手伸直", "5.jpg", move(point('LEFT_ELBOW'), -1, 0)),
+        ], skip=missing('LEFT_ELBOW')),
+        'LEFT_SHOULDER': Rule([
+            ok(between(angle('LEFT_SHOULDER'), 15, 45)),
+            fail("將雙臂抬高", "6.jpg", move(point('LEFT_WRIST'), 0, -1), when=angle('LEFT_SHOULDER') < 15),
+            fail("請放低雙臂", "7.jpg", move(point('LEFT_WRIST'), 0, 1)),
+        ], skip=missing('LEFT_SHOULDER')),
+        'RIGHT_KNEE': Rule([
+            ok(between(angle('RIGHT_KNEE'), 150, 180)),
+            fail("將左小腿放低", "2.jpg", move(point('RIGHT_ANKLE'), 0, 1), when=angle('RIGHT_KNEE') < 150),
+            fail("將左小腿抬高", "3.jpg", move(point('RIGHT_ANKLE'), 0, -1)),
+        ], skip=missing('RIGHT_KNEE')),
+        'RIGHT_ELBOW': Rule([
+            ok(between(angle('RIGHT_ELBOW'), 150, 180)),
+            fail("將左手伸直", "5.jpg", move(point('LEFT_ELBOW'), -1, 0)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'RIGHT_HIP': Rule([
+            ok(point('RIGHT_HIP').y > point('RIGHT_KNEE').y),
+            fail("將大腿抬高", "8.jpg", move(point('LEFT_KNEE'), 0, -1)),
+        ], skip=invisible('RIGHT_HIP', 'RIGHT_KNEE')),
+        'LEFT_FOOT_INDEX': Rule([
+            ok(point('LEFT_FOOT_INDEX').y < point('LEFT_KNEE').y),
+            fail("將雙腿抬高", "8.jpg", move(point('LEFT_FOOT_INDEX'), 0, -1)),
+        ], skip=invisible('LEFT_FOOT_INDEX', 'LEFT_KNEE')),
+    }
+
+
+def _cobra(_):
+    nose = point('NOSE')
+    hip, knee = point('LEFT_HIP'), point('LEFT_KNEE')
+    l_foot, r_foot = point('LEFT_FOOT_INDEX'), point('RIGHT_FOOT_INDEX')
+    knee_down = abs(hip.y - knee.y) <= 0.09
+    return {
+        'LEFT_HIP': Rule([
+            ok(between(angle('LEFT_HIP'), 90, 135)),
+            fail("請將肩膀放鬆，身體打直", "2.jpg", move(point('LEFT_SHOULDER'), 1, 0), when=angle('LEFT_HIP') < 90),
+            fail("請盡力將身體撐起並打直，勿駝背", "2.jpg", move(point('LEFT_SHOULDER'), -1, 0)),
+        ], skip=missing('LEFT_HIP')),
+        'LEFT_KNEE': Rule([
+            ok(knee_down & (hip.y <= r_foot.y) & (hip.y <= l_foot.y)),
+            fail("請將雙腳放至地面，勿抬起", "3.jpg", move(r_foot, 0, 1), when=knee_down),
+            fail("請將膝蓋與髖部放至地面，勿抬起", "3.jpg", move(hip, 0, 1)),
+        ], skip=invisible('LEFT_HIP', 'LEFT_KNEE')),
+        'LEFT_EAR': Rule([
+            ok(point('LEFT_EAR').x < nose.x),
+            fail("請目視前方", "4.jpg", move(nose, 1, 0)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+        'LEFT_FOOT_INDEX': Rule([
+            ok(abs(l_foot.y - point('LEFT_ANKLE').y) <= 0.05),
+            fail("請將右腿放至地面，勿抬起", "3.jpg", move(point('LEFT_ANKLE'), 0, 1)),
+        ], skip=invisible('LEFT_FOOT_INDEX', 'LEFT_ANKLE')),
+        'RIGHT_FOOT_INDEX': Rule([
+            ok(abs(r_foot.y - point('RIGHT_ANKLE').y) <= 0.05),
+            fail("請將左腿放至地面，勿抬起", "3.jpg", move(point('RIGHT_ANKLE'), 0, 1)),
+        ], skip=invisible('RIGHT_FOOT_INDEX', 'RIGHT_ANKLE')),
+    }
+
+
+def _half_moon(_):
+    nose = point('NOSE')
+    return {
+        'RIGHT_ELBOW': Rule([
+            ok(between(angle('RIGHT_ELBOW'), 150, 180)),
+            fail("將左手伸直", "3.jpg", move(point('RIGHT_ELBOW'), 0, 1)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'RIGHT_EAR': Rule([
+            ok(nose.y < point('LEFT_EAR').y),
+            fail("請將頭轉向天花板", "4.jpg", move(nose, 0, -1)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+        'LEFT_ELBOW': Rule([
+            ok(between(angle('LEFT_ELBOW'), 150, 180)),
+            fail("將右手伸直", "3.jpg", move(point('LEFT_ELBOW'), 0, -1)),
+        ], skip=missing('LEFT_ELBOW')),
+        'LEFT_HIP': Rule([
+            ok(between(angle('LEFT_HIP'), 80, 105)),
+            fail("將右腿抬高並平行於地面", "6.jpg", move(point('LEFT_KNEE'), 0, -1), when=angle('LEFT_HIP') < 80),
+            fail("將右腿放低並平行於地面", "7.jpg", move(point('LEFT_KNEE'), 0, 1)),
+        ], skip=missing('LEFT_HIP')),
+    }
+
+
+def _boat(_):
+    nose = point('NOSE')
+    knee = point('LEFT_KNEE')
+    leg_up = point('LEFT_HIP').y - knee.y > 0.022
+    return {
+        'LEFT_SHOULDER': Rule([
+            ok(between(angle('LEFT_SHOULDER'), 25, 60)),
+            fail("請將雙手抬高並與地面平行", "2.jpg", move(point('LEFT_ELBOW'), 0, -1), when=angle('LEFT_SHOULDER') < 25),
+            fail("請將雙手放低並與地面平行", "3.jpg", move(point('LEFT_ELBOW'), 0, 1)),
+        ], skip=missing('LEFT_SHOULDER')),
+        'LEFT_ELBOW': Rule([
+            ok(between(angle('LEFT_ELBOW'), 120, 180)),
+            fail("請將右手伸直", "4.jpg", move(point('LEFT_ELBOW'), -1, 0)),
+        ], skip=missing('LEFT_ELBOW')),
+        'LEFT_HIP': Rule([
+            ok(leg_up & between(angle('LEFT_HIP'), 80, 150)),
+            fail("請將腿放低，盡量和身體呈現90度", "5.jpg", move(knee, 0, 1), when=leg_up & (angle('LEFT_HIP') < 80)),
+            fail("請將腿抬高，盡量和身體呈現90度", "6.jpg", move(knee, 0, -1), when=leg_up),
+            fail("請將雙腿抬起", "7.jpg", move(knee, 0, -1)),
+        ], skip=invisible('LEFT_HIP', 'LEFT_KNEE') | (leg_up & missing('LEFT_HIP'))),
+        'LEFT_KNEE': Rule([
+            ok(between(angle('LEFT_KNEE'), 160, 180)),
+            fail("請將右腿伸直", "8.jpg", move(knee, -1, 0)),
+        ], skip=missing('LEFT_KNEE')),
+        'LEFT_EAR': Rule([
+            ok(point('LEFT_EAR').x > nose.x),
+            fail("請目視前方", "9.jpg", move(nose, -1, 0)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+        'RIGHT_ELBOW': Rule([
+            ok(between(angle('RIGHT_ELBOW'), 120, 180)),
+            fail("請將左手伸直", "4.jpg", move(point('RIGHT_ELBOW'), -1, 0)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'RIGHT_KNEE': Rule([
+            ok(between(angle('RIGHT_KNEE'), 160, 180)),
+            fail("請將左腿伸直", "8.jpg", move(point('RIGHT_KNEE'), -1, 0)),
+        ], skip=missing('RIGHT_KNEE')),
+    }
+
+
+def _camel(_):
+    nose = point('NOSE')
+    rules = {
+        'LEFT_ELBOW': Rule([
+            ok(between(angle('LEFT_ELBOW'), 140, 180)),
+            fail("將右手伸直", "2.jpg", move(point('LEFT_ELBOW'), 0, 1)),
+        ], skip=missing('LEFT_ELBOW')),
+        'RIGHT_ELBOW': Rule([
+            ok(between(angle('RIGHT_ELBOW'), 140, 180)),
+            fail("將左手伸直", "6.jpg", move(point('RIGHT_ELBOW'), 0, 1)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'RIGHT_SHOULDER': Rule([
+            ok(angle('RIGHT_SHOULDER') >= 45),
+            fail("將雙手放置的位置往後一些", "7.jpg", move(point('RIGHT_ELBOW'), -1, 0)),
+        ], skip=missing('RIGHT_SHOULDER')),
+        'RIGHT_EAR': Rule([
+            ok(point('RIGHT_EAR').y > nose.y),
+            fail("請將頭向上仰", "8.jpg", move(nose, 0, -1)),
+        ], skip=invisible('RIGHT_EAR', 'NOSE')),
+    }
+    for name in both('HIP'):
+        rules[name] = Rule([
+            ok(between(angle(name), 90, 150)),
+            fail("請將臀部往前推，讓身體再向後仰多一點", "3.jpg", move(point('LEFT_HIP'), 0, 1)),
+        ], skip=missing(name))
+    for name in both('KNEE'):
+        rules[name] = Rule([
+            ok(between(angle(name), 65, 110)),
+            fail("請將臀部往前推，盡量與小腿呈90度", "4.jpg", move(point('LEFT_HIP'), 1, 0), when=angle(name) < 65),
+            fail("請將臀部往後移，盡量與小腿呈90度", "5.jpg", move(point('RIGHT_FOOT_INDEX'), -1, 0)),
+        ], skip=missing(name))
+    return rules
+
+
+def _pigeon(_):
+    nose = point('NOSE')
+    shoulder, hip = point('RIGHT_SHOULDER'), point('RIGHT_HIP')
+    return {
+        'RIGHT_KNEE': Rule([
+            ok(angle('RIGHT_KNEE') >= 140),
+            fail("將左腿伸直並貼齊地面", "2.jpg", move(point('RIGHT_KNEE'), -1, 0)),
+        ], skip=missing('RIGHT_KNEE')),
+        'RIGHT_HIP': Rule([
+            ok(angle('RIGHT_HIP') >= 130),
+            fail("將臀部盡量向下，充分伸展大腿內側", "3.jpg", move(hip, 0, 1)),
+        ], skip=missing('RIGHT_HIP')),
+        'RIGHT_SHOULDER': Rule([
+            ok((abs(shoulder.x - hip.x) <= 0.1) & (shoulder.y < hip.y)),
+            fail("請將身體盡量打直", "4.jpg", move(shoulder, 0, -1)),
+        ], skip=invisible('RIGHT_SHOULDER', 'RIGHT_HIP')),
+        'RIGHT_ELBOW': Rule([
+            ok(between(angle('RIGHT_ELBOW'), 165, 195)),
+            fail("將雙手伸直", "5.jpg", move(point('RIGHT_ELBOW'), 0, 1)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'LEFT_EAR': Rule([
+            ok(point('LEFT_EAR').x < nose.x),
+            fail("請目視前方", "6.jpg", move(nose, 1, 0)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+        'LEFT_KNEE': Rule([
+            ok(point('LEFT_HIP').x < point('LEFT_KNEE').x),
+            fail("請將右腿放到身體前方", "7.jpg", move(point('LEFT_KNEE'), 1, 0)),
+        ], skip=invisible('LEFT_KNEE', 'LEFT_HIP')),
+    }
+
+
+def _fish(_):
+    shoulder, hip = point('LEFT_SHOULDER'), point('LEFT_HIP')
+    center = Point((shoulder.x - hip.x) / 2, (hip.y - shoulder.y) / 2)
+    return {
+        'RIGHT_KNEE': Rule([
+            ok(angle('RIGHT_KNEE') >= 160),
+            fail("請將左腿伸直", "2.jpg", move(point('RIGHT_KNEE'), -1, 0)),
+        ], skip=missing('RIGHT_KNEE')),
+        'LEFT_KNEE': Rule([
+            ok(angle('LEFT_KNEE') >= 160),
+            fail("請將右腿伸直", "3.jpg", move(point('LEFT_KNEE'), -1, 0)),
+        ], skip=missing('LEFT_KNEE')),
+        'LEFT_SHOULDER': Rule([
+            ok(between(angle('LEFT_SHOULDER'), 10, 60)),
+            fail("將腰背拱起", "4.jpg", move(center, 0, -1), when=angle('LEFT_SHOULDER') < 10),
+            fail("勿將腰背過度拱起", "5.jpg", move(center, 0, 1)),
+        ], skip=missing('LEFT_SHOULDER')),
+        'LEFT_MOUTH': Rule([
+            ok(point('LEFT_EYE').y - point('LEFT_MOUTH').y > 0.01),
+            fail("請將頭向後仰，盡量將頭頂貼近地板", "6.jpg", move(point('LEFT_MOUTH'), 0, 1)),
+        ], skip=invisible('LEFT_MOUTH', 'LEFT_EYE')),
+    }
+
+
+def _chair(_):
+    nose = point('NOSE')
+    l_knee, r_knee = point('LEFT_KNEE'), point('RIGHT_KNEE')
+    r_elbow = point('RIGHT_ELBOW')
+    return {
+        'LEFT_KNEE': Rule([
+            ok(between(angle('LEFT_KNEE'), 100, 140)),
+            fail(BluetoothTip("右腿膝蓋彎曲角度太小", "右腿膝蓋彎曲角度太小，請勿將重心偏右"), "2.jpg",
+                 move(l_knee, -1, 0), when=angle('LEFT_KNEE') < 100),
+            fail(BluetoothTip("右腿膝蓋彎曲角度太大", "右腿膝蓋彎曲角度太大，請勿將重心偏左"), "3.jpg", move(l_knee, 1, 0)),
+        ], skip=missing('LEFT_KNEE')),
+        'RIGHT_KNEE': Rule([
+            ok(between(angle('RIGHT_KNEE'), 100, 140)),
+            fail(BluetoothTip("左腿膝蓋彎曲角度太小", "左腿膝蓋彎曲角度太小，請勿將重心偏左"), "4.jpg",
+                 move(r_knee, -1, 0), when=angle('RIGHT_KNEE') < 100),
+            fail(BluetoothTip("左腿膝蓋彎曲角度太大", "左腿膝蓋彎曲角度太大，請勿將重心偏右"), "5.jpg", move(r_knee, 1, 0)),
+        ], skip=missing('RIGHT_KNEE')),
+        'LEFT_ELBOW': Rule([
+            ok(angle('LEFT_ELBOW') >= 150),
+            fail("請將右手伸直", "6.jpg", move(point('LEFT_ELBOW'), 1, -1)),
+        ], skip=missing('LEFT_ELBOW')),
+        'RIGHT_ELBOW': Rule([
+            ok(angle('RIGHT_ELBOW') >= 150),
+            fail("請將左手伸直", "7.jpg", move(r_elbow, 1, -1)),
+        ], skip=missing('RIGHT_ELBOW')),
+        'RIGHT_HIP': Rule([
+            ok(between(angle('RIGHT_HIP'), 65, 110)),
+            fail("左腿臀部彎曲角度太小", "8.jpg", move(point('RIGHT_HIP'), 1, 0), when=angle('RIGHT_HIP') < 65),
+            fail("左腿臀部彎曲角度太大", "9.jpg", move(point('RIGHT_HIP'), -1, 0)),
+        ], skip=missing('RIGHT_HIP')),
+        'RIGHT_SHOULDER': Rule([
+            ok((point('RIGHT_SHOULDER').y - r_elbow.y > 0.05) & (point('LEFT_SHOULDER').y - r_elbow.y > 0.05)),
+            fail("請將雙手舉起，手肘接近頭部", "10.jpg", move(r_elbow, 0, -1)),
+        ], skip=invisible('RIGHT_SHOULDER', 'LEFT_SHOULDER', 'RIGHT_ELBOW')),
+        'LEFT_EAR': Rule([
+            ok(point('LEFT_EAR').x < nose.x),
+            fail("請目視前方", "11.jpg", move(nose, 1, 0)),
+        ], skip=invisible('LEFT_EAR', 'NOSE')),
+    }
+
+
+SIDES = ('LEFT', 'RIGHT')
+
+POSE_RULES = {
+    'Tree Style': PoseRule("image/Tree Style", "8.jpg", "動作正確", _tree),
+    'Warrior2 Style': PoseRule("image/Warrior2 Style", "8.jpg", "動作正確 !", _warrior2),
+    'Plank': PoseRule("image/Plank", "10.jpg", "動作正確", _plank, SIDES, PLANK_SELECT),
+    'Reverse Plank': PoseRule("image/Reverse Plank", "6.jpg", "動作正確", _reverse_plank, SIDES, REVERSE_PLANK_SELECT),
+    "Child's pose": PoseRule("image/Child's pose", "5.jpg", "動作正確 ! ", _childs, SIDES, CHILDS_SELECT),
+    'Downward dog': PoseRule("image/Downward dog", "6.jpg", "動作正確 ! ", _downward_dog, SIDES, DOWNWARD_DOG_SELECT),
+    'Low Lunge': PoseRule("image/Low Lunge", "5.jpg", "動作正確", _low_lunge, SIDES, LOW_LUNGE_SELECT),
+    'Seated Forward Bend': PoseRule("image/Seated Forward Bend", "5.jpg", "動作正確", _seated_forward_bend, SIDES,
+                                    SEATED_FORWARD_BEND_SELECT),
+    'Bridge pose': PoseRule("image/Bridge pose", "5.jpg", "動作正確", _bridge, SIDES, BRIDGE_SELECT),
+    'Pyramid pose': PoseRule("image/Pyramid pose", "6.jpg", "動作正確", _pyramid, SIDES, PYRAMID_SELECT),
+    'Mountain pose': PoseRule("image/Mountain pose", "1.jpg", "動作正確", _mountain),
+    'Triangle pose': PoseRule("image/Triangle pose", "1.jpg", "動作正確", _triangle),
+    'Locust pose': PoseRule("image/Locust pose", "1.jpg", "動作正確", _locust),
+    'Cobra pose': PoseRule("image/Cobra pose", "1.jpg", "動作正確", _cobra),
+    'Half moon pose': PoseRule("image/Half moon pose", "1.jpg", "動作正確", _half_moon),
+    'Boat pose': PoseRule("image/Boat pose", "1.jpg", "動作正確", _boat),
+    'Camel pose': PoseRule("image/Camel pose", "1.jpg", "動作正確", _camel),
+    'Pigeon pose': PoseRule("image/Pigeon pose", "1.jpg", "動作正確", _pigeon),
+    'Fish pose': PoseRule("image/Fish pose", "1.jpg", "動作正確", _fish),
+    'Chair pose': PoseRule("image/Chair pose", "1.jpg", "動作正確", _chair),
+}
+
+
+def get_pose_rule(pose):
+    return POSE_RULES.get(pose)
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+import numpy as np
+
+# 快取最多保存的結果數量
+RESULT_CACHE_SIZE = 256
+# 分數角度量化的間隔 (度)，同一個間隔內的角度視為相同
+ANGLE_BIN = 2.0
+
+
+# 以規則的判斷結果及量化後的分數角度為 key 的 LRU 快取，練習時常常回到相同的姿勢
+# 規則的 branch 是精確的 (所有 predicate 相同)，只有分數在間隔邊界附近是近似值
+class ResultCache:
+    def __init__(self, max_size=RESULT_CACHE_SIZE, angle_bin=ANGLE_BIN):
+        """
+        Args:
+            max_size (int): max number of cached results, the least recently used one is evicted
+            angle_bin (float): quantization step of the score angles in degrees
+        """
+        self.max_size = max_size
+        self.angle_bin = angle_bin
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize(self, angles):
+        """angle vector -> bytes, None when there is no angle"""
+        if angles is None:
+            return None
+        bins = np.floor(np.asarray(angles, dtype=np.float64) / self.angle_bin)
+        return bins.astype(np.int32).tobytes()
+
+    def make_key(self, pose, bits, score_angles):
+        """
+        Args:
+            pose (str): yoga pose name
+            bits (bytes): results of all rule predicates (RuleEngine.predicate_bits), None when the
+                skeleton is incomplete
+            score_angles (numpy array): angles of the score
+        """
+        return pose, bits, self.quantize(score_angles)
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = result
+
+    def clear(self):
+        self.entries.clear()
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
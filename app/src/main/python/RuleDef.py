@@ -0,0 +1,222 @@
+import AngleNodeDef
+import toolkit
+
+# 比較運算子在 (值<0, 值==0, 值>0) 三種情況下是否成立
+OPS = {
+    'lt': (True, False, False),
+    'le': (True, True, False),
+    'eq': (False, True, False),
+    'ge': (False, True, True),
+    'gt': (False, False, True),
+}
+
+MIN = toolkit.MIN_DETECT_VISIBILITY
+D = toolkit.DISPLACEMENT_DISTANCE
+
+
+def _as_linear(value):
+    return value if isinstance(value, Linear) else Linear(const=value)
+
+
+# 特徵的線性組合: sum(coef * feature) + const
+# feature: ('angle', key), ('sample', key), ('point', index, column), ('abs', terms, const)
+class Linear:
+    def __init__(self, terms=None, const=0.0):
+        self.terms = dict(terms) if terms else {}
+        self.const = float(const)
+
+    def __add__(self, other):
+        other = _as_linear(other)
+        terms = dict(self.terms)
+        for feature, coef in other.terms.items():
+            terms[feature] = terms.get(feature, 0.0) + coef
+        return Linear(terms, self.const + other.const)
+
+    __radd__ = __add__
+
+    def __mul__(self, scale):
+        return Linear({feature: coef * scale for feature, coef in self.terms.items()}, self.const * scale)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scale):
+        return self * (1.0 / scale)
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __sub__(self, other):
+        return self + (-_as_linear(other))
+
+    def __rsub__(self, other):
+        return _as_linear(other) - self
+
+    def __abs__(self):
+        return Linear({('abs', tuple(sorted(self.terms.items(), key=repr)), self.const): 1.0})
+
+    # 比較運算子回傳 Condition，例如 angle('LEFT_KNEE') >= 170
+    def __lt__(self, other):
+        return Condition.of(self - other, 'lt')
+
+    def __le__(self, other):
+        return Condition.of(self - other, 'le')
+
+    def __gt__(self, other):
+        return Condition.of(self - other, 'gt')
+
+    def __ge__(self, other):
+        return Condition.of(self - other, 'ge')
+
+
+# 以 OR 連接多個 AND 子句 (DNF)，子句內為 (Linear, op) 與 0 的比較
+class Condition:
+    def __init__(self, clauses):
+        self.clauses = [tuple(clause) for clause in clauses]
+
+    @staticmethod
+    def of(expr, op):
+        return Condition([((expr, op),)])
+
+    def __and__(self, other):
+        return Condition([a + b for a in self.clauses for b in other.clauses])
+
+    def __or__(self, other):
+        return Condition(self.clauses + other.clauses)
+
+
+ALWAYS = Condition([()])
+NEVER = Condition([])
+
+
+class Point:
+    def __init__(self, x, y, z=None, v=None):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.v = v
+
+
+def angle(key):
+    return Linear({('angle', key): 1.0})
+
+
+def sample(key):
+    return Linear({('sample', key): 1.0})
+
+
+def point(name):
+    index = getattr(AngleNodeDef, name)
+    return Point(*[Linear({('point', index, column): 1.0}) for column in range(4)])
+
+
+def midpoint(p1, p2):
+    return Point((p1.x + p2.x) / 2, (p1.y + p2.y) / 2)
+
+
+def missing(key):
+    """angle is -1 (three points are invisible)"""
+    return Condition.of(angle(key) + 1, 'eq')
+
+
+def invisible(*names):
+    """all points are invisible"""
+    condition = ALWAYS
+    for name in names:
+        condition = condition & (point(name).v < MIN)
+    return condition
+
+
+def any_invisible(*names):
+    """at least one point is invisible"""
+    condition = NEVER
+    for name in names:
+        condition = condition | (point(name).v < MIN)
+    return condition
+
+
+# 箭頭 [起點x, 起點y, 終點x, 終點y]，dx, dy 為 DISPLACEMENT_DISTANCE 的倍數
+def move(p, dx, dy):
+    """arrow from the point to the direction (dx, dy)"""
+    return [p.x, p.y, p.x + dx * D, p.y + dy * D]
+
+
+def toward(p, dx, dy):
+    """arrow from the direction (dx, dy) to the point"""
+    return [p.x + dx * D, p.y + dy * D, p.x, p.y]
+
+
+def line(p1, p2):
+    return [p1.x, p1.y, p2.x, p2.y]
+
+
+# 需要依照藍牙連線狀態顯示不同提示
+class BluetoothTip:
+    def __init__(self, zero, other, missing=None):
+        self.zero = zero
+        self.other = other
+        self.missing = missing
+
+    def resolve(self):
+        address = toolkit.readBluetoothAddress()
+        if address == "0":
+            return self.zero
+        if address is None and self.missing is not None:
+            return self.missing
+        return self.other
+
+
+class Branch:
+    def __init__(self, when, ok, tip=None, image=None, arrow=None, side=None):
+        self.when = when
+        self.ok = ok
+        self.tip = tip
+        self.image = image
+        self.arrow = arrow
+        self.side = side
+
+
+def ok(when=ALWAYS):
+    return Branch(when, True)
+
+
+def fail(tip, image=None, arrow=None, when=ALWAYS):
+    return Branch(when, False, tip, image, arrow)
+
+
+def side(name, when):
+    """branch of the side selector rule"""
+    return Branch(when, True, side=name)
+
+
+# 一個關節的規則，由上往下第一個成立的 branch 決定結果
+class Rule:
+    def __init__(self, branches, skip=NEVER, roi=None):
+        """
+        Args:
+            branches (list): ok / fail / side branches, the first matched one is used
+            skip (Condition): skip the rule (keep roi unchanged), e.g. missing(key)
+            roi (tuple): roi keys updated by this rule (default the key of the rule)
+        """
+        self.branches = branches
+        self.skip = skip
+        self.roi = roi
+
+
+# 一個動作的所有規則
+class PoseRule:
+    def __init__(self, folder, default_image, default_tip, rules, sides=(None,), select=None):
+        """
+        Args:
+            folder (str): image folder of the pose
+            default_image (str): image shown when the pose is correct
+            default_tip (str): tip shown when the pose is correct
+            rules (function): rules(side) -> {roi key: Rule}
+            sides (tuple): sides of the pose, (None,) when the pose has no side
+            select (tuple): (roi key, Rule) choosing the side by side branches
+        """
+        self.folder = folder
+        self.default_image = default_image
+        self.default_tip = default_tip
+        self.rules = rules
+        self.sides = sides
+        self.select = select
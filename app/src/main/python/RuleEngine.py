@@ -0,0 +1,375 @@
+import numpy as np
+
+import yogaFileGetter
+from AngleEngine import get_angle_engine
+from LandmarkBuffer import LANDMARK_COUNT, LANDMARK_COLUMNS
+from PoseRuleDef import get_pose_rule
+from RuleDef import OPS, BluetoothTip, Linear
+
+# 短路模式每檢查多少幀依錯誤次數重新排序一次規則
+REORDER_INTERVAL = 30
+# 重新排序後錯誤次數衰減，讓順序跟得上姿勢的改變
+FAILURE_DECAY = 0.5
+
+
+# 把 PoseRuleDef 的規則編譯成矩陣，每一幀只需要幾次 numpy 運算
+class RuleEngine:
+    def __init__(self, pose_rule, roi_keys, angle_keys, sample_angle_dict):
+        """compile pose rules
+
+        Args:
+            pose_rule (PoseRule): rules of the pose, defined in PoseRuleDef.py
+            roi_keys (list): roi keys, rules are checked in this order
+            angle_keys (list): angle keys in the order of AngleEngine.compute
+            sample_angle_dict (dict): sample angle dict, folded into constants
+        """
+        self.folder = pose_rule.folder
+        self.sides = list(pose_rule.sides)
+        self.default_tip = pose_rule.default_tip
+        self.default_image = f"{pose_rule.folder}/{pose_rule.default_image}"
+
+        self.angle_keys = list(angle_keys)
+        self.sample_angle_dict = sample_angle_dict or {}
+        self.angle_column = {key: i for i, key in enumerate(self.angle_keys)}
+        self.base_size = len(self.angle_keys) + LANDMARK_COUNT * LANDMARK_COLUMNS
+
+        self.abs_rows = []
+        self.abs_column = {}
+        self.predicates = []
+        self.clauses = []
+        self.conditions = []
+
+        # 編譯後不再修改，同一個動作的 YogaPose (包含預熱用的) 共用，每一幀的狀態放在 RuleOrder
+        self.__compile_rules(pose_rule, list(roi_keys))
+        self.__build_matrices()
+
+    def __compile_rules(self, pose_rule, roi_keys):
+        rules_by_key = {}
+        if pose_rule.select is not None:
+            key, rule = pose_rule.select
+            rules_by_key.setdefault(key, []).append((-1, rule))
+        for side_index, side in enumerate(self.sides):
+            for key, rule in pose_rule.rules(side).items():
+                rules_by_key.setdefault(key, []).append((side_index if side is not None else -1, rule))
+
+        unknown = [key for key in rules_by_key if key not in roi_keys]
+        if unknown:
+            raise ValueError(f"rule keys not in roi: {unknown}")
+
+        # 依照 roi 順序排列規則，同一個 roi key 的各邊規則相鄰
+        self.rules = []
+        rule_side, rule_skip, rule_start, rule_range = [], [], [], []
+        self.branches = []
+        branch_rule, branch_cond, branch_ok, branch_side = [], [], [], []
+        self.select_rule = -1
+        for key in roi_keys:
+            for side_index, rule in rules_by_key.get(key, []):
+                rule_index = len(self.rules)
+                if pose_rule.select is not None and rule is pose_rule.select[1]:
+                    self.select_rule = rule_index
+                self.rules.append((key, rule.roi if rule.roi is not None else (key,)))
+                rule_side.append(side_index)
+                begin = (len(self.predicates), len(self.clauses), len(self.conditions))
+                rule_skip.append(self.__condition(rule.skip))
+                rule_start.append(len(self.branches))
+                for branch in rule.branches:
+                    branch_rule.append(rule_index)
+                    branch_cond.append(self.__condition(branch.when))
+                    branch_ok.append(branch.ok)
+                    branch_side.append(self.sides.index(branch.side) if branch.side is not None else -1)
+                    self.branches.append(branch)
+                # 每條規則的 predicate / clause / condition 是連續的一段，短路模式只計算這一段
+                rule_range.append(begin + (len(self.predicates), len(self.clauses), len(self.conditions)))
+
+        self.rule_side = np.array(rule_side, dtype=np.intp)
+        self.rule_skip = np.array(rule_skip, dtype=np.intp)
+        self.rule_start = np.array(rule_start, dtype=np.intp)
+        self.rule_end = np.append(self.rule_start[1:], len(self.branches)).astype(np.intp)
+        self.rule_range = rule_range
+        self.branch_rule = np.array(branch_rule, dtype=np.intp)
+        self.branch_cond = np.array(branch_cond, dtype=np.intp)
+        self.branch_ok = np.array(branch_ok, dtype=bool)
+        self.branch_side = np.array(branch_side, dtype=np.intp)
+
+        # 箭頭只在被選到時計算，先編譯成 (4, base) 矩陣
+        self.arrows = [None if branch.arrow is None else self.__arrow(branch.arrow) for branch in self.branches]
+
+    def __linear(self, expr, allow_abs=True):
+        """convert Linear to ({column: coef}, const), sample angles are folded into const"""
+        row = {}
+        const = expr.const
+        for feature, coef in expr.terms.items():
+            kind = feature[0]
+            if kind == 'angle':
+                if feature[1] not in self.angle_column:
+                    raise KeyError(f"angle {feature[1]} is not defined for the pose")
+                column = self.angle_column[feature[1]]
+            elif kind == 'point':
+                column = len(self.angle_keys) + feature[1] * LANDMARK_COLUMNS + feature[2]
+            elif kind == 'sample':
+                if feature[1] not in self.sample_angle_dict:
+                    raise KeyError(f"sample angle {feature[1]} is not found")
+                const += coef * self.sample_angle_dict[feature[1]]
+                continue
+            elif kind == 'abs' and allow_abs:
+                column = self.abs_column.get(feature)
+                if column is None:
+                    self.abs_rows.append(self.__linear(Linear(dict(feature[1]), feature[2]), allow_abs=False))
+                    column = self.base_size + len(self.abs_rows) - 1
+                    self.abs_column[feature] = column
+            else:
+                raise ValueError(f"unsupported feature {feature}")
+            row[column] = row.get(column, 0.0) + coef
+        return row, const
+
+    def __condition(self, condition):
+        clauses = []
+        for clause in condition.clauses:
+            predicates = []
+            for expr, op in clause:
+                row, const = self.__linear(expr)
+                predicates.append(len(self.predicates))
+                self.predicates.append((row, const, op))
+            clauses.append(len(self.clauses))
+            self.clauses.append(predicates)
+        self.conditions.append(clauses)
+        return len(self.conditions) - 1
+
+    def __arrow(self, arrow):
+        rows = [self.__linear(value, allow_abs=False) for value in arrow]
+        matrix = np.zeros((len(rows), self.base_size))
+        for i, (row, _) in enumerate(rows):
+            for column, coef in row.items():
+                matrix[i, column] = coef
+        return matrix, np.array([const for _, const in rows])
+
+    def __build_matrices(self):
+        feature_size = self.base_size + len(self.abs_rows)
+
+        self.abs_matrix = np.zeros((len(self.abs_rows), self.base_size))
+        self.abs_const = np.zeros(len(self.abs_rows))
+        for i, (row, const) in enumerate(self.abs_rows):
+            for column, coef in row.items():
+                self.abs_matrix[i, column] = coef
+            self.abs_const[i] = const
+
+        self.pred_matrix = np.zeros((len(self.predicates), feature_size))
+        self.pred_const = np.zeros(len(self.predicates))
+        ops = np.zeros((len(self.predicates), 3), dtype=bool)
+        for i, (row, const, op) in enumerate(self.predicates):
+            for column, coef in row.items():
+                self.pred_matrix[i, column] = coef
+            self.pred_const[i] = const
+            ops[i] = OPS[op]
+        self.pred_lt, self.pred_eq, self.pred_gt = ops[:, 0], ops[:, 1], ops[:, 2]
+
+        # clause: 所有 predicate 成立；condition: 任一 clause 成立
+        self.clause_matrix = np.zeros((len(self.clauses), len(self.predicates)), dtype=bool)
+        for i, predicates in enumerate(self.clauses):
+            self.clause_matrix[i, predicates] = True
+        self.cond_matrix = np.zeros((len(self.conditions), len(self.clauses)), dtype=bool)
+        for i, clauses in enumerate(self.conditions):
+            self.cond_matrix[i, clauses] = True
+
+    def features(self, angles, landmarks):
+        """build the feature vector [angles, landmarks, abs features]
+
+        Args:
+            angles (numpy array): angles in the order of angle_keys, -1 for invisible joints
+            landmarks (numpy array): (33, 4) landmarks
+
+        Returns:
+            base (numpy array): angles and landmarks
+            features (numpy array): base and abs features
+        """
+        landmarks = np.asarray(landmarks, dtype=np.float64)[:LANDMARK_COUNT, :LANDMARK_COLUMNS]
+        base = np.concatenate((np.asarray(angles, dtype=np.float64), landmarks.ravel()))
+        return base, np.concatenate((base, np.abs(self.abs_matrix @ base + self.abs_const)))
+
+    def check_predicates(self, features):
+        values = self.pred_matrix @ features + self.pred_const
+        return ((values < 0) & self.pred_lt) | ((values == 0) & self.pred_eq) | ((values > 0) & self.pred_gt)
+
+    def check_conditions(self, features):
+        passed = self.check_predicates(features)
+        clause_true = ~(self.clause_matrix @ ~passed)
+        return self.cond_matrix @ clause_true
+
+    def select_branches(self, condition):
+        """choose the first matched branch of every rule
+
+        Returns:
+            selected (numpy array): branch index of every rule, -1 when no branch matched
+            evaluated (numpy array): the rule is active (side matched) and not skipped
+        """
+        hit = condition[self.branch_cond]
+        count = np.cumsum(hit)
+        before = (count - hit)[self.rule_start][self.branch_rule]
+        first = np.flatnonzero(hit & (count - before == 1))
+        selected = np.full(len(self.rules), -1, dtype=np.intp)
+        selected[self.branch_rule[first]] = first
+
+        evaluated = (selected >= 0) & ~condition[self.rule_skip]
+        if self.select_rule >= 0:
+            side = self.branch_side[selected[self.select_rule]] if evaluated[self.select_rule] else -1
+            evaluated &= (self.rule_side == -1) | (self.rule_side == side)
+            if side == -1:
+                evaluated &= np.arange(len(self.rules)) == self.select_rule
+        return selected, evaluated
+
+    def evaluate(self, angles, landmarks, roi=None):
+        """check all rules of the pose
+
+        Args:
+            angles (numpy array): angles in the order of angle_keys, -1 for invisible joints
+            landmarks (numpy array): (33, 4) landmarks
+            roi (dict): region of interesting joint, updated in place when given
+
+        Returns:
+            branch (int): branch of the first wrong joint in roi order, -1 when the pose is correct
+            result (tuple): tips of the first wrong joint, imagePath and
+                pointsOut (arrow [start x, start y, end x, end y] or [])
+        """
+        base, features = self.features(angles, landmarks)
+        selected, evaluated = self.select_branches(self.check_conditions(features))
+        passed = self.branch_ok[selected] & evaluated
+
+        if roi is not None:
+            for rule_index in np.flatnonzero(evaluated):
+                for key in self.rules[rule_index][1]:
+                    roi[key] = bool(passed[rule_index])
+
+        wrong = np.flatnonzero(evaluated & ~passed)
+        branch = int(selected[wrong[0]]) if len(wrong) > 0 else -1
+        return branch, self.result(branch, base)
+
+    def check_rule(self, rule_index, features):
+        """check one rule only
+
+        Returns:
+            branch (int): selected branch index, -1 when the rule is skipped or no branch matched
+        """
+        p0, k0, q0, p1, k1, q1 = self.rule_range[rule_index]
+        values = self.pred_matrix[p0:p1] @ features + self.pred_const[p0:p1]
+        passed = (((values < 0) & self.pred_lt[p0:p1]) | ((values == 0) & self.pred_eq[p0:p1])
+                  | ((values > 0) & self.pred_gt[p0:p1]))
+        clause_true = ~(self.clause_matrix[k0:k1, p0:p1] @ ~passed)
+        condition = self.cond_matrix[q0:q1, k0:k1] @ clause_true
+        if condition[self.rule_skip[rule_index] - q0]:
+            return -1
+        start, end = self.rule_start[rule_index], self.rule_end[rule_index]
+        hit = np.flatnonzero(condition[self.branch_cond[start:end] - q0])
+        return start + hit[0] if len(hit) else -1
+
+    def new_order(self):
+        """check order of the short circuit mode, one for every YogaPose"""
+        return RuleOrder(len(self.rules))
+
+    def evaluate_first(self, angles, landmarks, order):
+        """short circuit mode, only find the tip of the first wrong joint in roi order
+
+        Rules that failed often are checked first. Once a wrong rule is found,
+        only rules before it in roi order are still checked, so the result is the
+        same as evaluate(). roi is not updated, call evaluate() when it is needed.
+
+        Args:
+            angles (numpy array): angles in the order of angle_keys, -1 for invisible joints
+            landmarks (numpy array): (33, 4) landmarks
+            order (RuleOrder): check order from new_order, updated with the failed rules
+
+        Returns:
+            branch (int)
+            result (tuple): tips, imagePath and pointsOut, see evaluate
+        """
+        base, features = self.features(angles, landmarks)
+        branch = self.find_first(features, order)
+        return branch, self.result(branch, base)
+
+    def find_first(self, features, order):
+        """branch index of the first wrong rule in roi order, -1 when the pose is correct"""
+        wrong_rule, wrong_branch = len(self.rules), -1
+        side = -1
+        check_others = True
+        if self.select_rule >= 0:
+            branch = self.check_rule(self.select_rule, features)
+            order.checked_rules += 1
+            if branch < 0 or not self.branch_ok[branch]:
+                # 選擇規則沒有選到 branch (-1) 或選到錯誤的 branch 時就是結果，不檢查其他規則
+                wrong_branch = branch
+                check_others = False
+            else:
+                side = self.branch_side[branch]
+
+        if check_others:
+            for rule_index in order.order:
+                # 只需要確認 roi 順序在目前錯誤之前的規則
+                if rule_index >= wrong_rule or rule_index == self.select_rule:
+                    continue
+                if self.rule_side[rule_index] != -1 and self.rule_side[rule_index] != side:
+                    continue
+                branch = self.check_rule(rule_index, features)
+                order.checked_rules += 1
+                if branch >= 0 and not self.branch_ok[branch]:
+                    wrong_rule, wrong_branch = rule_index, branch
+
+        # 每一幀都要計數，選擇規則失敗的幀也一樣，重新排序才會照 REORDER_INTERVAL 進行
+        # 選擇規則永遠最先檢查，不需要計算它的錯誤次數
+        order.frame_count += 1
+        if wrong_rule < len(self.rules):
+            order.fail_count[wrong_rule] += 1
+        if order.frame_count % REORDER_INTERVAL == 0:
+            order.reorder()
+        return wrong_branch
+
+    def predicate_bits(self, features):
+        """results of all predicates (angles and landmark positions), packed as bytes
+
+        They alone decide which branch is chosen, frames with the same bits get the same branch.
+        """
+        return np.packbits(self.check_predicates(features)).tobytes()
+
+    def result(self, branch_index, base):
+        """tips, imagePath and pointsOut of a branch, -1 for the correct pose"""
+        if branch_index < 0:
+            return self.default_tip, self.default_image, []
+        return self.branch_result(branch_index, base)
+
+    def branch_result(self, branch_index, base):
+        branch = self.branches[branch_index]
+        tips = branch.tip.resolve() if isinstance(branch.tip, BluetoothTip) else branch.tip
+        imagePath = f"{self.folder}/{branch.image}" if branch.image is not None else self.default_image
+        arrow = self.arrows[branch_index]
+        pointsOut = [] if arrow is None else (arrow[0] @ base + arrow[1]).tolist()
+        return tips, imagePath, pointsOut
+
+
+# 短路模式的檢查順序，常出錯的規則先檢查
+class RuleOrder:
+    def __init__(self, rule_count):
+        self.fail_count = np.zeros(rule_count)
+        self.order = list(range(rule_count))
+        self.frame_count = 0
+        self.checked_rules = 0
+
+    def reorder(self):
+        """sort rules by observed failure count, ties keep roi order"""
+        self.order = sorted(range(len(self.fail_count)),
+                            key=lambda rule_index: (-self.fail_count[rule_index], rule_index))
+        self.fail_count *= FAILURE_DECAY
+
+
+# 每個動作的 RuleEngine 只編譯一次
+_engines = {}
+
+
+def get_rule_engine(pose):
+    engine = _engines.get(pose)
+    if engine is None:
+        pose_rule = get_pose_rule(pose)
+        angle_engine = get_angle_engine(pose)
+        if pose_rule is None or angle_engine is None:
+            return None
+        engine = RuleEngine(pose_rule, yogaFileGetter.get_roi(pose).keys(), angle_engine.keys,
+                            yogaFileGetter.get_sample_angle_dict(pose))
+        _engines[pose] = engine
+    return engine
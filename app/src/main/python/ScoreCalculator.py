@@ -1,11 +1,19 @@
 
+import YogaLogger as log
+import YogaTracer as trace
 from AngleCalculator import calculate_angle, calculate_angle_in_andriodStudio
+from LandmarkBuffer import to_landmark_array
+from MotionGate import MotionGate
 from yogaFileGetter import get_sample_score_angle_dict, get_std_angle_dict, get_weight_angle_dict
 
+TAG = "ScoreCalculator"
+
 
 class ScoreCalculator:
-    def __init__(self, pose_name):
+    def __init__(self, pose_name, motion_epsilon=None):
         self.pose_name = pose_name
+        # motion_epsilon 不是 None 時，骨架幾乎沒動就沿用上一次的分數
+        self.motion_gate = MotionGate(motion_epsilon) if motion_epsilon is not None else None
 
         self.average_angle_dict = get_sample_score_angle_dict(pose_name)
         self.std_angle_dict = get_std_angle_dict(pose_name)
@@ -14,10 +22,27 @@ class ScoreCalculator:
         self.score_dict = {}
 
     def calculate_score(self, point3d, is_android_studio):
-        if is_android_studio:
-            input_angle = calculate_angle_in_andriodStudio(self.pose_name, point3d)
+        if self.motion_gate is None:
+            score = self.__calculate_score(point3d, is_android_studio)
+            log.record_frame(TAG, pose=self.pose_name, score=score, via="score")
+            return score
+
+        landmarks = to_landmark_array(point3d)
+        score = self.motion_gate.check(landmarks)
+        if score is None:
+            score = self.__calculate_score(landmarks, is_android_studio)
+            self.motion_gate.update((landmarks,), score)
+            log.record_frame(TAG, pose=self.pose_name, score=score, via="score")
         else:
-            input_angle = calculate_angle(self.pose_name, point3d)
+            log.record_frame(TAG, pose=self.pose_name, score=score, via="motion")
+        return score
+
+    def __calculate_score(self, point3d, is_android_studio):
+        with trace.span("score.angles"):
+            if is_android_studio:
+                input_angle = calculate_angle_in_andriodStudio(self.pose_name, point3d)
+            else:
+                input_angle = calculate_angle(self.pose_name, point3d)
 
         self.score_dict = {}
         for joint, input_value in input_angle.items():
@@ -45,5 +70,6 @@ class ScoreCalculator:
 
         # 計算平均值
         average_value = sum_score / max_score
+        log.debug(TAG, "%s joint scores %s", self.pose_name, self.score_dict)
 
         return int(average_value)
\ No newline at end of file
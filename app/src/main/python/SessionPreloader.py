@@ -0,0 +1,135 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import YogaLogger as log
+from LazyImport import load
+from YogaSession import YogaSession
+
+TAG = "SessionPreloader"
+
+# 最多保留幾個準備好但還沒使用的 session
+MAX_READY_SESSIONS = 3
+
+
+def dummy_landmarks():
+    """a standing skeleton used to run the first frame before the camera starts"""
+    landmarks = np.zeros((33, 4), dtype=np.float32)
+    landmarks[:, 0] = np.where(np.arange(33) % 2 == 0, 0.45, 0.55)
+    landmarks[:, 1] = np.linspace(0.1, 0.95, 33)
+    landmarks[:, 3] = 1.0
+    return landmarks.ravel()
+
+
+def warm_up(session):
+    """run a dummy frame through the session, then clear its per-frame state"""
+    landmarks = dummy_landmarks()
+    session.process_frame(landmarks, landmarks)
+    session.reset()
+    return session
+
+
+# 在背景執行緒建立接下來要做的動作的 YogaSession，切換動作時直接取用
+class SessionPreloader:
+    def __init__(self, max_ready=MAX_READY_SESSIONS):
+        self.max_ready = max_ready
+        self.condition = threading.Condition()
+        # 等待建立的動作
+        self.queue = []
+        # 正在建立的動作
+        self.building = None
+        # 已經建立好的 session: {pose: YogaSession}
+        self.ready = OrderedDict()
+        # 背景執行緒是否還會處理 queue
+        self.running = False
+        # clear 之後遞增，清除前開始建立的 session 不會放進 ready
+        self.generation = 0
+
+    def preload(self, pose_names):
+        """build and warm up sessions of the upcoming poses on a background thread
+
+        Args:
+            pose_names (list): pose names in the order they will be used
+        """
+        with self.condition:
+            for pose_name in pose_names:
+                pose_name = str(pose_name)
+                if pose_name in self.ready or pose_name == self.building or pose_name in self.queue:
+                    continue
+                self.queue.append(pose_name)
+            if self.queue and not self.running:
+                self.running = True
+                threading.Thread(target=self.__run, name=TAG, daemon=True).start()
+
+    def __run(self):
+        while True:
+            with self.condition:
+                if not self.queue:
+                    self.building = None
+                    self.running = False
+                    self.condition.notify_all()
+                    return
+                pose_name = self.queue.pop(0)
+                self.building = pose_name
+                generation = self.generation
+
+            session = None
+            try:
+                # cv2 與共用的快取 (catalog, AngleEngine, RuleEngine) 在這裡第一次建立
+                load("cv2")
+                session = warm_up(YogaSession(pose_name))
+            except Exception as e:
+                log.error(TAG, "preload %s failed: %s", pose_name, e)
+
+            with self.condition:
+                if session is not None and generation == self.generation:
+                    self.ready[pose_name] = session
+                    while len(self.ready) > self.max_ready:
+                        self.ready.popitem(last=False)
+                self.building = None
+                self.condition.notify_all()
+
+    def take(self, pose_name, timeout=None):
+        """hand over the preloaded session, waiting if it is being built
+
+        Args:
+            pose_name (str): yoga pose name
+            timeout (float): max seconds to wait for a session being built, None to wait until it is done
+
+        Returns:
+            session (YogaSession): a new session is built here when the pose was not preloaded
+        """
+        with self.condition:
+            if pose_name in self.queue or pose_name == self.building:
+                self.condition.wait_for(lambda: pose_name in self.ready or
+                                        (pose_name not in self.queue and pose_name != self.building), timeout)
+            session = self.ready.pop(pose_name, None)
+        if session is None:
+            log.info(TAG, "%s was not preloaded", pose_name)
+            session = YogaSession(pose_name)
+        return session
+
+    def clear(self):
+        """drop the queued and ready sessions, the session being built is dropped when done"""
+        with self.condition:
+            self.queue.clear()
+            self.ready.clear()
+            self.generation += 1
+
+
+_preloader = SessionPreloader()
+
+
+def preload_sessions(pose_names):
+    """called from Kotlin with the upcoming poses of the training plan"""
+    _preloader.preload(list(pose_names))
+
+
+def take_session(pose_name):
+    """called from Kotlin when the pose screen opens, replaces YogaSession(pose_name)"""
+    return _preloader.take(str(pose_name))
+
+
+def clear_sessions():
+    _preloader.clear()
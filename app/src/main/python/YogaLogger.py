@@ -0,0 +1,116 @@
+import json
+import time
+from collections import deque
+
+# 記錄等級，低於目前等級的訊息直接略過 (不會組字串也不會寫到 logcat)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+# 最近幾幀的判斷結果保留數量
+FRAME_LOG_SIZE = 120
+
+_level = WARNING
+_frames = deque(maxlen=FRAME_LOG_SIZE)
+
+
+def set_level(level):
+    """
+    Args:
+        level (int or str): DEBUG, INFO, WARNING, ERROR or OFF
+    """
+    global _level
+    if isinstance(level, str):
+        level = globals()[level.upper()]
+    _level = level
+
+
+def get_level():
+    return _level
+
+
+def is_enabled(level):
+    """check it before building an expensive message"""
+    return level >= _level
+
+
+def log(level, tag, message, *args):
+    """write a message to stdout (logcat under Chaquopy)
+
+    Args:
+        level (int): message level
+        tag (str): module name
+        message (str): %-style format string, only formatted when the level is enabled
+        args: format arguments
+    """
+    if level < _level:
+        return
+    if args:
+        message = message % args
+    print(f"[{LEVEL_NAMES.get(level, level)}] {tag}: {message}")
+
+
+def debug(tag, message, *args):
+    if DEBUG >= _level:
+        log(DEBUG, tag, message, *args)
+
+
+def info(tag, message, *args):
+    if INFO >= _level:
+        log(INFO, tag, message, *args)
+
+
+def warning(tag, message, *args):
+    if WARNING >= _level:
+        log(WARNING, tag, message, *args)
+
+
+def error(tag, message, *args):
+    if ERROR >= _level:
+        log(ERROR, tag, message, *args)
+
+
+def set_frame_log_size(size):
+    """change the size of the recent frame buffer, 0 to disable it"""
+    global _frames
+    _frames = deque(_frames, maxlen=size) if size else None
+
+
+def record_frame(source, **fields):
+    """keep a decision of the current frame in the ring buffer
+
+    Args:
+        source (str): module name
+        fields: values of the decision, e.g. pose, branch, tips, score
+    """
+    if _frames is not None:
+        _frames.append((time.time(), source, fields))
+
+
+def get_frames():
+    """
+    Returns:
+        frames (list): recent decisions [{"time", "source", ...fields}], the oldest first
+    """
+    if _frames is None:
+        return []
+    frames = []
+    for timestamp, source, fields in _frames:
+        frame = {"time": timestamp, "source": source}
+        frame.update(fields)
+        frames.append(frame)
+    return frames
+
+
+def dump_frames():
+    """recent decisions as a json string, called from Kotlin when reporting a problem"""
+    return json.dumps(get_frames(), ensure_ascii=False, default=str)
+
+
+def clear_frames():
+    if _frames is not None:
+        _frames.clear()
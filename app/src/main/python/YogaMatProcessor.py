@@ -1,50 +1,144 @@
-from FeetData import FeetData
+from FeetData import CONTACT_COLUMNS, CONTACT_ON_MAT, CONTACT_VISIBILITY, FeetData, is_on_mat
 import AngleNodeDef
-import cv2
 import numpy as np
 
+import YogaTracer as trace
+from LandmarkBuffer import to_landmark_array
+from LazyImport import lazy_import
 from YogaMatRangeGetter import YogaMatRangeGetter
 
+cv2 = lazy_import("cv2")
+
+# 會接觸瑜珈墊的關節點 (手腕、食指、膝蓋、腳跟、腳尖)
+CONTACT_LANDMARKS = (AngleNodeDef.LEFT_WRIST, AngleNodeDef.RIGHT_WRIST,
+                     AngleNodeDef.LEFT_INDEX, AngleNodeDef.RIGHT_INDEX,
+                     AngleNodeDef.LEFT_KNEE, AngleNodeDef.RIGHT_KNEE,
+                     AngleNodeDef.LEFT_HEEL, AngleNodeDef.RIGHT_HEEL,
+                     AngleNodeDef.LEFT_FOOT_INDEX, AngleNodeDef.RIGHT_FOOT_INDEX)
+
+# 齊次座標 w 小於此值時與 cv2.perspectiveTransform 相同，輸出 0
+PERSPECTIVE_EPS = np.finfo(np.float32).eps
+
+
+def perspective_matrix(src, dst):
+    """3x3 homography mapping 4 src points to 4 dst points, same as cv2.getPerspectiveTransform
+
+    Args:
+        src (numpy array): (4, 2) points
+        dst (numpy array): (4, 2) points
+
+    Returns:
+        matrix (numpy array): (3, 3) float64, matrix[2, 2] is 1
+    """
+    src = np.asarray(src, dtype=np.float64).reshape(4, 2)
+    dst = np.asarray(dst, dtype=np.float64).reshape(4, 2)
+    a = np.zeros((8, 8))
+    a[:4, 0:2] = src
+    a[:4, 2] = 1
+    a[:4, 6:8] = -src * dst[:, 0:1]
+    a[4:, 3:5] = src
+    a[4:, 5] = 1
+    a[4:, 6:8] = -src * dst[:, 1:2]
+    h = np.linalg.solve(a, np.concatenate((dst[:, 0], dst[:, 1])))
+    return np.append(h, 1.0).reshape(3, 3)
+
+
+def perspective_transform(points, matrix, out=None, homogeneous=None):
+    """apply a homography to a batch of points in one matrix multiply
+
+    Args:
+        points (numpy array): (n, 2) points
+        matrix (numpy array): (3, 3) homography
+        out (numpy array): (n, 2) float32 buffer reused between frames, allocated when None
+        homogeneous (numpy array): (n, 3) float64 work buffer whose last column is 1, allocated when None
+
+    Returns:
+        out (numpy array): (n, 2) float32 transformed points
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    if out is None:
+        out = np.empty((len(points), 2), dtype=np.float32)
+    if homogeneous is None:
+        homogeneous = np.ones((len(points), 3))
+    homogeneous[:, :2] = points
+    projected = homogeneous @ np.asarray(matrix, dtype=np.float64).T
+    w = projected[:, 2:3]
+    if np.abs(w).min(initial=np.inf) <= PERSPECTIVE_EPS:
+        valid = np.abs(w) > PERSPECTIVE_EPS
+        projected[:, :2] = np.where(valid, projected[:, :2], 0.0)
+        w = np.where(valid, w, 1.0)
+    np.divide(projected[:, :2], w, out=out, casting='unsafe')
+    return out
+
 
 # 負責將人體骨架的腳座標點，轉換成瑜珈墊上面的點
 # 轉至技術介紹: https://blog.csdn.net/guduruyu/article/details/72518340
 class YogaMatProcessor:
-    def __init__(self, use_default_matrix=True):
+    def __init__(self, use_default_matrix=True, contact_landmarks=CONTACT_LANDMARKS):
         # 鏡頭的座標位置
         self.camera_flat_points = np.array([[1, 1], [0, 1], [0, 0], [1, 0]], dtype=np.float32)
         # 預設瑜珈墊在鏡頭的座標
-        default_mat_point = np.array([[0.9, 0.97],
-                                      [0.1, 0.97],
-                                      [0.15, 0.76],
-                                      [0.85, 0.76]], dtype=np.float32)
+        self.default_mat_point = np.array([[0.9, 0.97],
+                                           [0.1, 0.97],
+                                           [0.15, 0.76],
+                                           [0.85, 0.76]], dtype=np.float32)
 
         # 使用預設的轉至矩陣
         self.use_default_matrix = use_default_matrix
         # 轉換矩陣
-        self.transform_matrix = cv2.getPerspectiveTransform(default_mat_point,
-                                                            self.camera_flat_points)
+        self.transform_matrix = perspective_matrix(self.default_mat_point, self.camera_flat_points)
+        # transform_point 重複使用的 buffer
+        self.point_buffer = np.empty((0, 2), dtype=np.float32)
+        self.homogeneous_buffer = np.ones((0, 3))
+        # 要投影到瑜珈墊的關節點，一定包含兩個腳跟
+        contact_landmarks = list(contact_landmarks)
+        for heel in (AngleNodeDef.LEFT_HEEL, AngleNodeDef.RIGHT_HEEL):
+            if heel not in contact_landmarks:
+                contact_landmarks.append(heel)
+        self.contact_landmarks = tuple(contact_landmarks)
+        self.heel_rows = [self.contact_landmarks.index(AngleNodeDef.LEFT_HEEL),
+                          self.contact_landmarks.index(AngleNodeDef.RIGHT_HEEL)]
         self.feet_data = FeetData()
 
     # 產生腳的資料
     def generate_feet_data(self, r_point2d, r_point3d):
         # 將骨架資料根據 python 格式進行轉換
-        point2d, point3d = self.__handle_skeleton_point(r_point2d, r_point3d)
+        with trace.span("feet.landmarks"):
+            point2d, point3d = self.__handle_skeleton_point(r_point2d, r_point3d)
+            landmarks = to_landmark_array(r_point2d)
 
         # 檢查骨架是否為空
         if self.__contain_point(point2d, point3d):
-            # 取得腳的 2d 座標
-            feet_points = self.__get_feet_points(point2d)
-            # 將腳的座標進行轉換
-            transform_points = self.transform_point(feet_points)
+            # 所有接觸點一次轉換，腳跟從裡面取出
+            with trace.span("feet.transform"):
+                contacts = self.generate_contacts(landmarks)
 
             # 創建腳的資料
-            left_feet, right_feet = transform_points[0], transform_points[1]
+            left_feet, right_feet = contacts[self.heel_rows[0], :2], contacts[self.heel_rows[1], :2]
             self.feet_data.set_point(left_feet, right_feet)
+            self.feet_data.set_contacts(contacts, self.contact_landmarks)
         else:
             self.feet_data.set_point(None, None)
+            self.feet_data.set_contacts(np.zeros((0, CONTACT_COLUMNS), dtype=np.float32), ())
 
         return self.feet_data.to_dict()
 
+    # 將手、膝蓋、腳等接觸點轉換到瑜珈墊上面
+    def generate_contacts(self, landmarks):
+        """
+        Args:
+            landmarks: mediapipe landmarks, any format of to_landmark_array
+
+        Returns:
+            contacts (numpy array): (n, 4) float32 [x, y, on_mat, visibility] in the order of contact_landmarks
+        """
+        landmarks = to_landmark_array(landmarks)
+        contacts = np.empty((len(self.contact_landmarks), CONTACT_COLUMNS), dtype=np.float32)
+        points = self.transform_landmarks(landmarks, self.contact_landmarks, out=contacts[:, :2])
+        contacts[:, CONTACT_ON_MAT] = is_on_mat(points)
+        contacts[:, CONTACT_VISIBILITY] = landmarks[self.contact_landmarks, 3] if landmarks.shape[1] > 3 else 1.0
+        return contacts
+
     # 產稱瑜珈墊的轉至矩陣
     def generate_transform_matrix_with_image(self, image):
         range_getter = YogaMatRangeGetter()
@@ -62,17 +156,40 @@ class YogaMatProcessor:
             self.transform_matrix = transform_matrix
 
     # 將鏡頭中的座標點，轉換到瑜珈墊上面
-    def transform_point(self, input_points):
-        transformed_points = [
-            cv2.perspectiveTransform(np.array([np.float32([p])]), self.transform_matrix)[0][0] for p
-            in input_points]
-
-        return transformed_points
+    def transform_point(self, input_points, out=None):
+        """
+        Args:
+            input_points (numpy array): (n, 2) camera coordinates
+            out (numpy array): (n, 2) float32 output buffer, default a buffer owned by the processor
+
+        Returns:
+            points (numpy array): (n, 2) mat coordinates, the default buffer is overwritten by the next call
+        """
+        if len(self.homogeneous_buffer) != len(input_points):
+            self.point_buffer = np.empty((len(input_points), 2), dtype=np.float32)
+            self.homogeneous_buffer = np.ones((len(input_points), 3))
+        if out is None:
+            out = self.point_buffer
+        return perspective_transform(input_points, self.transform_matrix, out, self.homogeneous_buffer)
+
+    # 將骨架中任意關節點轉換到瑜珈墊上面
+    def transform_landmarks(self, landmarks, indices, out=None):
+        """
+        Args:
+            landmarks: mediapipe landmarks, any format of to_landmark_array
+            indices (list): landmark indices defined in AngleNodeDef.py
+            out (numpy array): (len(indices), 2) float32 output buffer
+
+        Returns:
+            points (numpy array): (len(indices), 2) mat coordinates
+        """
+        points = to_landmark_array(landmarks)[indices, :2]
+        return self.transform_point(points, out)
 
     # 將骨架資料根據 python 格式進行轉換
     def __handle_skeleton_point(self, r_point2d, r_point3d):
-        point3d = [[r_point3d.get(i).get(j) for j in range(3)] for i in range(r_point3d.size())]
-        point2d = [[r_point2d.get(i).get(j) for j in range(2)] for i in range(r_point2d.size())]
+        point3d = to_landmark_array(r_point3d)[:, :3]
+        point2d = to_landmark_array(r_point2d)[:, :2]
 
         return point2d, point3d
 
@@ -80,11 +197,6 @@ class YogaMatProcessor:
     def __contain_point(self, point2d, point3d):
         return not isinstance(point2d, int) and not isinstance(point3d, int)
 
-    # 從 MediaPipe 的點中，取得在鏡頭中腳的點
-    def __get_feet_points(self, point2d):
-        return [[point2d[AngleNodeDef.LEFT_HEEL][0], point2d[AngleNodeDef.LEFT_HEEL][1]],
-                [point2d[AngleNodeDef.RIGHT_HEEL][0], point2d[AngleNodeDef.RIGHT_HEEL][1]]]
-
     # 取得腳的資料
     def get_left_foot_x(self):
         # 取得 left_foot 的 x 座標
@@ -100,4 +212,9 @@ class YogaMatProcessor:
 
     def get_right_foot_y(self):
         # 取得 right_foot 的 y 座標
-        return self.feet_data.right_foot[1] if self.feet_data.right_foot is not None else - 999999
\ No newline at end of file
+        return self.feet_data.right_foot[1] if self.feet_data.right_foot is not None else - 999999
+
+    def get_contacts(self):
+        # 取得所有接觸點 [[landmark, x, y, on_mat, visibility], ...]
+        return [[landmark] + contact.tolist()
+                for landmark, contact in zip(self.feet_data.contact_landmarks, self.feet_data.contacts)]
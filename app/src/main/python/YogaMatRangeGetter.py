@@ -1,6 +1,9 @@
-import cv2
 import numpy as np
 
+from LazyImport import lazy_import
+
+cv2 = lazy_import("cv2")
+
 
 # 偵測場景中的瑜珈墊座標
 class YogaMatRangeGetter:
@@ -0,0 +1,117 @@
+import heatmap
+import YogaLogger as log
+import YogaTracer as trace
+from AngleEngine import get_angle_engine
+from LandmarkBuffer import to_landmark_array
+from MotionGate import MOTION_EPSILON
+from ResultCache import ANGLE_BIN, ResultCache
+from ScoreCalculator import ScoreCalculator
+from YogaMatProcessor import YogaMatProcessor
+from yogaPoseDetect import YogaPose
+
+TAG = "YogaSession"
+
+
+# 一個動作的練習階段，每一幀只需要從 Kotlin 呼叫一次 process_frame
+class YogaSession:
+    def __init__(self, pose_name, motion_epsilon=MOTION_EPSILON, cache_size=None, angle_bin=ANGLE_BIN):
+        """
+        Args:
+            pose_name (str): yoga pose name
+            motion_epsilon (float): skeleton moving less than it reuses the last tips and score, None to disable
+            cache_size (int): size of the tips / score cache keyed by quantized angles (e.g. ResultCache.RESULT_CACHE_SIZE),
+                None or 0 to disable. Disabled by default: a miss computes the rule and score angles twice,
+                and with the jitter of a live camera almost every frame misses.
+            angle_bin (float): quantization step of the score angles in the cache key, in degrees
+        """
+        self.pose_name = pose_name
+        self.pose = YogaPose(pose_name, motion_epsilon=motion_epsilon)
+        self.yogamat_processor = YogaMatProcessor()
+        self.score_calculator = ScoreCalculator(pose_name, motion_epsilon=motion_epsilon)
+        self.result_cache = ResultCache(cache_size, angle_bin) if cache_size else None
+        self.score_angle_engine = get_angle_engine(pose_name)
+
+    def process_frame(self, landmarks, world_landmarks):
+        """run feet projection, scoring and tip rules of one camera frame
+
+        Args:
+            landmarks: mediapipe landmarks, flat [x, y, z, visibility] * 33 float array or any format of to_landmark_array
+            world_landmarks: mediapipe world landmarks, same format as landmarks
+
+        Returns:
+            result (list): [tips, imagePath, pointsOut, score, [left_x, left_y, right_x, right_y]],
+                foot coordinate is -999999 when the foot is not detected
+        """
+        landmarks = to_landmark_array(landmarks)
+        world_landmarks = to_landmark_array(world_landmarks)
+
+        # 同一張壓力圖的 center 與 rects
+        mat = heatmap.get_snapshot()
+
+        # 取得腳在瑜珈墊上面的座標
+        with trace.span("session.feet"):
+            feet_data = self.yogamat_processor.generate_feet_data(landmarks, landmarks)
+            feet_data["pressure_feet"] = heatmap.get_feet(mat)
+        feet = [float(self.yogamat_processor.get_left_foot_x()), float(self.yogamat_processor.get_left_foot_y()),
+                float(self.yogamat_processor.get_right_foot_x()), float(self.yogamat_processor.get_right_foot_y())]
+
+        if self.result_cache is None:
+            tips, imagePath, pointsOut, score = self.__evaluate(landmarks, world_landmarks, mat, feet_data)
+            return [tips, imagePath, pointsOut, score, feet]
+
+        # 所有規則 predicate 的結果相同時 branch 一定相同，分數則以量化後的角度近似
+        with trace.span("session.cache"):
+            angles, base, bits = self.pose.rule_state(landmarks, world_landmarks)
+            score_angles = self.score_angle_engine.compute(landmarks)
+            key = self.result_cache.make_key(self.pose_name, bits, score_angles)
+            cached = self.result_cache.get(key)
+        if cached is not None:
+            branch, score = cached
+            # 箭頭位置跟著目前的骨架
+            tips, imagePath, pointsOut = self.pose.result_of_branch(branch, angles, base, landmarks, world_landmarks)
+            log.record_frame(TAG, pose=self.pose_name, score=score, via="cache")
+            return [tips, imagePath, pointsOut, score, feet]
+
+        tips, imagePath, pointsOut, score = self.__evaluate(landmarks, world_landmarks, mat, feet_data)
+        self.result_cache.put(key, (self.pose.last_branch, score))
+        return [tips, imagePath, pointsOut, score, feet]
+
+    def __evaluate(self, landmarks, world_landmarks, mat, feet_data):
+        # 分數計算
+        with trace.span("session.score"):
+            score = self.score_calculator.calculate_score(landmarks, True)
+
+        # 提示文字、圖片及箭頭
+        with trace.span("session.detect"):
+            tips, imagePath, pointsOut = self.pose.detect(landmarks, world_landmarks, mat.rects, mat.center, feet_data)
+        return tips, imagePath, pointsOut, score
+
+    def reset(self):
+        """forget the previous frames and clear the counters, e.g. after a warm-up frame"""
+        for gate in (self.pose.motion_gate, self.score_calculator.motion_gate):
+            if gate is not None:
+                gate.reset()
+                gate.hits = 0
+                gate.misses = 0
+        if self.result_cache is not None:
+            self.result_cache = ResultCache(self.result_cache.max_size, self.result_cache.angle_bin)
+        self.pose.last_frame = None
+
+    def get_motion_stats(self):
+        """hit / miss counters of the motion gate, used to tune motion_epsilon
+
+        Returns:
+            stats (dict): {"detect": {...}, "score": {...}}, empty when the gate is disabled
+        """
+        stats = {}
+        if self.pose.motion_gate is not None:
+            stats["detect"] = self.pose.motion_gate.get_stats()
+        if self.score_calculator.motion_gate is not None:
+            stats["score"] = self.score_calculator.motion_gate.get_stats()
+        return stats
+
+    def get_cache_stats(self):
+        """hit / miss / eviction counters of the result cache, empty when the cache is disabled"""
+        if self.result_cache is None:
+            return {}
+        return self.result_cache.get_stats()
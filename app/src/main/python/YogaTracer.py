@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+
+import numpy as np
+
+# 最多保存的 span 數量，滿了之後覆蓋最舊的 span
+TRACE_CAPACITY = 8192
+
+_enabled = False
+_lock = threading.Lock()
+# span 名稱 <-> 編號
+_names = []
+_name_ids = {}
+# 預先配置的 span 緩衝區
+_name_buffer = np.zeros(TRACE_CAPACITY, dtype=np.int32)
+_start_buffer = np.zeros(TRACE_CAPACITY, dtype=np.float64)
+_duration_buffer = np.zeros(TRACE_CAPACITY, dtype=np.float64)
+_thread_buffer = np.zeros(TRACE_CAPACITY, dtype=np.int64)
+_count = 0
+
+
+# 關閉時使用的 span，什麼都不做
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name_id", "start")
+
+    def __init__(self, name_id):
+        self.name_id = name_id
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _record(self.name_id, self.start, time.perf_counter() - self.start)
+        return False
+
+
+def _name_id(name):
+    name_id = _name_ids.get(name)
+    if name_id is None:
+        with _lock:
+            name_id = _name_ids.setdefault(name, len(_names))
+            if name_id == len(_names):
+                _names.append(name)
+    return name_id
+
+
+def _record(name_id, start, duration):
+    global _count
+    with _lock:
+        index = _count % len(_start_buffer)
+        _name_buffer[index] = name_id
+        _start_buffer[index] = start
+        _duration_buffer[index] = duration
+        _thread_buffer[index] = threading.get_ident()
+        _count += 1
+
+
+def span(name):
+    """time a stage of the frame
+
+    Usage:
+        with YogaTracer.span("detect.angles"):
+            ...
+
+    Args:
+        name (str): stage name, use "module.stage"
+
+    Returns:
+        context manager, a shared no-op object when tracing is disabled
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(_name_id(name))
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_capacity(capacity):
+    """reallocate the span buffer, the recorded spans are cleared"""
+    global _name_buffer, _start_buffer, _duration_buffer, _thread_buffer, _count
+    with _lock:
+        _name_buffer = np.zeros(capacity, dtype=np.int32)
+        _start_buffer = np.zeros(capacity, dtype=np.float64)
+        _duration_buffer = np.zeros(capacity, dtype=np.float64)
+        _thread_buffer = np.zeros(capacity, dtype=np.int64)
+        _count = 0
+
+
+def clear():
+    global _count
+    with _lock:
+        _count = 0
+
+
+def _spans():
+    """recorded spans ordered by start time: (name ids, starts, durations, threads)"""
+    with _lock:
+        size = min(_count, len(_start_buffer))
+        order = np.argsort(_start_buffer[:size], kind="stable")
+        return (_name_buffer[order], _start_buffer[order],
+                _duration_buffer[order], _thread_buffer[order])
+
+
+def get_summary():
+    """
+    Returns:
+        summary (dict): {stage name: {"count", "total_ms", "mean_ms", "max_ms"}}
+    """
+    name_ids, _, durations, _ = _spans()
+    summary = {}
+    for name_id in np.unique(name_ids):
+        stage = durations[name_ids == name_id] * 1000.0
+        summary[_names[name_id]] = {
+            "count": int(len(stage)),
+            "total_ms": float(stage.sum()),
+            "mean_ms": float(stage.mean()),
+            "max_ms": float(stage.max()),
+        }
+    return summary
+
+
+def export_chrome_trace():
+    """recorded spans as Chrome trace-event json, open it with chrome://tracing or Perfetto
+
+    Returns:
+        trace (str): {"traceEvents": [complete events]}
+    """
+    name_ids, starts, durations, threads = _spans()
+    origin = starts[0] if len(starts) > 0 else 0.0
+    thread_ids = {}
+    events = []
+    for name_id, start, duration, thread in zip(name_ids, starts, durations, threads):
+        events.append({
+            "name": _names[name_id],
+            "cat": _names[name_id].split(".")[0],
+            "ph": "X",
+            "ts": (start - origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": 0,
+            "tid": thread_ids.setdefault(int(thread), len(thread_ids)),
+        })
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def write_chrome_trace(path):
+    with open(path, "w") as file:
+        file.write(export_chrome_trace())
@@ -0,0 +1,223 @@
+"""Run the pose pipeline under CPython without Android / Chaquopy
+
+Usage:
+    python headless.py "Tree Style" --frames frames.json --trace trace.json
+    python headless.py "Plank" --synthetic 300
+
+frames.json: [{"landmarks": [x, y, z, visibility] * 33, "world_landmarks": [...], "heatmap": 12x18 list}],
+"world_landmarks" and "heatmap" are optional.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+
+# 放 bluetooth_address.txt 等 app 內部檔案的資料夾
+FILES_DIR_ENV = "YOGA_FILES_DIR"
+
+_files_dir = None
+
+
+# 模擬 FileInputStream.read()，一次回傳一個 byte，讀完回傳 -1
+class _FileInput:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = file.read()
+        self.index = 0
+
+    def read(self):
+        if self.index >= len(self.data):
+            return -1
+        byte = self.data[self.index]
+        self.index += 1
+        return byte
+
+    def close(self):
+        pass
+
+
+# 模擬 Android 的 Application，檔案從 files_dir 讀寫
+class _Application:
+    def openFileInput(self, name):
+        path = os.path.join(get_files_dir(), name)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(path)
+        return _FileInput(path)
+
+    def getFilesDir(self):
+        return get_files_dir()
+
+
+class _Platform:
+    def __init__(self):
+        self.application = _Application()
+
+    def getApplication(self):
+        return self.application
+
+
+class _Python:
+    _platform = _Platform()
+
+    @staticmethod
+    def getPlatform():
+        return _Python._platform
+
+
+class _Context:
+    MODE_PRIVATE = 0
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+def get_files_dir():
+    global _files_dir
+    if _files_dir is None:
+        _files_dir = os.environ.get(FILES_DIR_ENV) or os.path.join(tempfile.gettempdir(), "yoga_files")
+        os.makedirs(_files_dir, exist_ok=True)
+    return _files_dir
+
+
+def install(files_dir=None):
+    """register stand-in com.chaquo.python and android.content modules
+
+    Does nothing on the device, where the real modules can be imported.
+    Must be called before importing toolkit (or any module importing it).
+
+    Args:
+        files_dir (str): folder used as the app internal storage, default $YOGA_FILES_DIR or a temp folder
+
+    Returns:
+        installed (bool): False when running under Chaquopy
+    """
+    global _files_dir
+    if files_dir is not None:
+        _files_dir = files_dir
+        os.makedirs(files_dir, exist_ok=True)
+    try:
+        import com.chaquo.python  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    com = _module("com")
+    chaquo = _module("com.chaquo")
+    python = _module("com.chaquo.python", Python=_Python)
+    com.chaquo = chaquo
+    chaquo.python = python
+    android = _module("android")
+    android.content = _module("android.content", Context=_Context)
+    return True
+
+
+def set_bluetooth_address(address):
+    """write bluetooth_address.txt, None removes it (no yoga mat connected)"""
+    path = os.path.join(get_files_dir(), "bluetooth_address.txt")
+    if address is None:
+        if os.path.isfile(path):
+            os.remove(path)
+        return
+    with open(path, "w") as file:
+        file.write(address)
+
+
+def synthetic_frames(count, seed=0, jitter=0.002):
+    """a standing skeleton with random jitter, used for benchmarks
+
+    Returns:
+        frames (list): [{"landmarks", "world_landmarks", "heatmap"}]
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    base = np.zeros((33, 4), dtype=np.float32)
+    base[:, 0] = 0.5 + rng.uniform(-0.15, 0.15, 33)
+    base[:, 1] = np.linspace(0.1, 0.95, 33)
+    base[:, 2] = rng.uniform(-0.1, 0.1, 33)
+    base[:, 3] = 0.99
+    heatmap_data = np.zeros((12, 18), dtype=np.int32)
+    heatmap_data[3:6, 4:7] = 150
+    heatmap_data[6:9, 11:14] = 150
+
+    frames = []
+    for _ in range(count):
+        landmarks = base.copy()
+        landmarks[:, :3] += rng.normal(0, jitter, (33, 3)).astype(np.float32)
+        frames.append({
+            "landmarks": landmarks.ravel().tolist(),
+            "world_landmarks": (landmarks - [0.5, 0.5, 0, 0]).ravel().tolist(),
+            "heatmap": heatmap_data.tolist(),
+        })
+    return frames
+
+
+def run_pipeline(pose_name, frames, **session_args):
+    """run heatmap.update_heatmap and YogaSession.process_frame on every frame, without drawing the image
+
+    Args:
+        pose_name (str): yoga pose name
+        frames (list): [{"landmarks", "world_landmarks", "heatmap"}]
+        session_args: arguments of YogaSession
+
+    Returns:
+        results (list): process_frame results
+        elapsed (float): seconds spent in the pipeline
+    """
+    install()
+    import heatmap
+    from YogaSession import YogaSession
+
+    session = YogaSession(pose_name, **session_args)
+    results = []
+    start = time.perf_counter()
+    for frame in frames:
+        if frame.get("heatmap") is not None:
+            heatmap.update_heatmap(json.dumps(frame["heatmap"]))
+        landmarks = frame["landmarks"]
+        results.append(session.process_frame(landmarks, frame.get("world_landmarks") or landmarks))
+    return results, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="run the yoga pose pipeline without a device")
+    parser.add_argument("pose", help="yoga pose name, e.g. \"Tree Style\"")
+    parser.add_argument("--frames", help="json file of recorded frames")
+    parser.add_argument("--synthetic", type=int, default=100, help="number of synthetic frames without --frames")
+    parser.add_argument("--bluetooth", default="0", help="content of bluetooth_address.txt, \"none\" to remove it")
+    parser.add_argument("--trace", help="write Chrome trace-event json to this path")
+    parser.add_argument("--output", help="write the frame results to this json path")
+    args = parser.parse_args(argv)
+
+    install()
+    set_bluetooth_address(None if args.bluetooth.lower() == "none" else args.bluetooth)
+    import YogaTracer
+
+    if args.frames:
+        with open(args.frames, "r") as file:
+            frames = json.load(file)
+    else:
+        frames = synthetic_frames(args.synthetic)
+
+    YogaTracer.set_enabled(args.trace is not None)
+    results, elapsed = run_pipeline(args.pose, frames)
+    print(f"{len(frames)} frames, {elapsed / max(len(frames), 1) * 1000:.3f} ms / frame")
+
+    if args.trace:
+        YogaTracer.write_chrome_trace(args.trace)
+        for name, stage in YogaTracer.get_summary().items():
+            print(f"{name:24s} {stage['mean_ms']:.3f} ms x {stage['count']}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, ensure_ascii=False, default=float)
+
+
+if __name__ == "__main__":
+    main()
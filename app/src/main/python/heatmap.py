@@ -1,120 +1,486 @@
-import cv2
 import numpy as np
 import json
+import threading
+import time
+from collections import deque, namedtuple
+
+import YogaLogger as log
+import YogaTracer as trace
+from BlobTracker import BlobTracker, LEFT, RIGHT
+from HeatmapFrame import decode_frame
+from MatBaseline import MatBaseline
+from MatGesture import GestureRecognizer, ZONE_RETURN
+from LazyImport import lazy_import
+
+# cv2 在第一次產生熱力圖時才載入，只呼叫 checkReturn 的畫面不需要 cv2
+cv2 = lazy_import("cv2")
+
+TAG = "heatmap"
 
 enlarge = 50
-need_center = np.array([])
-need_rects = np.array([])
-flag = False
-function = 0
+# get_heatmap 回傳的影像格式
+OUTPUT_PNG = "png"
+OUTPUT_RGBA = "rgba"
+OUTPUT_ARGB = "argb"
+OUTPUT_NONE = "none"
+OUTPUT_MODES = (OUTPUT_PNG, OUTPUT_RGBA, OUTPUT_ARGB, OUTPUT_NONE)
+output_mode = OUTPUT_PNG
+# (寬, 高)
+output_size = (18 * enlarge, 12 * enlarge)
+# 壓力大於此值的格子才計算 center
+CENTER_THRESHOLD = 100
+# flag / function 改變時發出的事件，取代畫面每 100 ms 呼叫 checkReturn / checkFunction
+EVENT_RETURN = "return"
+EVENT_FUNCTION = "function"
+# MatGesture 的手勢，值為 (區域, press / hold / release)
+EVENT_GESTURE = "gesture"
+EVENT_LOG_SIZE = 64
+
+# 一張壓力圖的分析結果，建立後不再修改 (陣列為唯讀)
+#   frame: 編號 (從 1 開始), data: (12, 18) 壓力值, header: 二進位格式的 header (json 時為 None)
+#   center, rects, big_rects, blob_centers, center_of_pressure: 900x600 的畫面座標
+#   flag: 是否踩住返回角落, function: 踩住的功能區 (1~4，沒有為 0), gestures: 這一張發生的手勢
+#   feet: (左腳, 右腳) BlobTracker.FootTrack，不在墊子上為 None
+HeatmapSnapshot = namedtuple("HeatmapSnapshot", ["frame", "data", "header", "center", "rects", "big_rects",
+                                                 "blob_centers", "center_of_pressure", "flag", "function",
+                                                 "gestures", "feet"])
+
+
+def _read_only(array):
+    array = np.asarray(array)
+    array.setflags(write=False)
+    return array
+
+
+EMPTY_SNAPSHOT = HeatmapSnapshot(0, None, None, _read_only(np.array([])), _read_only(np.zeros((0, 4), dtype=int)),
+                                 _read_only(np.zeros((0, 4), dtype=int)), _read_only(np.zeros((0, 2))),
+                                 _read_only(np.array([])), False, 0, (), (None, None))
 
 def test(data):
     data = np.array(json.loads(data))
 
-    print(data)
-    print(data.shape)
+    log.info(TAG, "%s", data)
+    log.info(TAG, "%s", data.shape)
 
 def find_center(heatmap_arr):
-    centers = []
-    for (x, y), value in np.ndenumerate(heatmap_arr):
-        if value > 100:
-            centers.append([x,y,value])
-    if centers:
-        output_x=0
-        output_y=0
-        acum_w=0
-        for (x,y,w) in centers:
-            output_x += w*x
-            output_y += w*y
-            acum_w+=w
-        return np.array([(output_x/acum_w*enlarge)+25,(output_y/acum_w*enlarge)+25]).astype(int)
-    else:
+    """weighted centroid of the cells over CENTER_THRESHOLD
+
+    Returns:
+        center (numpy array): [row, column] in display pixels (int), empty when no cell is pressed
+    """
+    weights = np.where(heatmap_arr > CENTER_THRESHOLD, heatmap_arr, 0)
+    acum_w = weights.sum()
+    if acum_w == 0:
+        return np.array([])
+    output_x = weights.sum(axis=1) @ np.arange(heatmap_arr.shape[0])
+    output_y = weights.sum(axis=0) @ np.arange(heatmap_arr.shape[1])
+    return np.array([(output_x/acum_w*enlarge)+25,(output_y/acum_w*enlarge)+25]).astype(int)
+
+def find_center_of_pressure(heatmap_arr):
+    """sub-cell center of pressure of the whole grid, every cell weighted by its pressure
+
+    Returns:
+        center (numpy array): [row, column] in display pixels (float), empty when nothing is pressed
+    """
+    weights = np.maximum(heatmap_arr, 0).astype(np.float64)
+    total = weights.sum()
+    if total == 0:
         return np.array([])
+    row = weights.sum(axis=1) @ (np.arange(heatmap_arr.shape[0]) + 0.5)
+    column = weights.sum(axis=0) @ (np.arange(heatmap_arr.shape[1]) + 0.5)
+    return np.array([row, column]) / total * enlarge
+
+def find_blob_centers(heatmap_arr, labels, count):
+    """pressure weighted centroid of every blob in one pass with label-indexed sums
+
+    Args:
+        heatmap_arr (numpy array): (12, 18) pressure values
+        labels (numpy array): (12, 18) blob labels from find_blobs, 0 is background
+        count (int): number of blobs
+
+    Returns:
+        centers (numpy array): (count, 2) [row, column] in display pixels (float)
+    """
+    weights = np.maximum(heatmap_arr, 0).astype(np.float64).ravel()
+    rows, columns = np.indices(heatmap_arr.shape)
+    labels = labels.ravel()
+    total = np.bincount(labels, weights, count + 1)[1:]
+    row = np.bincount(labels, weights * (rows.ravel() + 0.5), count + 1)[1:]
+    column = np.bincount(labels, weights * (columns.ravel() + 0.5), count + 1)[1:]
+    total = np.where(total > 0, total, 1.0)
+    return np.stack((row / total, column / total), axis=1) * enlarge
     
+# 一張瑜珈墊的狀態: 藍牙執行緒每一張壓力圖建立新的 HeatmapSnapshot 後整個換掉 (指定屬性是 atomic)，
+# 讀取端拿到的 snapshot 不會混到不同張的結果，也不需要 lock
+class HeatmapState:
+    def __init__(self):
+        self.snapshot = EMPTY_SNAPSHOT
+        # 最後一次畫好的影像: (frame, output_mode, output_size, bytes)
+        self.image_cache = None
+        # 同時只有一個執行緒寫入
+        self.update_lock = threading.Lock()
+        # 返回角落與功能區需要踩住一段時間才算，單一張雜訊不會觸發換頁
+        self.gestures = GestureRecognizer()
+        self.baseline = MatBaseline()
+        # 前後張的區塊對應，左右腳不會每張重新判斷
+        self.tracker = BlobTracker(cell_size=enlarge)
+        # (事件編號, 種類, 值)，事件編號從 1 開始遞增
+        self.events = deque(maxlen=EVENT_LOG_SIZE)
+        self.event_id = 0
+        self.event_condition = threading.Condition()
+        self.listeners = []
+
+    def update(self, data):
+        """analyse a pressure frame from the yoga mat without drawing it
+
+        The image is drawn by get_image only when a screen asks for it.
+
+        Args:
+            data: binary frame (HeatmapFrame) or json text of the (12, 18) pressure values
+
+        Returns:
+            snapshot (HeatmapSnapshot): the new state
+        """
+        with trace.span("heatmap.decode"):
+            # 二進位格式 (HeatmapFrame) 直接 view 藍牙收到的 byte[]，舊的 json 字串仍可使用
+            data, header = decode_frame(data)
+
+        with self.update_lock:
+            with trace.span("heatmap.baseline"):
+                # 校正後扣掉每一格的 baseline 與雜訊底線，校正中會收集空墊子的壓力圖
+                data = self.baseline.process(data)
+            with trace.span("heatmap.center"):
+                center = find_center(data)
+            with trace.span("heatmap.blobs"):
+                cells, areas, labels = find_blobs(data)
+                rects = find_bounding_box(data, (cells, areas))
+                big_rects = find_big_rects(rects, areas)
+                blob_centers = find_blob_centers(data, labels, len(cells))
+                center_of_pressure = find_center_of_pressure(data)
+            with trace.span("heatmap.tracker"):
+                feet = self.tracker.update(blob_centers, rects, areas)
+            #print(herotwo_pose_evaluate(center ,rects))
+            with trace.span("heatmap.gestures"):
+                # 用收到這一張的時間，樹莓派的 timestamp 可能是 0 或往回跳 (重開機、校時)
+                now = time.monotonic()
+                # 與原本相同，以每一塊的左上角判斷踩到哪個區域
+                gestures = tuple(self.gestures.update(cells[:, 1::-1], now))
+                pressed = self.gestures.pressed_zones()
+                flag = ZONE_RETURN in pressed
+                function = next((zone for zone in pressed if zone != ZONE_RETURN), 0)
+            last = self.snapshot
+            snapshot = HeatmapSnapshot(last.frame + 1, _read_only(data), header, _read_only(center),
+                                       _read_only(rects), _read_only(big_rects), _read_only(blob_centers),
+                                       _read_only(center_of_pressure), flag, function, gestures, feet)
+            self.snapshot = snapshot
+            self.publish_events(last, snapshot)
+        return snapshot
+
+    def get_snapshot(self):
+        return self.snapshot
+
+    def get_image(self):
+        """image of the latest frame in the current output mode, drawn once per frame and cached
+
+        Returns:
+            bytes_data (bytes): see render_heatmap, empty before the first frame
+        """
+        snapshot = self.snapshot
+        if snapshot.data is None:
+            return b""
+        key = (snapshot.frame, output_mode, output_size)
+        cache = self.image_cache
+        if cache is not None and cache[:3] == key:
+            return cache[3]
+        bytes_data = render_heatmap(snapshot.data, snapshot.center, snapshot.rects)
+        self.image_cache = key + (bytes_data,)
+        return bytes_data
+
+    def publish_events(self, last, snapshot):
+        """emit events for the changes of flag / function between two snapshots, and the gestures
+
+        Wakes the threads in wait_event and calls the listeners on the calling (bluetooth) thread.
+        """
+        changes = []
+        if snapshot.flag != last.flag:
+            changes.append((EVENT_RETURN, snapshot.flag))
+        if snapshot.function != last.function:
+            changes.append((EVENT_FUNCTION, snapshot.function))
+        changes += [(EVENT_GESTURE, gesture) for gesture in snapshot.gestures]
+        if not changes:
+            return
+        with self.event_condition:
+            for kind, value in changes:
+                self.event_id += 1
+                self.events.append((self.event_id, kind, value))
+            listeners = list(self.listeners)
+            self.event_condition.notify_all()
+        for kind, value in changes:
+            for listener in listeners:
+                try:
+                    listener(kind, value)
+                except Exception as e:
+                    log.error(TAG, "event listener %s failed: %s", listener, e)
+
+    def get_event_id(self):
+        """id of the latest event, pass it to wait_event to get only the events after now"""
+        with self.event_condition:
+            return self.event_id
+
+    def wait_event(self, last_id, timeout=None):
+        """block until an event newer than last_id happens
+
+        Args:
+            last_id (int): id of the last event handled, from get_event_id or the previous wait_event
+            timeout (float): max seconds to wait, None to wait forever
+
+        Returns:
+            event (tuple): (id, kind, value), kind is EVENT_RETURN (value bool), EVENT_FUNCTION (value 0~4)
+                or EVENT_GESTURE (value (zone, gesture)), the oldest event kept when more than EVENT_LOG_SIZE
+                events were missed, None on timeout
+        """
+        with self.event_condition:
+            if not self.event_condition.wait_for(lambda: self.event_id > last_id, timeout):
+                return None
+            for event in self.events:
+                if event[0] > last_id:
+                    return event
+
+    def add_listener(self, callback):
+        """call callback(kind, value) on every event, on the bluetooth thread"""
+        with self.event_condition:
+            if callback not in self.listeners:
+                self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self.event_condition:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+
+# 藍牙連線的瑜珈墊，下面的 module function 都是這個物件的包裝
+_state = HeatmapState()
+
+def get_state():
+    return _state
+
+def update_heatmap(data):
+    """analyse a pressure frame of the yoga mat, see HeatmapState.update"""
+    _state.update(data)
+
+def get_image():
+    return _state.get_image()
+
 def get_heatmap(data):
-    global need_center, need_rects
-    data = np.array(json.loads(data))
-    
-    rescaled_array = cv2.resize(data.astype('uint8'), dsize=(18 * enlarge , 12 * enlarge)) 
-    rescaled_array = cv2.normalize(rescaled_array, None, 0, 255, norm_type= cv2.NORM_MINMAX, dtype= cv2.CV_8U)
-    heatmap = cv2.applyColorMap(rescaled_array, cv2.COLORMAP_JET)
-    center = find_center(data)
-    rects = find_bounding_box(heatmap)
-    need_center = center
-    need_rects = rects
-    #print(herotwo_pose_evaluate(center ,rects))
-    if len(center)!=0 :
-        cv2.circle(heatmap, (center[1], center[0]), 10, (255, 255, 255), 1)
-    if  len(rects)> 1:
-        for rect in rects:
-            x , y , w , h = rect
-            cv2.rectangle(heatmap, (x, y), (x + w, y + h), (36,255,12), 2)
-    heatmap = cv2.rotate(heatmap, cv2.ROTATE_180)
-    is_success, im_buf_arr = cv2.imencode(".png", heatmap)
-    bytes_data = im_buf_arr.tobytes()
+    """analyse the frame and return its image, same as update_heatmap then get_image"""
+    _state.update(data)
+    return _state.get_image()
+
+def get_snapshot():
+    """all results of the latest frame, use it instead of several getters to read one consistent frame"""
+    return _state.snapshot
+
+# 校正的狀態在藍牙執行緒的 update 中修改，由畫面呼叫時也要取得 update_lock
+def start_calibration():
+    """called when CalibrationStage opens, the next empty-mat frames build the baseline"""
+    with _state.update_lock:
+        _state.baseline.start_calibration()
+
+def is_calibrating():
+    with _state.update_lock:
+        return _state.baseline.is_calibrating()
+
+def get_calibration():
+    with _state.update_lock:
+        return _state.baseline.get_calibration()
+
+def clear_calibration():
+    with _state.update_lock:
+        _state.baseline.clear()
+
+def get_event_id():
+    return _state.get_event_id()
+
+def wait_event(last_id, timeout=None):
+    return _state.wait_event(last_id, timeout)
+
+def add_listener(callback):
+    _state.add_listener(callback)
+
+def remove_listener(callback):
+    _state.remove_listener(callback)
+
+def set_output(mode=OUTPUT_PNG, width=None, height=None):
+    """choose what get_image (and get_heatmap) returns
+
+    Args:
+        mode (str): OUTPUT_PNG, OUTPUT_RGBA (Bitmap.Config.ARGB_8888 byte order, for Bitmap.copyPixelsFromBuffer),
+            OUTPUT_ARGB (A, R, G, B bytes per pixel) or OUTPUT_NONE (analysis only, returns empty bytes)
+        width (int): image width, default 18 * enlarge
+        height (int): image height, default 12 * enlarge
+    """
+    global output_mode, output_size
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"output mode {mode} is not one of {OUTPUT_MODES}")
+    width = int(width) if width is not None else 18 * enlarge
+    height = int(height) if height is not None else 12 * enlarge
+    if width <= 0 or height <= 0:
+        raise ValueError(f"output size {width}x{height} is not positive")
+    output_mode = mode
+    output_size = (width, height)
+
+def get_output_mode():
+    """output mode of get_image, BluetoothClient decodes the image with it"""
+    return output_mode
+
+def get_output_size():
+    """(width, height) of the image returned by get_image, used to create the Bitmap"""
+    return output_size
+
+def to_uint8(data):
+    """pressure values as uint8 for cv2 and the blob search
+
+    uint16 / float32 frames (HeatmapFrame) over 255 are scaled down by their maximum
+    instead of wrapping around, both users stretch the values by min-max afterwards.
+    """
+    if data.dtype == np.uint8:
+        return data
+    values = np.maximum(data, 0)
+    high = values.max() if values.size else 0
+    if high > 255:
+        values = values * (255.0 / high)
+    return values.astype('uint8')
+
+def render_heatmap(data, center, rects):
+    """draw the pressure image in the current output mode
+
+    Args:
+        data (numpy array): (12, 18) pressure values
+        center (numpy array): [row, column] from find_center, in 900x600 display coordinates
+        rects (numpy array): (n, 4) [x, y, w, h] from find_bounding_box, in 900x600 display coordinates
+
+    Returns:
+        bytes_data (bytes): png file or raw pixels of get_output_size(), empty in OUTPUT_NONE
+    """
+    if output_mode == OUTPUT_NONE:
+        return b""
+    width, height = output_size
+    # 分析結果是 900x600 的畫面座標，輸出大小不同時等比例換算
+    scale_x = width / (18 * enlarge)
+    scale_y = height / (12 * enlarge)
+    with trace.span("heatmap.resize"):
+        rescaled_array = cv2.resize(to_uint8(data), dsize=(width, height))
+        rescaled_array = cv2.normalize(rescaled_array, None, 0, 255, norm_type= cv2.NORM_MINMAX, dtype= cv2.CV_8U)
+    with trace.span("heatmap.colormap"):
+        heatmap = cv2.applyColorMap(rescaled_array, cv2.COLORMAP_JET)
+    with trace.span("heatmap.draw"):
+        if len(center)!=0 :
+            cv2.circle(heatmap, (int(round(center[1] * scale_x)), int(round(center[0] * scale_y))),
+                       max(int(round(10 * scale_x)), 1), (255, 255, 255), 1)
+        if  len(rects)> 1:
+            for rect in rects:
+                x , y , w , h = rect
+                cv2.rectangle(heatmap, (int(round(x * scale_x)), int(round(y * scale_y))),
+                              (int(round((x + w) * scale_x)), int(round((y + h) * scale_y))), (36,255,12), 2)
+        heatmap = cv2.rotate(heatmap, cv2.ROTATE_180)
+    with trace.span("heatmap.encode"):
+        if output_mode == OUTPUT_RGBA:
+            bytes_data = cv2.cvtColor(heatmap, cv2.COLOR_BGR2RGBA).tobytes()
+        elif output_mode == OUTPUT_ARGB:
+            pixels = np.empty((height, width, 4), dtype=np.uint8)
+            pixels[:, :, 0] = 255
+            pixels[:, :, 1:] = heatmap[:, :, ::-1]
+            bytes_data = pixels.tobytes()
+        else:
+            is_success, im_buf_arr = cv2.imencode(".png", heatmap)
+            bytes_data = im_buf_arr.tobytes()
     return bytes_data
 
-def find_bounding_box(heatmap):
-    global flag, function
-    flag = False
-    function = 0
-    # https://stackoverflow.com/questions/58419893/generating-bounding-boxes-from-heatmap-data
-    # Grayscale then Otsu's threshold
-    gray = cv2.cvtColor(heatmap, cv2.COLOR_BGR2GRAY)
-    thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-    # Find contours
-    kernel = np.ones((3,3), np.uint8)
-    dilation = cv2.dilate(thresh, kernel, iterations = 1)
-    cnts = cv2.findContours(dilation, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    cnts = cnts[0] if len(cnts) == 2 else cnts[1]
-    rects = []
-    for c in cnts:
-        x,y,w,h = cv2.boundingRect(c)
-        rects.append([x,y,w,h])
-
-        if (x > 750 and y > 450):
-            flag = True
-
-        if (y <= 100):
-            if (x >= 150 and x < 350):
-                function = 1
-            elif (x >= 350 and x < 550):
-                function = 2
-            elif (x >= 550 and x <= 750):
-                function = 3
-        elif (y >= 450):
-            if(x >= 350 and x <= 550):
-                function = 4
-
-    big = [[0,0,0,0], [0,0,0,0]]
-    for b in rects:
-        b0 = big[0][2]*big[0][3]
-        b1 = big[1][2]*big[1][3]
-        b3 = b[2]*b[3]
-
-        if (b3 >= b0 or b3 >= b1):
-            if (b0 >= b1):
-                big[1] = b
-            else :
-                big[0] = b
-
-    # 提取座標
-    point1 = np.array(big[0][:2])
-    point2 = np.array(big[1][:2])
-    #print(point1)
-    #print(point2)
-    # 计算两点之间的差异
-    delta = point2 - point1
-
-    # 计算夹角（弧度）
-    angle_radians = np.arctan2(delta[1], delta[0])
-
-    # 将弧度转换为度数
-    angle_degrees = np.degrees(angle_radians)
-
-    #print("与X轴的夹角（度数）：", angle_degrees)
-
-    return np.array(rects)
+# 8 連通: 斜對角相鄰的格子也算同一塊 (與原本放大後 3x3 dilate 的效果相同)
+NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def otsu_threshold(values):
+    """Otsu threshold of uint8 values, same as cv2.THRESH_OTSU"""
+    hist = np.bincount(values.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    levels = np.arange(256)
+    weight0 = np.cumsum(hist)
+    weight1 = total - weight0
+    sum0 = np.cumsum(hist * levels)
+    mean0 = sum0 / np.where(weight0 > 0, weight0, 1)
+    mean1 = (sum0[-1] - sum0) / np.where(weight1 > 0, weight1, 1)
+    variance = weight0 * weight1 * (mean0 - mean1) ** 2
+    return int(np.argmax(variance))
+
+
+def find_blobs(heatmap_arr):
+    """connected components of the pressure grid
+
+    Args:
+        heatmap_arr (numpy array): (12, 18) pressure values
+
+    Returns:
+        rects (numpy array): (n, 4) [x, y, w, h] in grid cells
+        areas (numpy array): (n,) number of cells of every blob
+        labels (numpy array): (12, 18) blob label of every cell (1 ~ n), 0 for background
+    """
+    grid = to_uint8(heatmap_arr)
+    low, high = int(grid.min()), int(grid.max())
+    if high == low:
+        return np.zeros((0, 4), dtype=int), np.zeros(0, dtype=int), np.zeros(grid.shape, dtype=int)
+    # 與 cv2.normalize(NORM_MINMAX) 相同，將數值拉到 0 ~ 255 後用 Otsu 找門檻
+    scaled = np.rint((grid.astype(np.float64) - low) * (255.0 / (high - low))).astype(np.uint8)
+    mask = scaled > otsu_threshold(scaled)
+
+    rows, cols = mask.shape
+    labels = np.zeros(mask.shape, dtype=int)
+    rects, areas = [], []
+    for start in zip(*np.nonzero(mask)):
+        if labels[start]:
+            continue
+        labels[start] = len(rects) + 1
+        stack = [start]
+        top, left, bottom, right, area = start[0], start[1], start[0], start[1], 0
+        while stack:
+            y, x = stack.pop()
+            area += 1
+            top, bottom, left, right = min(top, y), max(bottom, y), min(left, x), max(right, x)
+            for dy, dx in NEIGHBORS:
+                ny, nx = y + dy, x + dx
+                if 0 <= ny < rows and 0 <= nx < cols and mask[ny, nx] and not labels[ny, nx]:
+                    labels[ny, nx] = labels[start]
+                    stack.append((ny, nx))
+        rects.append([left, top, right - left + 1, bottom - top + 1])
+        areas.append(area)
+    return np.array(rects, dtype=int).reshape(-1, 4), np.array(areas, dtype=int), labels
+
+
+def find_bounding_box(heatmap_arr, blobs=None):
+    """bounding boxes of the pressed regions, computed on the 12x18 grid
+
+    Args:
+        heatmap_arr (numpy array): (12, 18) pressure values
+        blobs (tuple): (cells, areas) from find_blobs when it is already computed
+
+    Returns:
+        rects (numpy array): (n, 4) [x, y, w, h] in the 900x600 display coordinates
+    """
+    cells, areas = blobs if blobs is not None else find_blobs(heatmap_arr)[:2]
+    # 格子座標轉成放大後的畫面座標，放大時的線性內插與 dilate 會讓區塊向外多出約 1/4 格
+    margin = enlarge // 4
+    rows, cols = heatmap_arr.shape
+    left = np.maximum(cells[:, 0] * enlarge - margin, 0)
+    top = np.maximum(cells[:, 1] * enlarge - margin, 0)
+    right = np.minimum((cells[:, 0] + cells[:, 2]) * enlarge + margin, cols * enlarge)
+    bottom = np.minimum((cells[:, 1] + cells[:, 3]) * enlarge + margin, rows * enlarge)
+    return np.stack((left, top, right - left, bottom - top), axis=1).astype(int).reshape(-1, 4)
+
+
+def find_big_rects(rects, areas):
+    """the two biggest regions (usually the two feet), biggest first"""
+    biggest = np.argsort(-areas, kind="stable")[:2]
+    return rects[biggest].reshape(-1, 4)
 
 '''def herotwo_pose_evaluate(center ,rects):
     if len(rects) == 2 and abs( rects[0][2] - rects[1][2])>50:       
@@ -131,17 +497,42 @@ def find_bounding_box(heatmap):
     return False'''
 
 def get_rects():
-    global need_rects
-    return need_rects
+    return _state.snapshot.rects
+
+def get_big_rects():
+    return _state.snapshot.big_rects
 
 def get_center():
-    global need_center
-    return need_center
+    return _state.snapshot.center
+
+def get_blob_centers():
+    return _state.snapshot.blob_centers
+
+def get_center_of_pressure():
+    return _state.snapshot.center_of_pressure
+
+def get_feet(snapshot=None):
+    """tracked feet of the latest frame
+
+    Args:
+        snapshot (HeatmapSnapshot): read this frame instead of the latest one
+
+    Returns:
+        feet (dict): {"LEFT": foot, "RIGHT": foot}, foot is {"id", "center": [row, column], "rect": [x, y, w, h],
+            "area", "age"} in 900x600 display coordinates, None when the foot is not on the mat
+    """
+    feet = {}
+    snapshot = snapshot or _state.snapshot
+    for side, foot in zip((LEFT, RIGHT), snapshot.feet):
+        feet[side] = None if foot is None else {"id": foot.id, "center": list(foot.center), "rect": list(foot.rect),
+                                                "area": foot.area, "age": foot.age}
+    return feet
+
+def get_frame_header():
+    return _state.snapshot.header
 
 def checkReturn():
-    global flag
-    return flag
+    return _state.snapshot.flag
 
 def checkFunction():
-    global function
-    return function
\ No newline at end of file
+    return _state.snapshot.function
@@ -1,17 +1,42 @@
+import numpy as np
+
 import toolkit
+import YogaLogger as log
+import YogaTracer as trace
+from AngleEngine import get_angle_engine
 from FeetData import FeetData
+from LandmarkBuffer import to_landmark_array
+from MotionGate import MotionGate
+from RuleEngine import get_rule_engine
 from yogaFileGetter import *
 
+# 骨架不完整時的 branch (RuleEngine 的 branch 從 0 開始，-1 表示動作正確)
+INCOMPLETE_BRANCH = -2
+INCOMPLETE_TIP = "無法偵測到完整骨架"
+
+TAG = "yogaPoseDetect"
+
 
 class YogaPose:
     '''
     type: WarriorII, Tree, ReversePlank, Plank ...etc
     '''
-    def __init__(self, type):
+    def __init__(self, type, short_circuit=True, motion_epsilon=None):
         self.type = type
+        # motion_epsilon 不是 None 時，骨架幾乎沒動就沿用上一次的結果
+        self.motion_gate = MotionGate(motion_epsilon) if motion_epsilon is not None else None
+        # 只需要提示時使用短路模式，roi 在 get_roi_status 時才計算
+        self.short_circuit = short_circuit
+        self.last_frame = None
+        # 上一次 __detect 選到的 branch，給 YogaSession 的結果快取使用
+        self.last_branch = -1
         self.tips = ""
         self.roi = get_roi(type)
         self.angle_def = get_angle_def(type)
+        self.angle_engine = get_angle_engine(type)
+        self.rule_engine = get_rule_engine(type)
+        # RuleEngine 由同一個動作的 YogaPose 共用，短路模式的檢查順序每個 YogaPose 各自一份
+        self.rule_order = self.rule_engine.new_order()
 
         self.angle_dict = self.initialAngleDict()
         self.sample_angle_dict = {}#initialAngleDict
@@ -33,9 +58,6 @@ class YogaPose:
         self.tips = ""
         self.pointsOut = []
         self.imagePath =  get_image_path(self.type)
-        point3d = [] # save landmarks
-        point3D = [] # save world landmarks
-
         feet_data = FeetData.from_dict(feet_data_json)
 
         feet_count = feet_data.get_feet_count_on_mat()
@@ -44,140 +66,116 @@ class YogaPose:
         closer_foot = feet_data.get_closer_foot_to_center(center)
         # print("feet : 靠近重心的腳:", closer_foot)
 
-        # landmarks
-        for i in range(point.size()):
-            ang = []
-            for j in range(4):
-                ang.append(point.get(i).get(j))
-            point3d.append(ang)
-
-        # world landmarks
-        for i in range(point2.size()):
-            ang = []
-            for j in range(4):
-                ang.append(point2.get(i).get(j))
-            point3D.append(ang)
-
-        con = sum(1 for i in point3d if i[3] < toolkit.MIN_DETECT_VISIBILITY)
-
-        if(con>16):  #half of all node
-            self.tips="無法偵測到完整骨架"
+        with trace.span("detect.landmarks"):
+            landmarks = to_landmark_array(point) # landmarks
+            point3D = to_landmark_array(point2) # world landmarks
+
+        if self.motion_gate is not None:
+            with trace.span("detect.motion_gate"):
+                result = self.motion_gate.check(landmarks, point3D)
+            if result is not None:
+                # branch 跟著結果一起還原，YogaSession 的結果快取才會存到正確的 branch
+                result, self.last_branch = result
+                self.tips, self.imagePath, self.pointsOut = result
+                self.__record("motion")
+                return list(result)
+            result = self.__detect(landmarks, point3D)
+            self.motion_gate.update((landmarks, point3D), (result, self.last_branch))
+            self.__record("rule")
+            return list(result)
+        result = self.__detect(landmarks, point3D)
+        self.__record("rule")
+        return result
+
+    def is_incomplete(self, landmarks):
+        con = int(np.count_nonzero(landmarks[:, 3] < toolkit.MIN_DETECT_VISIBILITY))
+        return con > 16  #half of all node
+
+    def __detect(self, landmarks, point3D):
+        if self.is_incomplete(landmarks):
+            self.last_branch = INCOMPLETE_BRANCH
+            self.tips = INCOMPLETE_TIP
             self.imagePath =  get_image_path(self.type)
             self.pointsOut=[]
             return [self.tips, self.imagePath, self.pointsOut]
         
         # using world landmarks to calculate angles
-        for key,value in self.angle_def.items():
-            if float(point3D[value[0]][3]) < toolkit.MIN_DETECT_VISIBILITY and float(point3D[value[1]][3]) <toolkit.MIN_DETECT_VISIBILITY and float(point3D[value[2]][3]) <toolkit.MIN_DETECT_VISIBILITY :
-                self.angle_dict[key] = -1
+        with trace.span("detect.angles"):
+            angles = self.angle_engine.compute(point3D)
+            self.angle_dict.update(self.angle_engine.to_dict(angles))
+
+        # 規則定義在 PoseRuleDef.py
+        self.last_frame = (angles, landmarks)
+        with trace.span("detect.rules"):
+            if self.short_circuit:
+                self.last_branch, result = self.rule_engine.evaluate_first(angles, landmarks, self.rule_order)
             else:
-                angle = toolkit.computeAngle(point3D[value[0]], point3D[value[1]], point3D[value[2]])
-                self.angle_dict[key] = angle
-
-        if(self.type == 'Tree Style'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    #angle = toolkit.computeAngle(point3d.get(value[0]), point3d.get(value[1]), point3d.get(value[2]))
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.treePoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Warrior2 Style'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.warriorIIPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Reverse Plank'):
-            """for key,value in self.angle_def.items():
-                angle = toolkit.computeAngle(point3d[value[0]][:2], point3d[value[1]][:2], point3d[value[2]][:2])
-                self.angle_dict[key] = angle"""
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.reversePlankPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Plank'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]][:2], point3d[value[1]][:2], point3d[value[2]][:2])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.plankPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == "Child's pose"):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]][:2], point3d[value[1]][:2], point3d[value[2]][:2])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.ChildsPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Downward dog'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.DownwardDogRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Low Lunge'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.LowLungeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == "Seated Forward Bend"):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.SeatedForwardBendRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Bridge pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.BridgeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Pyramid pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.PyramidRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Mountain pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.MountainRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Triangle pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.TriangleRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Locust pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.LocustPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Cobra pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.CobraPoseRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Half moon pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.HalfmoonposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Boat pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.BoatposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Camel pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.CamelposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Pigeon pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.PigeonposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Fish pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.FishposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        elif(self.type == 'Chair pose'):
-            #for key,value in self.angle_def.items():
-            #    angle = toolkit.computeAngle(point3d[value[0]], point3d[value[1]], point3d[value[2]])
-            #    self.angle_dict[key] = angle
-            self.roi, self.tips, self.imagePath, self.pointsOut = toolkit.ChairposeRule(self.roi, self.tips, self.sample_angle_dict, self.angle_dict, point3d)
-        # print([self.tips, self.imagePath, self.pointsOut])
+                self.last_branch, result = self.rule_engine.evaluate(angles, landmarks, self.roi)
+        self.tips, self.imagePath, self.pointsOut = result
         return [self.tips, self.imagePath, self.pointsOut]
 
+    def __record(self, via):
+        log.record_frame(TAG, pose=self.type, branch=int(self.last_branch), tips=self.tips, via=via)
+        log.debug(TAG, "%s branch %d: %s %s", self.type, self.last_branch, self.tips, self.pointsOut)
+
+    def rule_state(self, point, point2):
+        """inputs deciding the chosen branch, used as the key of the result cache
+
+        Args:
+            point: landmarks
+            point2: world landmarks
+
+        Returns:
+            angles (numpy array): rule angles, None when the skeleton is incomplete
+            base (numpy array): angles and landmarks used to compute the arrow
+            bits (bytes): results of all rule predicates, None when the skeleton is incomplete
+        """
+        landmarks = to_landmark_array(point)
+        if self.is_incomplete(landmarks):
+            return None, None, None
+        angles = self.angle_engine.compute(to_landmark_array(point2))
+        base, features = self.rule_engine.features(angles, landmarks)
+        return angles, base, self.rule_engine.predicate_bits(features)
+
+    def result_of_branch(self, branch, angles, base, landmarks, world_landmarks=None):
+        """tips, imagePath and pointsOut of a cached branch, the arrow uses the current landmarks
+
+        Args:
+            branch (int): branch from last_branch
+            angles (numpy array): angles from rule_state
+            base (numpy array): base from rule_state
+            landmarks: landmarks of the current frame
+            world_landmarks: world landmarks of the current frame, the motion gate compares the next frames
+                with this one (the gate is cleared when it is None)
+        """
+        self.last_branch = branch
+        if branch == INCOMPLETE_BRANCH:
+            self.tips, self.imagePath, self.pointsOut = INCOMPLETE_TIP, get_image_path(self.type), []
+        else:
+            self.angle_dict.update(self.angle_engine.to_dict(angles))
+            self.last_frame = (angles, to_landmark_array(landmarks))
+            self.tips, self.imagePath, self.pointsOut = self.rule_engine.result(branch, base)
+        result = [self.tips, self.imagePath, self.pointsOut]
+        # 快取的結果也交給 motion gate，之後靜止的幀不會沿用更早之前的 branch
+        if self.motion_gate is not None:
+            if world_landmarks is None:
+                self.motion_gate.reset()
+            else:
+                self.motion_gate.update((to_landmark_array(landmarks), to_landmark_array(world_landmarks)),
+                                        (result, branch))
+        self.__record("cache")
+        return result
+
+    def get_roi_status(self):
+        """roi status (joint is correct or not) of the last detected frame
+
+        Returns:
+            roi (dict)
+        """
+        if self.short_circuit and self.last_frame is not None:
+            self.rule_engine.evaluate(*self.last_frame, roi=self.roi)
+        return self.roi
+
 
 if __name__ == "__main__":
     landmark  = [[-0.04195899, -0.45470068, -0.49800783], [-0.03318192, -0.49662837, -0.4922224], [-0.032739207, -0.4973393, -0.49164993], [-0.033388793, -0.497507, -0.49159402], [-0.06492008, -0.49036375, -0.48721924], [-0.06476935, -0.4911882, -0.4887974], [-0.06557713, -0.49282837, -0.48756254], [0.028702015, -0.51032495, -0.38913843], [-0.11468751, -0.49356246, -0.3765228], [-0.012957713, -0.44161838, -0.45839038], [-0.055624127, -0.43527463, -0.4538186], [0.11355136, -0.38072678, -0.2867345], [-0.15001108, -0.3640738, -0.2830636], [0.105660625, -0.38897547, -0.2670021], [-0.16315629, -0.30791038, -0.28597853], [0.028729225, -0.490607, -0.20702372], [-0.1065853, -0.43440008, -0.32455036], [0.012279185, -0.49882388, -0.19516961], [-0.072593324, -0.46145716, -0.32724383], [0.015803024, -0.5043777, -0.18922848], [-0.0710453, -0.4755236, -0.304786], [0.024810823, -0.4902709, -0.19758111], [-0.09388401, -0.44077945, -0.3161253], [0.11446194, 9.667E-4, -0.011351924], [-0.11425122, -0.022955116, 0.014334617], [0.08581746, -0.3953731, -0.06520676], [-0.13826358, -0.432663, -0.019005297], [0.119602785, -0.3428142, 0.25228384], [-0.0027126078, -0.38588876, 0.25816008], [0.11135201, -0.30023316, 0.30899766], [0.0032428917, -0.35206273, 0.33343795], [0.20238611, -0.6161823, 0.10663971], [0.0078034527, -0.5411762, 0.16228935]]